@@ -135,12 +135,64 @@ if len(BASE_URL) == 0:
     log_warning("BASE_URL not provided!")
     BASE_URL = ""
 
+RCLONE_CACHE_SIZE = environ.get("RCLONE_CACHE_SIZE", "")
+RCLONE_CACHE_SIZE = 32 if len(RCLONE_CACHE_SIZE) == 0 else int(RCLONE_CACHE_SIZE)
+
+RCLONE_CACHE_TTL = environ.get("RCLONE_CACHE_TTL", "")
+if len(RCLONE_CACHE_TTL) == 0:
+    RCLONE_CACHE_TTL = ""
+
+RCLONE_INDEX_INTERVAL = environ.get("RCLONE_INDEX_INTERVAL", "")
+RCLONE_INDEX_INTERVAL = 12 if len(RCLONE_INDEX_INTERVAL) == 0 else int(RCLONE_INDEX_INTERVAL)
+
+RCLONE_INDEX_DELTA = environ.get("RCLONE_INDEX_DELTA", "")
+RCLONE_INDEX_DELTA = 30 if len(RCLONE_INDEX_DELTA) == 0 else int(RCLONE_INDEX_DELTA)
+
+RCLONE_INDEX_REMOTES = environ.get("RCLONE_INDEX_REMOTES", "")
+if len(RCLONE_INDEX_REMOTES) == 0:
+    RCLONE_INDEX_REMOTES = ""
+
+RCLONE_ABOUT_INTERVAL = environ.get("RCLONE_ABOUT_INTERVAL", "")
+RCLONE_ABOUT_INTERVAL = 30 if len(RCLONE_ABOUT_INTERVAL) == 0 else int(RCLONE_ABOUT_INTERVAL)
+
+RCLONE_JOBS = environ.get("RCLONE_JOBS", "")
+RCLONE_JOBS = 4 if len(RCLONE_JOBS) == 0 else int(RCLONE_JOBS)
+
+RCLONE_USER_JOBS = environ.get("RCLONE_USER_JOBS", "")
+RCLONE_USER_JOBS = 2 if len(RCLONE_USER_JOBS) == 0 else int(RCLONE_USER_JOBS)
+
+RCLONE_SESSION_TTL = environ.get("RCLONE_SESSION_TTL", "")
+RCLONE_SESSION_TTL = 30 if len(RCLONE_SESSION_TTL) == 0 else int(RCLONE_SESSION_TTL)
+
+RCLONE_SESSION_SIZE = environ.get("RCLONE_SESSION_SIZE", "")
+RCLONE_SESSION_SIZE = 16 if len(RCLONE_SESSION_SIZE) == 0 else int(RCLONE_SESSION_SIZE)
+
+RCLONE_TRANSFERS = environ.get("RCLONE_TRANSFERS", "")
+RCLONE_TRANSFERS = 8 if len(RCLONE_TRANSFERS) == 0 else int(RCLONE_TRANSFERS)
+
+RCLONE_MULTI_THREAD_STREAMS = environ.get("RCLONE_MULTI_THREAD_STREAMS", "")
+RCLONE_MULTI_THREAD_STREAMS = (
+    4 if len(RCLONE_MULTI_THREAD_STREAMS) == 0 else int(RCLONE_MULTI_THREAD_STREAMS)
+)
+
 config_dict = {
     "AUTHORIZED_CHATS": AUTHORIZED_CHATS,
     "BOT_TOKEN": BOT_TOKEN,
     "DATABASE_URL": DATABASE_URL,
     "DOWNLOAD_DIR": DOWNLOAD_DIR,
     "OWNER_ID": OWNER_ID,
+    "RCLONE_ABOUT_INTERVAL": RCLONE_ABOUT_INTERVAL,
+    "RCLONE_CACHE_SIZE": RCLONE_CACHE_SIZE,
+    "RCLONE_CACHE_TTL": RCLONE_CACHE_TTL,
+    "RCLONE_INDEX_DELTA": RCLONE_INDEX_DELTA,
+    "RCLONE_INDEX_INTERVAL": RCLONE_INDEX_INTERVAL,
+    "RCLONE_INDEX_REMOTES": RCLONE_INDEX_REMOTES,
+    "RCLONE_JOBS": RCLONE_JOBS,
+    "RCLONE_MULTI_THREAD_STREAMS": RCLONE_MULTI_THREAD_STREAMS,
+    "RCLONE_SESSION_SIZE": RCLONE_SESSION_SIZE,
+    "RCLONE_SESSION_TTL": RCLONE_SESSION_TTL,
+    "RCLONE_TRANSFERS": RCLONE_TRANSFERS,
+    "RCLONE_USER_JOBS": RCLONE_USER_JOBS,
     "SUDO_USERS": SUDO_USERS,
     "TELEGRAM_API": TELEGRAM_API,
     "TELEGRAM_HASH": TELEGRAM_HASH,
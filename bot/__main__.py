@@ -69,7 +69,7 @@ async def restart(_, message):
     await sync_to_async(clean_all)
     await sleep(1)
     proc1 = await create_subprocess_exec(
-        "pkill", "-9", "-f", "ffmpeg"
+        "pkill", "-9", "-f", "ffmpeg|rclone rcd"
     )
     proc2 = await create_subprocess_exec("python3", "update.py")
     await gather(proc1.wait(), proc2.wait())
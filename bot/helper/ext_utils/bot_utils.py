@@ -6,13 +6,17 @@ from asyncio import (
     sleep,
 )
 from asyncio.subprocess import PIPE
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from functools import partial, wraps
+from multiprocessing import get_context
 
 from bot import user_data, config_dict, bot_loop
 from bot.helper.telegram_helper.button_build import ButtonMaker
 
 THREADPOOL = ThreadPoolExecutor(max_workers=1000)
+# spawned, a fork of the running bot would inherit its threads' held locks;
+# what runs in it lives in the workers package, which never imports bot
+PROCESSPOOL = ProcessPoolExecutor(max_workers=2, mp_context=get_context("spawn"))
 
 
 class setInterval:
@@ -95,6 +99,12 @@ async def sync_to_async(func, *args, wait=True, **kwargs):
     return await future if wait else future
 
 
+async def sync_to_process(func, *args, **kwargs):
+    """Run CPU heavy work in the process pool, func and args must be picklable"""
+    pfunc = partial(func, *args, **kwargs)
+    return await bot_loop.run_in_executor(PROCESSPOOL, pfunc)
+
+
 def async_to_sync(func, *args, wait=True, **kwargs):
     future = run_coroutine_threadsafe(func(*args, **kwargs), bot_loop)
     return future.result() if wait else future
@@ -27,7 +27,7 @@ def exit_clean_up(signal, frame):
         LOGGER.info("Please wait a while cleaning up")
         close_db()
         clean_all()
-        srun(["pkill", "-9", "-f", "ffmpeg"])
+        srun(["pkill", "-9", "-f", "ffmpeg|rclone rcd"])
         sexit(0)
     except KeyboardInterrupt:
         LOGGER.warning("Force Exiting before the cleanup finishes!")
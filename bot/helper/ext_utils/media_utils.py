@@ -87,19 +87,27 @@ async def get_media_info(path):
     return 0, None, None
 
 
-async def take_ss(video_file, ss_nb) -> bool:
+async def take_ss(video_file, ss_nb, dirpath=None) -> bool:
+    """Screenshots of ``video_file`` in ``dirpath``, by default a ``_mltbss`` folder next to it
+
+    On failure only what it made is removed: the folder when it created it,
+    else just the screenshots.
+    """
     ss_nb = min(ss_nb, 10)
     duration = (await get_media_info(video_file))[0]
     if duration != 0:
-        dirpath, name = video_file.rsplit("/", 1)
+        parent, name = video_file.rsplit("/", 1)
         name, _ = ospath.splitext(name)
-        dirpath = f"{dirpath}/{name}_mltbss/"
+        dirpath = dirpath or f"{parent}/{name}_mltbss/"
+        created = not await aiopath.exists(dirpath)
         await makedirs(dirpath, exist_ok=True)
         interval = duration // (ss_nb + 1)
         cap_time = interval
         cmds = []
+        outputs = []
         for i in range(ss_nb):
             output = f"{dirpath}SS.{name}_{i:02}.png"
+            outputs.append(output)
             cmd = [
                 "ffmpeg",
                 "-hide_banner",
@@ -117,24 +125,32 @@ async def take_ss(video_file, ss_nb) -> bool:
             ]
             cap_time += interval
             cmds.append(cmd_exec(cmd))
+
+        async def cleanup():
+            if created:
+                await rmtree(dirpath, ignore_errors=True)
+                return
+            for output in outputs:
+                if await aiopath.exists(output):
+                    await remove(output)
+
         try:
             resutls = await wait_for(gather(*cmds), timeout=60)
             if resutls[0][2] != 0:
                 LOGGER.error(
                     f"Error while creating sreenshots from video. Path: {video_file}. stderr: {resutls[0][1]}"
                 )
-                await rmtree(dirpath, ignore_errors=True)
+                await cleanup()
                 return False
         except:
             LOGGER.error(
                 f"Error while creating sreenshots from video. Path: {video_file}. Error: Timeout some issues with ffmpeg with specific arch!"
             )
-            await rmtree(dirpath, ignore_errors=True)
+            await cleanup()
             return False
         return dirpath
     else:
         LOGGER.error("take_ss: Can't get the duration of video")
-        await rmtree(dirpath, ignore_errors=True)
         return False
 
 
@@ -0,0 +1,185 @@
+from asyncio import Lock
+from datetime import datetime, timedelta, timezone
+from re import sub
+from time import time
+from traceback import format_exc as err
+
+from apscheduler.triggers.date import DateTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+
+from bot import LOGGER, bot, get_collection, scheduler
+from bot.helper.anibot.data_parser import get_airing_schedule
+from bot.helper.anibot.helper import clog
+from bot.helper.livechart.broadcast import broadcast_text
+from bot.helper.livechart.subscribers import SUBSCRIBERS
+
+DAY = 86400
+AIRED_KEEP = 7 * DAY
+
+
+def episode_key(title, episode):
+    """Title and episode reduced to a key that matches across AniList and livechart"""
+    return f"{sub(r'[^a-z0-9]', '', title.lower())}#{episode}"
+
+
+class AiredEpisodes:
+    """Episodes already announced, shared by the airing timers and the RSS check
+
+    Kept in memory by title/episode key and stored for a week so a restart does
+    not announce an episode twice.
+    """
+
+    def __init__(self, collection=None):
+        self.collection = (
+            collection if collection is not None else get_collection("AIRING_NOTIFIED")
+        )
+        self._keys = set()
+        self._loaded = False
+        self._lock = Lock()
+
+    async def load(self):
+        async with self._lock:
+            if self._loaded:
+                return
+            await self.collection.delete_many({"at": {"$lt": time() - AIRED_KEEP}})
+            async for doc in self.collection.find():
+                self._keys.update(doc["keys"])
+            self._loaded = True
+
+    def seen(self, title, episode):
+        return episode_key(title, episode) in self._keys
+
+    async def add(self, _id, titles, episodes):
+        keys = [
+            episode_key(title, episode)
+            for title in titles if title
+            for episode in episodes
+        ]
+        self._keys.update(keys)
+        await self.collection.update_one(
+            {"_id": _id}, {"$set": {"keys": keys, "at": time()}}, upsert=True
+        )
+
+
+AIRED = AiredEpisodes()
+
+
+class AiringTimers:
+    """Announce episodes the moment they air from AniList's airingSchedule
+
+    Every ``refresh`` seconds the next ``days`` of the schedule are fetched and
+    one date job is armed per show and airing time; jobs of episodes that were
+    delayed or dropped from the schedule are removed. The livechart RSS keeps
+    running as a reconciliation check for anything the timers missed.
+    """
+
+    job_id = "airing_timers"
+
+    def __init__(
+        self,
+        source,
+        days=3,
+        refresh=6 * 3600,
+        client=bot,
+        registry=SUBSCRIBERS,
+        aired=AIRED,
+    ):
+        self.source = source
+        self.days = days
+        self.refresh_interval = refresh
+        self.client = client
+        self.registry = registry
+        self.aired = aired
+        self.armed = {}
+        self.sent = 0
+        self.last_refresh = None
+        self._send_lock = Lock()
+
+    async def refresh(self):
+        await self.aired.load()
+        now = int(time())
+        try:
+            schedule = await get_airing_schedule(now, now + self.days * DAY)
+        except Exception:
+            await clog("ANIBOT", f"```{err()}```", "AIRING_SCHEDULE")
+            return
+        wanted = {}
+        for entry in schedule:
+            media = entry["media"]
+            if media.get("isAdult"):
+                continue
+            job_id = f"airing_{media['id']}_{entry['airingAt']}"
+            episode = wanted.setdefault(
+                job_id, {"media": media, "at": entry["airingAt"], "episodes": []}
+            )
+            episode["episodes"].append(entry["episode"])
+        for job_id in set(self.armed) - set(wanted):
+            if scheduler.get_job(job_id):
+                scheduler.remove_job(job_id)
+        for job_id, episode in wanted.items():
+            if job_id in self.armed and scheduler.get_job(job_id):
+                continue
+            scheduler.add_job(
+                self.fire,
+                trigger=DateTrigger(
+                    run_date=datetime.fromtimestamp(episode["at"], timezone.utc)
+                ),
+                args=[episode],
+                id=job_id,
+                name=episode["media"]["title"]["romaji"],
+                misfire_grace_time=600,
+                replace_existing=True,
+            )
+        self.armed = wanted
+        self.last_refresh = now
+        LOGGER.info(f"Airing timers: {len(wanted)} airings armed for the next {self.days} days")
+
+    async def fire(self, episode):
+        media = episode["media"]
+        titles = [media["title"]["romaji"], media["title"]["english"]]
+        episodes = sorted(episode["episodes"])
+        if any(self.aired.seen(title, episodes[-1]) for title in titles if title):
+            return
+        # mark first so an RSS cycle running meanwhile skips it
+        await self.aired.add(f"{media['id']}_{episodes[-1]}", titles, episodes)
+        title = titles[0] or titles[1]
+        if len(episodes) > 1:
+            text = f'\nEpisode {episodes[0]} - {episodes[-1]} of {title} just aired'
+        else:
+            text = f'\nEpisode {episodes[0]} of {title} just aired'
+        notification = {"text": text, "buttons": [[("More Info", media["siteUrl"])]]}
+        await self.registry.load()
+        async with self._send_lock:
+            await broadcast_text(
+                self.client, self.source, self.registry.chats(self.source.feed), notification
+            )
+        self.sent += 1
+
+    def add_job(self, delay=30):
+        scheduler.add_job(
+            self.refresh,
+            trigger=IntervalTrigger(seconds=self.refresh_interval),
+            id=self.job_id,
+            name="AniList airing schedule",
+            misfire_grace_time=60,
+            max_instances=1,
+            next_run_time=datetime.now() + timedelta(seconds=delay),
+            replace_existing=True,
+        )
+
+    def status(self):
+        upcoming = [
+            job.next_run_time
+            for job_id in self.armed
+            if (job := scheduler.get_job(job_id)) and job.next_run_time
+        ]
+        next_air = min(upcoming).strftime("%H:%M:%S") if upcoming else "-"
+        refreshed = (
+            datetime.fromtimestamp(self.last_refresh).strftime("%H:%M:%S")
+            if self.last_refresh else "-"
+        )
+        return (
+            f"<b>AniList airing timers</b>\n"
+            f"Armed: {len(upcoming)} | Next: {next_air} | Refreshed: {refreshed}\n"
+            f"Announced: {self.sent}\n"
+        )
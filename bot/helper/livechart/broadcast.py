@@ -0,0 +1,202 @@
+from asyncio import sleep
+from io import BytesIO
+from time import time
+from traceback import format_exc as err
+
+from httpx import AsyncClient
+from PIL import Image
+from pyrogram.errors import (
+    WebpageCurlFailed,
+    WebpageMediaEmpty,
+    ImageProcessFailed,
+    PhotoInvalidDimensions,
+)
+from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+
+from bot import LOGGER, bot
+from bot.helper.anibot.helper import clog
+from bot.helper.ext_utils.bot_utils import sync_to_async
+from bot.helper.livechart.pins import PinScheduler
+from bot.helper.livechart.subscribers import SUBSCRIBERS
+
+failed_pic = "https://telegra.ph/file/09733b49f3a9d5b147d21.png"
+PHOTO_ERRORS = (
+    WebpageMediaEmpty,
+    WebpageCurlFailed,
+    ImageProcessFailed,
+    PhotoInvalidDimensions,
+)
+MAX_PHOTO_SIZE = 10 * 1024 * 1024
+MAX_PHOTO_SIDE = 2560
+SEND_DELAY = 1.5
+uploaded_pics = {}  # url -> telegram file_id of pictures already uploaded once
+
+
+def _validate_photo(content):
+    """Check downloaded bytes are a picture telegram will accept, shrinking it if needed"""
+    with Image.open(BytesIO(content)) as img:
+        img.verify()
+    with Image.open(BytesIO(content)) as img:
+        width, height = img.size
+        if max(width, height) / max(min(width, height), 1) > 20:
+            return None
+        if len(content) <= MAX_PHOTO_SIZE and width + height <= 10000:
+            return content
+        img = img.convert("RGB")
+        img.thumbnail((MAX_PHOTO_SIDE, MAX_PHOTO_SIDE))
+        out = BytesIO()
+        img.save(out, "JPEG", quality=90)
+        return out.getvalue()
+
+
+async def prepare_headline_photo(url, http, pics=uploaded_pics):
+    """Fetch and validate a headline picture once before it is sent to every group
+
+    Returns a telegram file_id when the picture was uploaded before, an in-memory
+    file to upload otherwise, or the fallback picture when the link is broken.
+    ``pics`` is the url -> file_id cache, the live one unless a replay passes its own.
+    """
+    if url in pics:
+        return pics[url]
+    if len(pics) > 500:
+        pics.clear()
+    try:
+        response = await http.get(url, follow_redirects=True, timeout=30)
+        content_type = response.headers.get("content-type", "")
+        if response.status_code == 200 and content_type.startswith("image/"):
+            content = await sync_to_async(_validate_photo, response.content)
+            if content is not None:
+                photo = BytesIO(content)
+                photo.name = url.rsplit("/", 1)[-1] or "headline.jpg"
+                photo.source = url
+                return photo
+    except Exception:
+        pass
+    await clog("ANIBOT", url, "HEADLINES LINK")
+    return pics.get(failed_pic, failed_pic)
+
+
+async def send_headline_photo(client, chat_id, photo, caption, btn, pics=uploaded_pics):
+    """Send a headline picture and return the message with a file_id to reuse for other groups"""
+    if isinstance(photo, BytesIO):
+        photo.seek(0)
+    try:
+        x = await client.send_photo(
+            chat_id,
+            photo,
+            caption=caption,
+            reply_markup=btn
+        )
+    except PHOTO_ERRORS:
+        await clog("ANIBOT", str(getattr(photo, "source", photo)), "HEADLINES LINK")
+        photo = pics.get(failed_pic, failed_pic)
+        x = await client.send_photo(
+            chat_id,
+            photo,
+            caption=caption,
+            reply_markup=btn
+        )
+        if photo == failed_pic:
+            pics[failed_pic] = x.photo.file_id
+        return x, pics.get(failed_pic, failed_pic)
+    if isinstance(photo, BytesIO):
+        pics[photo.source] = x.photo.file_id
+        photo = x.photo.file_id
+    elif photo == failed_pic:
+        pics[failed_pic] = x.photo.file_id
+        photo = x.photo.file_id
+    return x, photo
+
+
+def build_buttons(rows):
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton(label, url=url) for label, url in row]
+        for row in rows
+    ])
+
+
+async def broadcast_text(client, source, chats, notification, delay=SEND_DELAY):
+    btn = build_buttons(notification["buttons"])
+    for chat_id in chats:
+        try:
+            await client.send_message(chat_id, notification["text"], reply_markup=btn)
+            await sleep(delay)
+        except Exception:
+            e = err()
+            await clog("ANIBOT", f"Group: {chat_id}\n\n```{e}```", source.tag)
+
+
+async def broadcast_photo(
+    client, http, source, groups, notification, pin_data, delay=SEND_DELAY, pics=uploaded_pics
+):
+    btn = build_buttons(notification["buttons"])
+    caption = f"{notification['text']}\n\n{source.caption_tag}"
+    photo = await prepare_headline_photo(notification["photo"], http, pics)
+    for group in groups:
+        try:
+            x, photo = await send_headline_photo(
+                client, group["_id"], photo, caption, btn, pics
+            )
+            pin_data.append({**group, "current": x.id})
+            await sleep(delay)
+        except Exception:
+            e = err()
+            await clog("ANIBOT", f"Group: {group['_id']}\n\n```{e}```", source.tag)
+
+
+async def poll_source(
+    source, client=bot, registry=SUBSCRIBERS, http=None, delay=SEND_DELAY, pics=uploaded_pics
+):
+    """Run one cycle of a feed source: fetch, parse, diff, format, broadcast
+
+    ``delay`` paces sends to one chat after another, the replay harness lowers
+    it to measure raw throughput and passes its own picture cache as ``pics``.
+    Returns how many notifications were sent out.
+    """
+    await registry.load()
+    own_http = http is None
+    if own_http:
+        http = AsyncClient(timeout=60)
+    try:
+        text = await source.fetch(http)
+        items = await source.parse(text)
+        if not items:
+            return 0
+        last = await source.checkpoints.find_one()
+        if last is None:
+            # first run, only remember where the feed is
+            await source.checkpoints.insert_one(source.seed_doc(items))
+            return 0
+        new = source.diff(items, last)
+        notifications = await source.format(new) if new else []
+        LOGGER.info(f"{source.name}: {len(notifications)} new notifications")
+        start = time()
+        if source.photo:
+            groups = registry.groups(source.feed)
+            pin_data = []
+            if groups:
+                for notification in notifications:
+                    await broadcast_photo(
+                        client, http, source, groups, notification, pin_data, delay, pics
+                    )
+            if pin_data:
+                await PinScheduler(
+                    client, registry=registry, delay=min(delay, 0.7)
+                ).run(
+                    pin_data, registry.collections[source.feed], source.feed
+                )
+        else:
+            chats = registry.chats(source.feed)
+            if chats:
+                for notification in notifications:
+                    await broadcast_text(client, source, chats, notification, delay)
+        doc = source.checkpoint_doc(items, notifications)
+        if doc is not None and doc != last:
+            await source.checkpoints.drop()
+            await source.checkpoints.insert_one(doc)
+        if notifications:
+            LOGGER.info(f"{source.name}: broadcast took {time() - start:.1f}s")
+        return len(notifications)
+    finally:
+        if own_http:
+            await http.aclose()
@@ -0,0 +1,123 @@
+from asyncio import Semaphore, gather, sleep
+from time import time
+from traceback import format_exc as err
+
+from pymongo import UpdateOne
+from pyrogram.errors import ChatAdminRequired, FloodWait
+
+from bot.helper.anibot.helper import clog
+from bot.helper.livechart.subscribers import SUBSCRIBERS
+
+admin_error_msg = "Please give bot Pin Message and Delete Message permissions to pin new headlines!!!\nOr you can disable Pin and Unpin options in /settings command to stop seeing this message"
+MAX_PIN_HISTORY = 50
+
+
+def plan_pins(group, current, now=None):
+    """Work out the final pin state of one chat after a feed cycle
+
+    ``current`` holds the ids sent this cycle, oldest first. Returns the ids to
+    pin (oldest first so the newest ends up on top), the ids to unpin and the
+    new ``last``/``next_unpin`` values. With "New Feed" (``unpin == 0``) only
+    the newest headline is pinned and without a timer nothing is unpinned,
+    both leave the stored state as it is. Timed groups keep ``last`` newest
+    first, without duplicates and capped at MAX_PIN_HISTORY; pins pushed past
+    the cap are unpinned right away instead of being forgotten.
+    """
+    now = now or time()
+    pin = group.get("pin") not in ["OFF", None]
+    unpin = group.get("unpin")
+    next_unpin = group.get("next_unpin")
+    to_pin = list(current) if pin else []
+    if not unpin:
+        if unpin == 0:
+            to_pin = to_pin[-1:]
+        return to_pin, [], group.get("last") or [], next_unpin
+    last = list(group.get("last") or [])
+    to_unpin = []
+    if next_unpin is None or now > next_unpin:
+        to_unpin = last
+        last = to_pin[::-1]
+        next_unpin = now + unpin
+    else:
+        last = to_pin[::-1] + last
+    compact = []
+    for mid in last:
+        if mid not in compact:
+            compact.append(mid)
+    to_unpin = to_unpin + compact[MAX_PIN_HISTORY:]
+    last = compact[:MAX_PIN_HISTORY]
+    both = set(to_pin) & set(to_unpin)
+    to_pin = [mid for mid in to_pin if mid not in both]
+    to_unpin = [mid for mid in dict.fromkeys(to_unpin) if mid not in both]
+    return to_pin, to_unpin, last, next_unpin
+
+
+class PinScheduler:
+    """Apply pin plans for many chats concurrently and persist them in one write
+
+    Chats are handled in parallel up to ``concurrency``; calls inside one chat
+    stay sequential with ``delay`` between them to respect per-chat limits.
+    """
+
+    def __init__(self, client, registry=SUBSCRIBERS, concurrency=5, delay=0.7):
+        self.client = client
+        self.registry = registry
+        self.delay = delay
+        self._semaphore = Semaphore(concurrency)
+
+    async def _call(self, func, *args):
+        try:
+            return await func(*args)
+        except FloodWait as f:
+            await sleep(f.value * 1.2)
+            return await func(*args)
+
+    async def _apply_chat(self, chat_id, to_pin, to_unpin):
+        async with self._semaphore:
+            try:
+                for mid in to_unpin:
+                    await self._call(self.client.unpin_chat_message, chat_id, mid)
+                    await sleep(self.delay)
+                for mid in to_pin:
+                    pin_msg = await self._call(self.client.pin_chat_message, chat_id, mid)
+                    if pin_msg:
+                        await pin_msg.delete()
+                    await sleep(self.delay)
+            except ChatAdminRequired:
+                try:
+                    await self.client.send_message(chat_id, admin_error_msg)
+                except Exception:
+                    pass
+            except Exception:
+                e = err()
+                await clog("ANIBOT", f"Group: {chat_id}\n\n```{e}```", "UN_PIN")
+
+    async def run(self, pin_data, collection, feed):
+        """Pin/unpin the messages sent to each group and store the new state
+
+        ``pin_data`` holds one ``{**group, "current": message_id}`` per sent message.
+        """
+        current = {}
+        groups = {}
+        for item in pin_data:
+            current.setdefault(item["_id"], []).append(item["current"])
+            groups[item["_id"]] = item
+        now = time()
+        calls = []
+        ops = []
+        for chat_id, ids in current.items():
+            group = groups[chat_id]
+            to_pin, to_unpin, last, next_unpin = plan_pins(group, ids, now)
+            if to_pin or to_unpin:
+                calls.append(self._apply_chat(chat_id, to_pin, to_unpin))
+            if last != (group.get("last") or []) or next_unpin != group.get("next_unpin"):
+                ops.append(
+                    UpdateOne(
+                        {"_id": chat_id},
+                        {"$set": {"last": last, "next_unpin": next_unpin}},
+                    )
+                )
+                self.registry.update(feed, chat_id, last=last, next_unpin=next_unpin)
+        await gather(*calls)
+        if ops:
+            await collection.bulk_write(ops, ordered=False)
@@ -0,0 +1,365 @@
+from asyncio import gather, sleep
+from collections import Counter
+from io import BytesIO
+from itertools import count
+from os import listdir, makedirs, path as ospath
+from random import random, uniform
+from time import time
+
+from aiofiles import open as aiopen
+from aiohttp import web
+from httpx import AsyncBaseTransport, AsyncClient, AsyncHTTPTransport, Request
+from PIL import Image
+from pyrogram.errors import FloodWait
+
+from bot import LOGGER
+from bot.helper.livechart import broadcast
+from bot.helper.livechart.airing import AiredEpisodes
+from bot.helper.livechart.sources import SOURCES
+from bot.helper.livechart.subscribers import SubscriberRegistry
+
+SNAPSHOT_DIR = "replay"
+
+
+async def record_snapshots(directory=SNAPSHOT_DIR):
+    """Save the current document of every live feed as the next snapshot
+
+    Snapshots are stored as ``<directory>/<feed>/<timestamp>.xml`` and replayed
+    in name order, so recording a few times some hours apart gives a sequence
+    with real new items between cycles.
+    """
+    saved = {}
+    stamp = int(time())
+    async with AsyncClient(timeout=60, follow_redirects=True) as http:
+        for source in SOURCES:
+            try:
+                response = await http.get(source.url)
+                response.raise_for_status()
+            except Exception as e:
+                LOGGER.error(f"Replay: could not record {source.name}: {e}")
+                continue
+            folder = ospath.join(directory, source.feed)
+            makedirs(folder, exist_ok=True)
+            async with aiopen(ospath.join(folder, f"{stamp}.xml"), "w") as f:
+                await f.write(response.text)
+            saved[source.feed] = len(listdir(folder))
+    return saved
+
+
+def _placeholder_image():
+    out = BytesIO()
+    Image.new("RGB", (640, 360), (40, 44, 52)).save(out, "PNG")
+    return out.getvalue()
+
+
+class SnapshotServer:
+    """Local stand-in for the feed sites
+
+    ``/feed/<feed>`` serves the snapshot of the current ``cycle`` (the last one
+    once the sequence runs out) and ``/image/...`` a placeholder picture for
+    headline photos.
+    """
+
+    def __init__(self, directory=SNAPSHOT_DIR, host="127.0.0.1", port=0):
+        self.directory = directory
+        self.host = host
+        self.port = port
+        self.cycle = 0
+        self.requests = Counter()
+        self._image = _placeholder_image()
+        self._runner = None
+
+    def snapshots(self, feed):
+        folder = ospath.join(self.directory, feed)
+        if not ospath.isdir(folder):
+            return []
+        return sorted(
+            ospath.join(folder, name)
+            for name in listdir(folder)
+            if name.endswith(".xml")
+        )
+
+    @property
+    def length(self):
+        return max((len(self.snapshots(source.feed)) for source in SOURCES), default=0)
+
+    def url(self, feed):
+        return f"http://{self.host}:{self.port}/feed/{feed}"
+
+    @property
+    def image_url(self):
+        return f"http://{self.host}:{self.port}/image"
+
+    async def _feed(self, request):
+        feed = request.match_info["feed"]
+        self.requests[feed] += 1
+        files = self.snapshots(feed)
+        if not files:
+            raise web.HTTPNotFound()
+        async with aiopen(files[min(self.cycle, len(files) - 1)], "rb") as f:
+            body = await f.read()
+        return web.Response(body=body, content_type="application/rss+xml")
+
+    async def _image_handler(self, request):
+        self.requests["image"] += 1
+        return web.Response(body=self._image, content_type="image/png")
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/feed/{feed}", self._feed)
+        app.router.add_get("/image{tail:.*}", self._image_handler)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+class ReplayTransport(AsyncBaseTransport):
+    """Sends requests for anything but the snapshot server to its placeholder image"""
+
+    def __init__(self, server):
+        self.server = server
+        self._transport = AsyncHTTPTransport()
+
+    async def handle_async_request(self, request):
+        if request.url.host != self.server.host:
+            request = Request("GET", self.server.image_url)
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class FakeMessage:
+    def __init__(self, id, file_id=None):
+        self.id = id
+        self.photo = FakeFile(file_id) if file_id else None
+
+    async def delete(self):
+        return True
+
+
+class FakeFile:
+    def __init__(self, file_id):
+        self.file_id = file_id
+
+
+class FakeTelegram:
+    """Records the calls the feed loops make instead of talking to telegram
+
+    Every call waits ``latency`` seconds (give or take half) and fails with
+    FloodWait at ``flood_rate``.
+    """
+
+    def __init__(self, latency=0.05, flood_rate=0.0, flood_wait=1):
+        self.latency = latency
+        self.flood_rate = flood_rate
+        self.flood_wait = flood_wait
+        self.calls = Counter()
+        self.sent = 0
+        self.floods = 0
+        self._ids = count(1)
+
+    async def _call(self, name):
+        self.calls[name] += 1
+        if self.latency:
+            await sleep(self.latency * uniform(0.5, 1.5))
+        if self.flood_rate and random() < self.flood_rate:
+            self.floods += 1
+            raise FloodWait(value=self.flood_wait)
+        return next(self._ids)
+
+    async def send_message(self, chat_id, text, **kwargs):
+        mid = await self._call("send_message")
+        self.sent += 1
+        return FakeMessage(mid)
+
+    async def send_photo(self, chat_id, photo, **kwargs):
+        mid = await self._call("send_photo")
+        self.sent += 1
+        return FakeMessage(mid, photo if isinstance(photo, str) else f"replay_{mid}")
+
+    async def pin_chat_message(self, chat_id, message_id, **kwargs):
+        return FakeMessage(await self._call("pin_chat_message"))
+
+    async def unpin_chat_message(self, chat_id, message_id=None, **kwargs):
+        await self._call("unpin_chat_message")
+        return True
+
+
+class CountingCollection:
+    """In-memory stand-in for a mongo collection, counting every round trip"""
+
+    def __init__(self, docs=()):
+        self.docs = {doc["_id"]: dict(doc) for doc in docs}
+        self.ops = Counter()
+
+    def _match(self, filter):
+        return [
+            doc for doc in self.docs.values()
+            if all(doc.get(key) == value for key, value in (filter or {}).items())
+        ]
+
+    async def _iter(self, docs):
+        for doc in docs:
+            yield dict(doc)
+
+    def find(self, filter=None, *args, **kwargs):
+        self.ops["find"] += 1
+        return self._iter(self._match(filter))
+
+    async def find_one(self, filter=None, *args, **kwargs):
+        self.ops["find_one"] += 1
+        docs = self._match(filter)
+        return dict(docs[0]) if docs else None
+
+    async def insert_one(self, doc):
+        self.ops["insert_one"] += 1
+        self.docs[doc["_id"]] = dict(doc)
+
+    async def update_one(self, filter, update, upsert=False):
+        self.ops["update_one"] += 1
+        doc = self.docs.get(filter["_id"])
+        if doc is None and upsert:
+            doc = self.docs[filter["_id"]] = {"_id": filter["_id"]}
+        if doc is not None:
+            doc.update(update.get("$set", {}))
+
+    async def delete_many(self, filter):
+        self.ops["delete_many"] += 1
+
+    async def drop(self):
+        self.ops["drop"] += 1
+        self.docs.clear()
+
+    async def bulk_write(self, requests, ordered=True):
+        self.ops["bulk_write"] += 1
+        for request in requests:
+            self.ops["bulk_updates"] += 1
+            doc = self.docs.get(request._filter["_id"])
+            if doc is not None:
+                doc.update(request._doc.get("$set", {}))
+
+    @property
+    def round_trips(self):
+        return sum(n for op, n in self.ops.items() if op != "bulk_updates")
+
+
+def fake_groups(number, photo=False):
+    """Subscribed groups with a spread of pin settings for the photo feeds"""
+    groups = []
+    for i in range(number):
+        group = {"_id": -1001000000000 - i}
+        if photo:
+            group.update(
+                pin="ON" if i % 2 == 0 else "OFF",
+                unpin=(None, 0, 86400)[i % 3],
+                next_unpin=None,
+                last=[],
+            )
+        groups.append(group)
+    return groups
+
+
+async def run_benchmark(
+    groups=50,
+    cycles=None,
+    latency=0.05,
+    flood_rate=0.0,
+    delay=0.0,
+    directory=SNAPSHOT_DIR,
+):
+    """Replay the recorded snapshots through poll_source against fake sinks
+
+    The first cycle only seeds the checkpoints, like the first run of the bot.
+    Returns one dict per cycle with its wall time, sends and database round trips.
+    """
+    server = SnapshotServer(directory)
+    if not server.length:
+        raise FileNotFoundError(f"No snapshots recorded in {directory}")
+    await server.start()
+    client = FakeTelegram(latency, flood_rate)
+    sources = [
+        source(url=server.url(source.feed), checkpoints=CountingCollection())
+        for source in SOURCES
+        if server.snapshots(source.feed)
+    ]
+    registry = SubscriberRegistry({
+        source.feed: CountingCollection(fake_groups(groups, source.photo))
+        for source in sources
+    })
+    collections = [source.checkpoints for source in sources]
+    for source in sources:
+        if hasattr(source, "aired"):
+            source.aired = AiredEpisodes(CountingCollection())
+            collections.append(source.aired.collection)
+    collections += list(registry.collections.values())
+    # fake file_ids stay in a cache of this run, the live one is not touched
+    pics = {}
+    http = AsyncClient(timeout=60, transport=ReplayTransport(server))
+    results = []
+    try:
+        for cycle in range(cycles or server.length):
+            server.cycle = cycle
+            sent = client.sent
+            calls = sum(client.calls.values())
+            floods = client.floods
+            trips = sum(c.round_trips for c in collections)
+            start = time()
+            counts = await gather(
+                *(
+                    broadcast.poll_source(
+                        source, client=client, registry=registry, http=http, delay=delay, pics=pics
+                    )
+                    for source in sources
+                ),
+                return_exceptions=True,
+            )
+            elapsed = time() - start
+            errors = [c for c in counts if isinstance(c, Exception)]
+            for e in errors:
+                LOGGER.error(f"Replay cycle {cycle}: {e!r}")
+            results.append({
+                "cycle": cycle,
+                "time": elapsed,
+                "notifications": sum(c for c in counts if isinstance(c, int)),
+                "sends": client.sent - sent,
+                "calls": sum(client.calls.values()) - calls,
+                "floods": client.floods - floods,
+                "db_ops": sum(c.round_trips for c in collections) - trips,
+                "errors": len(errors),
+            })
+    finally:
+        await http.aclose()
+        await server.stop()
+    return results
+
+
+def benchmark_report(results, groups):
+    msg = f"<b>Feed replay: {groups} groups per feed</b>\n\n"
+    for r in results:
+        rate = r["sends"] / r["time"] if r["time"] else 0
+        msg += (
+            f"<b>Cycle {r['cycle']}:</b> {r['time']:.2f}s, {r['notifications']} new, "
+            f"{r['sends']} sends ({rate:.1f}/s), {r['calls']} calls, "
+            f"{r['floods']} FloodWait, {r['db_ops']} DB ops"
+        )
+        if r["errors"]:
+            msg += f", {r['errors']} failed"
+        msg += "\n"
+    busy = [r for r in results[1:] if r["sends"]]
+    if busy:
+        total = sum(r["time"] for r in busy)
+        sends = sum(r["sends"] for r in busy)
+        msg += (
+            f"\n<b>Average:</b> {total / len(busy):.2f}s per cycle, "
+            f"{sends / total if total else 0:.1f} sends/s, "
+            f"{sum(r['db_ops'] for r in busy) / len(busy):.1f} DB ops per cycle"
+        )
+    return msg
@@ -0,0 +1,141 @@
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from time import monotonic, time
+from traceback import format_exc as err
+
+from apscheduler.triggers.interval import IntervalTrigger
+
+from bot import LOGGER, scheduler
+from bot.helper.anibot.helper import clog
+
+DAY = 86400
+
+
+class FeedPoller:
+    """Poll one feed as its own scheduler job with an adaptive interval
+
+    ``poll`` is a coroutine returning how many new items it found. The interval
+    drops to ``min_interval`` when something was published or when the current
+    UTC hour is one where the feed usually publishes, and backs off towards
+    ``max_interval`` while the feed is quiet. The number of polls in the last
+    day never exceeds what a fixed ``base_interval`` would have done.
+    """
+
+    def __init__(
+        self,
+        name,
+        poll,
+        base_interval=300,
+        min_interval=120,
+        max_interval=1200,
+        hot_hours=(),
+        backoff=1.5,
+    ):
+        self.name = name
+        self.poll = poll
+        self.job_id = f"livechart_{name}"
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = base_interval
+        self.hot_hours = set(hot_hours)
+        self.release_hours = [0.0] * 24
+        self.recent_polls = deque()
+        self.stats = {
+            "runs": 0,
+            "errors": 0,
+            "overruns": 0,
+            "new_items": 0,
+            "last_new": 0,
+            "last_duration": 0.0,
+            "max_duration": 0.0,
+            "total_duration": 0.0,
+            "last_run": None,
+        }
+
+    def is_hot_hour(self, hour):
+        if hour in self.hot_hours:
+            return True
+        total = sum(self.release_hours)
+        if total < 10:
+            return False
+        return self.release_hours[hour] >= 1.5 * total / 24
+
+    def record_releases(self, count, hour):
+        # decay old observations so the histogram follows season changes
+        self.release_hours = [value * 0.995 for value in self.release_hours]
+        self.release_hours[hour] += count
+
+    def next_interval(self, new_items, now=None):
+        now = now or time()
+        hour = datetime.fromtimestamp(now, timezone.utc).hour
+        if new_items:
+            self.record_releases(new_items, hour)
+            interval = self.min_interval
+        elif self.is_hot_hour(hour) or self.is_hot_hour((hour + 1) % 24):
+            interval = self.min_interval
+        else:
+            interval = min(self.interval * self.backoff, self.max_interval)
+        while self.recent_polls and now - self.recent_polls[0] > DAY:
+            self.recent_polls.popleft()
+        if len(self.recent_polls) >= DAY / self.base_interval:
+            interval = max(interval, self.base_interval)
+        return int(interval)
+
+    async def run(self):
+        start = monotonic()
+        new_items = 0
+        try:
+            new_items = await self.poll() or 0
+        except Exception:
+            self.stats["errors"] += 1
+            await clog("ANIBOT", "```" + err() + "```", "RSS")
+        duration = monotonic() - start
+        now = time()
+        self.recent_polls.append(now)
+        stats = self.stats
+        stats["runs"] += 1
+        stats["new_items"] += new_items
+        stats["last_new"] = new_items
+        stats["last_duration"] = duration
+        stats["max_duration"] = max(stats["max_duration"], duration)
+        stats["total_duration"] += duration
+        stats["last_run"] = now
+        if duration > self.interval:
+            stats["overruns"] += 1
+            LOGGER.warning(
+                f"Feed {self.name} took {duration:.1f}s, longer than its {self.interval}s interval"
+            )
+        interval = self.next_interval(new_items, now)
+        if interval != self.interval:
+            self.interval = interval
+            scheduler.reschedule_job(
+                self.job_id, trigger=IntervalTrigger(seconds=interval)
+            )
+
+    def add_job(self, delay=20):
+        scheduler.add_job(
+            self.run,
+            trigger=IntervalTrigger(seconds=self.interval),
+            id=self.job_id,
+            name=self.name,
+            misfire_grace_time=15,
+            max_instances=1,
+            next_run_time=datetime.now() + timedelta(seconds=delay),
+            replace_existing=True,
+        )
+
+    def status(self):
+        stats = self.stats
+        runs = stats["runs"] or 1
+        job = scheduler.get_job(self.job_id)
+        next_run = job.next_run_time.strftime("%H:%M:%S") if job and job.next_run_time else "-"
+        return (
+            f"<b>{self.name}</b>\n"
+            f"Interval: {self.interval}s | Next: {next_run}\n"
+            f"Runs: {stats['runs']} | Errors: {stats['errors']} | Overruns: {stats['overruns']}\n"
+            f"Duration: last {stats['last_duration']:.1f}s, "
+            f"avg {stats['total_duration'] / runs:.1f}s, max {stats['max_duration']:.1f}s\n"
+            f"New items: last {stats['last_new']}, total {stats['new_items']}\n"
+        )
@@ -0,0 +1,337 @@
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from re import sub
+
+from bot import get_collection
+from bot.helper.anibot.helper import clog
+from bot.helper.ext_utils.bot_utils import sync_to_process
+from bot.helper.livechart.airing import AIRED
+from workers.feeds import parse_feed
+
+# Releases mostly land after the late night JST broadcasts, 14:00-20:00 UTC
+RELEASE_HOURS = range(14, 20)
+
+
+def unwrap(tag):
+    """Text content of a raw ``<tag>text</tag>`` string"""
+    if tag is None:
+        return None
+    return sub(r'<.*?>(.*)<.*?>', r'\1', tag)
+
+
+class FeedSource(ABC):
+    """One feed, processed in four stages: fetch, parse, diff and format
+
+    A new source is a subclass setting the class attributes below and
+    implementing ``format``, listed in SOURCES; ``diff`` and ``checkpoint_doc`` only need to be
+    overridden when the feed does not fit the title/guid checkpoint.
+
+    ``format`` returns notifications as dicts with ``text``, ``buttons`` (rows
+    of ``(label, url)``) and, for photo sources, ``photo``.
+    """
+
+    name = ""
+    url = ""
+    feed = ""  # subscriber registry key, see subscribers.FEED_GROUPS
+    groups = ""  # collection of subscribed groups, only for feeds not in FEED_GROUPS
+    checkpoint = ""  # collection holding the newest item already sent
+    tag = "RSS"
+    caption_tag = ""
+    fields = {"title": "title", "guid": "guid", "link": "link"}
+    attrs = {}
+    use_guid = True
+    photo = False
+    poller = {}  # FeedPoller keyword arguments
+
+    def __init__(self, url=None, checkpoints=None):
+        if url is not None:
+            self.url = url
+        self.checkpoints = (
+            checkpoints if checkpoints is not None else get_collection(self.checkpoint)
+        )
+
+    async def fetch(self, client):
+        response = await client.get(self.url)
+        return response.text
+
+    async def parse(self, text):
+        return await sync_to_process(parse_feed, text, self.fields, self.attrs)
+
+    def keep(self, item):
+        return True
+
+    def diff(self, items, last):
+        """Items newer than the stored checkpoint, newest first"""
+        new = []
+        for item in items:
+            if last['_id'] == item['title']:
+                break
+            updated = self.use_guid and last.get('guid') == item['guid']
+            if self.keep(item):
+                new.append({**item, "updated": updated})
+            if updated:
+                break
+        return new
+
+    @abstractmethod
+    async def format(self, items):
+        """Notifications for the new ``items``, newest first"""
+
+    def seed_doc(self, items):
+        """Checkpoint for the newest item of the feed"""
+        doc = {'_id': items[0]['title']}
+        if self.use_guid:
+            doc['guid'] = items[0]['guid']
+        return doc
+
+    def checkpoint_doc(self, items, notifications):
+        """Document to store as the new checkpoint, None to keep the old one"""
+        if not items or not notifications:
+            return None
+        return self.seed_doc(items)
+
+    async def missed(self, text, item):
+        await clog(
+            "ANIBOT",
+            f"<b>{text}\nCheck out code</b>",
+            "MISSED_UPDATE",
+            send_as_file=str(item.get("raw", item))
+        )
+
+
+class LiveChartAiring(FeedSource):
+    name = "LiveChart.me airing"
+    url = "https://www.livechart.me/feeds/episodes"
+    feed = "airing"
+    checkpoint = "AIRING_TITLE"
+    tag = "AIRING"
+    # announcements come from the AniList airing timers, the feed only
+    # reconciles what they missed
+    poller = {
+        "hot_hours": RELEASE_HOURS,
+        "base_interval": 600,
+        "min_interval": 300,
+        "max_interval": 1800,
+    }
+    aired = AIRED
+
+    async def format(self, items):
+        notifications = []
+        clc = defaultdict(list)
+        await self.aired.load()
+        missed = []
+        for item in items:
+            title = unwrap(item['title']).split(' #')
+            guid = unwrap(item['guid'])
+            if len(title) == 2:
+                if self.aired.seen(*title):
+                    continue
+                clc[title[0]].append([title[1], guid])
+                missed.append(title)
+            else:
+                notifications.append(self.notification(f'{title[0]} just aired', guid))
+        for name, episode in missed:
+            await self.aired.add(f"rss_{name}_{episode}", [name], [episode])
+        if missed:
+            await clog(
+                "ANIBOT",
+                "\n".join(f"{name} #{episode}" for name, episode in missed),
+                "AIRING_RECONCILE"
+            )
+        for i in list(clc.keys()):
+            if len(clc[i]) > 1:
+                aep = [clc[i][len(clc[i]) - 1][0], clc[i][0][0]]
+                text = f'\nEpisode {min(aep)} - {max(aep)} of {i} just aired'
+            else:
+                text = f'\nEpisode {clc[i][0][0]} of {i} just aired'
+            notifications.append(self.notification(text, clc[i][0][1]))
+        return notifications
+
+    def checkpoint_doc(self, items, notifications):
+        # the timers announce most episodes before the feed lists them, items
+        # skipped as already aired still move the checkpoint
+        if not items:
+            return None
+        return self.seed_doc(items)
+
+    @staticmethod
+    def notification(text, url):
+        return {"text": text, "buttons": [[("More Info", url)]]}
+
+
+class Crunchyroll(FeedSource):
+    name = "Crunchyroll"
+    url = 'https://feeds.feedburner.com/crunchyroll/rss/anime?format=xml'
+    feed = "crunchyroll"
+    checkpoint = "CRUNCHY_TITLE"
+    tag = "CRUNCHYROLL"
+    poller = {"hot_hours": RELEASE_HOURS}
+
+    def keep(self, item):
+        return "Dub" not in item['title']
+
+    async def format(self, items):
+        notifications = []
+        clc = defaultdict(list)
+        fk = []
+        for item in items:
+            title = unwrap(item['title']).split(' - ')
+            guid = unwrap(item['guid'])
+            if len(title) == 3:
+                clc[title[0]].append([title[1], title[2], guid])
+            elif len(title) == 2:
+                if 'Episode' in title[1]:
+                    clc[title[0]].append([title[1], guid])
+                else:
+                    notifications.append({
+                        "text": f"""**New anime released on Crunchyroll**
+**Title:** {title[0]}""",
+                        "buttons": [[("More Info", guid)]],
+                    })
+            else:
+                fk.append(item)
+        for i in list(clc.keys()):
+            hmm = []
+            for ii in clc[i]:
+                try:
+                    hmm.append(int((ii[0].split())[1]))
+                except (ValueError, IndexError):
+                    fk.append({"raw": clc[i]})
+            try:
+                aep = [min(hmm), max(hmm)]
+                epnum = f"{aep[0]} - {aep[1]}" if aep[1] != aep[0] else aep[0]
+                notifications.append({
+                    "text": f"""**New anime released on Crunchyroll**
+
+**Title:** {i}
+**Episode:** {epnum}
+{'**EP Title:** '+ii[1] if len(ii)==3 else ''}""",
+                    "buttons": [[("More Info", ii[1] if len(ii) != 3 else ii[2])]],
+                })
+            except Exception:
+                fk.append({"raw": i})
+        for item in fk:
+            await self.missed("Missed crunchyroll update", item)
+        return notifications
+
+
+class SubsPlease(FeedSource):
+    name = "SubsPlease"
+    url = 'https://subsplease.org/rss/?t'
+    feed = "subsplease"
+    checkpoint = "SUBSPLEASE_TITLE"
+    tag = "SUBSPLEASE"
+    use_guid = False
+    poller = {"min_interval": 90, "hot_hours": RELEASE_HOURS}
+
+    def diff(self, items, last):
+        new = []
+        for item in items:
+            if last['_id'] in item['title']:
+                break
+            new.append(item)
+        return new
+
+    async def format(self, items):
+        notifications = []
+        ls = defaultdict(list)
+        for item in items:
+            text = sub(
+                r'.*\[.+?\] (.+) (\(.+p\)) \[.+?\].*',
+                r'\1__________\2',
+                item['title']
+            )
+            link = sub(r'.*<.+?>(.+)<.+?>.*', r'\1', str(item['link']))
+            hmm = text.split('__________')
+            if len(hmm) != 2:
+                continue
+            ls[hmm[0]].append([hmm[1].replace(')', '').replace('(', ''), link])
+        for i in ls.keys():
+            if len(ls[i]) == 3:
+                listlinks = ""
+                for ii in ls[i]:
+                    listlinks += '\n__' + ii[0] + '__: [Link](' + ii[1] + ')'
+                notifications.append({
+                    "text": '**New anime uploaded on Subsplease**\n\n' + i + listlinks,
+                    "buttons": [[(
+                        "Download",
+                        'https://nyaa.si/?q='
+                        + sub(r' ', '%20', sub(r'(\().*?(\))', r'', i).strip())
+                    )]],
+                    "key": i,
+                })
+        return notifications
+
+    def checkpoint_doc(self, items, notifications):
+        # a show is only announced once all three resolutions are out
+        if not notifications:
+            return None
+        return {'_id': notifications[0]['key']}
+
+
+class LiveChartHeadlines(FeedSource):
+    name = "LiveChart.me headlines"
+    url = 'https://www.livechart.me/feeds/headlines'
+    feed = "headlines"
+    checkpoint = "HEADLINES_TITLE"
+    tag = "HEADLINES"
+    caption_tag = "#LiveChart"
+    attrs = {"enclosure": ("enclosure", "url")}
+    photo = True
+    poller = {"max_interval": 1800}
+
+    async def format(self, items):
+        notifications = []
+        for item in items:
+            if None in [item['title'], item['guid'], item['link'], item['enclosure']]:
+                await self.missed("Missed headline", item)
+                continue
+            update = "**[UPDATED]** " if item['updated'] else ""
+            notifications.append({
+                "text": update + unwrap(item['title']),
+                "photo": str(item['enclosure']).split('?')[0],
+                "buttons": [[
+                    ("More Info", unwrap(item['guid'])),
+                    ("Source", unwrap(item['link'])),
+                ]],
+            })
+        return notifications
+
+
+class MyAnimeListHeadlines(FeedSource):
+    name = "MyAnimeList headlines"
+    url = 'https://myanimelist.net/rss/news.xml'
+    feed = "mal_headlines"
+    checkpoint = "MAL_HEADLINES_TITLE"
+    tag = "HEADLINES"
+    caption_tag = "#MyAnimeList"
+    fields = {
+        "title": "title",
+        "guid": "guid",
+        "description": "description",
+        "thumbnail": "media:thumbnail",
+    }
+    photo = True
+    poller = {"max_interval": 1800}
+
+    async def format(self, items):
+        notifications = []
+        for item in items:
+            if None in [item['title'], item['guid'], item['description'], item['thumbnail']]:
+                await self.missed("Missed MAL headline", item)
+                continue
+            notifications.append({
+                "text": f"**{unwrap(item['title'])}**\n\n{unwrap(item['description'])}",
+                "photo": unwrap(item['thumbnail']),
+                "buttons": [[("More Info", unwrap(item['guid']))]],
+            })
+        return notifications
+
+
+SOURCES = [
+    LiveChartAiring,
+    Crunchyroll,
+    SubsPlease,
+    LiveChartHeadlines,
+    MyAnimeListHeadlines,
+]
@@ -0,0 +1,121 @@
+from asyncio import Lock
+
+from bot import LOGGER, get_collection
+
+FEED_GROUPS = {
+    "airing": "AIRING_GROUPS",
+    "crunchyroll": "CRUNCHY_GROUPS",
+    "subsplease": "SUBSPLEASE_GROUPS",
+    "headlines": "HEADLINES_GROUPS",
+    "mal_headlines": "MAL_HEADLINES_GROUPS",
+}
+PIN_KEYS = ("pin", "unpin", "next_unpin", "last")
+
+
+class SubscriberRegistry:
+    """In-memory copy of the feed group collections
+
+    Loaded once from the database and kept current by the settings callbacks,
+    which write to the database first and then call subscribe/unsubscribe/update.
+    The broadcast loops only read plain lists from here.
+    """
+
+    def __init__(self, collections=None):
+        if collections is None:
+            collections = {
+                feed: get_collection(name) for feed, name in FEED_GROUPS.items()
+            }
+        self.collections = collections
+        self._groups = {feed: {} for feed in collections}
+        self._pending = []
+        self._loading = False
+        self._loaded = False
+        self._lock = Lock()
+
+    def register(self, feed, collection):
+        """Add a feed whose groups live in ``collection``, loaded on the next load()"""
+        if feed in self.collections:
+            return
+        self.collections[feed] = collection
+        self._groups[feed] = {}
+        self._loaded = False
+
+    @property
+    def loaded(self):
+        return self._loaded
+
+    async def load(self, force=False):
+        async with self._lock:
+            if self._loaded and not force:
+                return
+            self._loading = True
+            try:
+                groups = {}
+                for feed, collection in self.collections.items():
+                    groups[feed] = {}
+                    async for doc in collection.find():
+                        groups[feed][doc["_id"]] = self._settings(doc)
+                self._groups = groups
+                self._loaded = True
+            finally:
+                self._loading = False
+            pending, self._pending = self._pending, []
+            for func, args, kwargs in pending:
+                func(*args, **kwargs)
+            LOGGER.info(
+                "Feed subscribers loaded: "
+                + ", ".join(f"{feed}={len(chats)}" for feed, chats in self._groups.items())
+            )
+
+    @staticmethod
+    def _settings(doc):
+        settings = {key: doc.get(key) for key in PIN_KEYS}
+        settings["last"] = list(settings["last"] or [])
+        return settings
+
+    def _defer(self, func, *args, **kwargs):
+        if self._loading:
+            self._pending.append((func, args, kwargs))
+            return True
+        return False
+
+    def chats(self, feed):
+        """Chat ids subscribed to a feed"""
+        return list(self._groups[feed])
+
+    def groups(self, feed):
+        """Copies of the subscribed groups of a feed with their pin settings"""
+        return [
+            {"_id": chat_id, **settings, "last": list(settings["last"])}
+            for chat_id, settings in self._groups[feed].items()
+        ]
+
+    def get(self, feed, chat_id):
+        return self._groups[feed].get(chat_id)
+
+    def subscribe(self, feed, chat_id, **settings):
+        if self._defer(self.subscribe, feed, chat_id, **settings):
+            return
+        self._groups[feed][chat_id] = self._settings(settings)
+
+    def unsubscribe(self, feed, chat_id):
+        if self._defer(self.unsubscribe, feed, chat_id):
+            return
+        self._groups[feed].pop(chat_id, None)
+
+    def update(self, feed, chat_id, **settings):
+        if self._defer(self.update, feed, chat_id, **settings):
+            return
+        group = self._groups[feed].get(chat_id)
+        if group is None:
+            return
+        for key, value in settings.items():
+            group[key] = list(value or []) if key == "last" else value
+
+    def remove_chat(self, chat_id):
+        """Drop a chat from every feed, used when the bot is no longer in it"""
+        for feed in self._groups:
+            self.unsubscribe(feed, chat_id)
+
+
+SUBSCRIBERS = SubscriberRegistry()
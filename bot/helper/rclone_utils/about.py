@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+from time import time
+
+from apscheduler.triggers.interval import IntervalTrigger
+
+from bot import LOGGER, config_dict, scheduler
+from bot.helper.rclone_utils.config import RCLONE_CONF
+from bot.helper.rclone_utils.rc import rclone_config, rclone_op
+
+NO_QUOTA = "This remote does not report its storage quota"
+
+
+class QuotaCache:
+    """``rclone about`` of every remote, refreshed in the background
+
+    The storage menu answers from here straight away and says how old the
+    numbers are; a refresh asks the remote again. Remotes without quota
+    support are remembered as such until the next scheduled refresh.
+    """
+
+    def __init__(self, config=rclone_config):
+        self.config = config
+        self.quotas = {}
+
+    def get(self, remote):
+        """``(info, error, fetched)`` of the last about call, or None"""
+        return self.quotas.get(remote)
+
+    async def fetch(self, remote):
+        conf = RCLONE_CONF.get(remote)
+        if conf is not None and conf.about is False:
+            self.quotas[remote] = None, NO_QUOTA, time()
+            return self.quotas[remote]
+        cmd = ["rclone", "about", "--json", f"--config={self.config}", f"{remote}:"]
+        info, err = await rclone_op("operations/about", cmd, timeout=30, fs=f"{remote}:")
+        self.quotas[remote] = info, err, time()
+        return self.quotas[remote]
+
+    async def refresh_all(self):
+        for remote in RCLONE_CONF.remotes():
+            try:
+                _, err, _ = await self.fetch(remote)
+                if err is not None and err != NO_QUOTA:
+                    LOGGER.warning(f"about {remote}: {err}")
+            except Exception as e:
+                LOGGER.error(f"Quota refresh of {remote} failed: {e}")
+
+    def add_job(self):
+        minutes = config_dict["RCLONE_ABOUT_INTERVAL"]
+        if not minutes:
+            return
+        scheduler.add_job(
+            self.refresh_all,
+            trigger=IntervalTrigger(minutes=minutes),
+            id="rclone_about",
+            name="rclone quotas",
+            misfire_grace_time=60,
+            max_instances=1,
+            next_run_time=datetime.now() + timedelta(seconds=30),
+            replace_existing=True,
+        )
+
+
+def as_of(timestamp):
+    """``"as of 12 Jan 14:05, 12m ago"`` for a unix timestamp"""
+    ago = int(time() - timestamp) // 60
+    when = datetime.fromtimestamp(timestamp).strftime("%d %b %H:%M")
+    return f"as of {when}, {ago}m ago" if ago else f"as of {when}, just now"
+
+
+QUOTAS = QuotaCache()
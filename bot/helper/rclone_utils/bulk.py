@@ -0,0 +1,83 @@
+from os import path as ospath, remove
+from secrets import token_hex
+
+from aiofiles import open as aiopen
+from aiofiles.os import makedirs
+
+from bot import LOGGER
+from bot.helper.rclone_utils.progress import rclone_progress_op
+from bot.helper.rclone_utils.rc import rclone_config, rclone_op
+from bot.helper.rclone_utils.transfers import transfer_options
+
+FILTER_DIR = "rclone_data/filters"
+GLOB_SPECIAL = set("\\*?[]{}")
+# rc method and rclone command of each bulk action
+BULK_ACTIONS = {
+    "delete": ("operations/delete", "delete"),
+    "move": ("sync/move", "move"),
+    "copy": ("sync/copy", "copy"),
+}
+
+
+def escape_glob(name):
+    return "".join(f"\\{c}" if c in GLOB_SPECIAL else c for c in name)
+
+
+def selection_rules(selection):
+    """rclone filter rules matching exactly the ``(name, is_dir)`` entries of a folder"""
+    rules = [
+        f"+ /{escape_glob(name)}/**" if is_dir else f"+ /{escape_glob(name)}"
+        for name, is_dir in selection
+    ]
+    rules.append("- **")
+    return rules
+
+
+async def bulk_op(action, remote, base_dir, selection, on_progress=None, dest=None):
+    """Delete, move or copy the selected entries of ``remote:base_dir`` in one job
+
+    The selection becomes a filter on the folder, so rclone walks it once
+    instead of the bot calling it per entry. ``dest`` is the ``remote:path``
+    of a move or copy. Returns an error message or None.
+    """
+    method, command = BULK_ACTIONS[action]
+    rules = selection_rules(selection)
+    fs = f"{remote}:{base_dir}"
+    await makedirs(FILTER_DIR, exist_ok=True)
+    filter_file = ospath.join(FILTER_DIR, f"{token_hex(8)}.txt")
+    async with aiopen(filter_file, "w") as f:
+        await f.write("\n".join(rules) + "\n")
+    try:
+        cmd = ["rclone", command, f"--config={rclone_config}", f"--filter-from={filter_file}", fs]
+        if action == "delete":
+            params = {"fs": fs}
+        else:
+            flags, config = transfer_options(fs, dest)
+            cmd += [dest, "--create-empty-src-dirs", *flags]
+            params = {"srcFs": fs, "dstFs": dest, "createEmptySrcDirs": True, "_config": config}
+        _, err = await rclone_progress_op(
+            method, cmd, on_progress, _filter={"FilterRule": rules}, **params
+        )
+    finally:
+        try:
+            remove(filter_file)
+        except OSError:
+            pass
+    if err is not None or action == "copy":
+        return err
+    # delete and move leave the selected folders behind, empty
+    for name, is_dir in selection:
+        if not is_dir:
+            continue
+        path = f"{base_dir.strip('/')}/{name}".strip("/")
+        _, rmerr = await rclone_op(
+            "operations/rmdirs",
+            ["rclone", "rmdirs", f"--config={rclone_config}", f"{remote}:{path}"],
+            timeout=120,
+            fs=f"{remote}:",
+            remote=path,
+            leaveRoot=False,
+        )
+        if rmerr is not None:
+            LOGGER.warning(f"rmdirs {remote}:{path}: {rmerr}")
+    return None
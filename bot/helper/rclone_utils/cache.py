@@ -0,0 +1,133 @@
+from collections import OrderedDict
+from time import time
+
+from bot import config_dict
+
+DEFAULT_TTL = 60
+# remote types whose listings only change through the bot or change slowly
+TYPE_TTL = {"local": 5, "alias": 5}
+
+
+def parse_ttl(value):
+    """``"drive:120 onedrive:90 default:30"`` into a TTL per remote type"""
+    ttl = dict(TYPE_TTL)
+    for item in value.split():
+        rtype, _, seconds = item.partition(":")
+        if seconds.isdigit():
+            ttl[rtype] = int(seconds)
+    return ttl
+
+
+def split_fs(fs, path=""):
+    """``remote:sub/dir`` and a path inside it into ``(remote, full path)``"""
+    remote, _, base = fs.partition(":")
+    return remote, "/".join(p for p in (base.strip("/"), path.strip("/")) if p)
+
+
+def listing_size(result):
+    """Rough memory cost of a listing, enough to enforce the cap"""
+    if hasattr(result, "nbytes"):
+        return result.nbytes
+    return 200 + sum(
+        150 + len(item.get("Path", "")) + len(item.get("Name", ""))
+        for item in result.get("list", ())
+    )
+
+
+class ListingCache:
+    """LRU cache of folder listings with a memory cap and TTL per remote type
+
+    Keys are ``(remote, path, variant)``. Writes through the bot invalidate the
+    written path together with its parents and everything below it, so a
+    listing is never served stale after mkdir, rename, delete or dedupe.
+    Loads take a ``version`` of their remote first and pass it to put(), which
+    drops listings that a write may have overtaken while they loaded.
+    """
+
+    def __init__(self, max_bytes=None, ttl=None, config=None):
+        self.max_bytes = max_bytes or config_dict["RCLONE_CACHE_SIZE"] * 1024 * 1024
+        self.ttl = ttl if ttl is not None else parse_ttl(config_dict["RCLONE_CACHE_TTL"])
+        self.config = config
+        self.entries = OrderedDict()
+        self.size = 0
+        self.versions = {}  # writes seen per remote
+        self.hits = self.misses = self.evictions = self.expired = self.invalidations = 0
+        self.stale = 0
+
+    def ttl_for(self, remote):
+        rtype = self.config.type(remote) if self.config else None
+        return self.ttl.get(rtype, self.ttl.get("default", DEFAULT_TTL))
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires, size, value = entry
+        if time() > expires:
+            self._drop(key)
+            self.expired += 1
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def version(self, remote):
+        """Token to take before loading a listing of ``remote``, for put()"""
+        return self.versions.get(remote, 0)
+
+    def put(self, key, value, version=None):
+        if version is not None and version != self.version(key[0]):
+            self.stale += 1
+            return
+        size = listing_size(value)
+        if size > self.max_bytes:
+            return
+        if key in self.entries:
+            self._drop(key)
+        self.entries[key] = (time() + self.ttl_for(key[0]), size, value)
+        self.size += size
+        while self.size > self.max_bytes:
+            self._drop(next(iter(self.entries)))
+            self.evictions += 1
+
+    def _drop(self, key):
+        _, size, _ = self.entries.pop(key)
+        self.size -= size
+
+    def invalidate(self, remote, path=""):
+        """Forget listings of ``path``, of its parents and of anything below it"""
+        path = path.strip("/")
+        self.versions[remote] = self.version(remote) + 1
+        for key in list(self.entries):
+            cached_remote, cached_path = key[0], key[1]
+            if cached_remote != remote:
+                continue
+            if (
+                cached_path == path
+                or not cached_path
+                or path.startswith(f"{cached_path}/")
+                or (not path or cached_path.startswith(f"{path}/"))
+            ):
+                self._drop(key)
+                self.invalidations += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0,
+            "evictions": self.evictions,
+            "expired": self.expired,
+            "invalidations": self.invalidations,
+            "stale": self.stale,
+        }
@@ -0,0 +1,169 @@
+from configparser import ConfigParser, Error as ConfigError
+from os import stat
+from threading import Lock as ThreadLock
+
+from bot import LOGGER
+
+rclone_config = "/usr/src/app/rclone.conf"
+
+# backends that sit on top of another remote, named in their "remote" option
+WRAPPERS = {"crypt", "alias", "chunker", "compress", "hasher"}
+# backends that merge other remotes, named in their "upstreams" option
+MERGERS = {"union", "combine"}
+# what a storage backend can do: hashes it knows, whether reading them means
+# reading the files (SlowHash), server side copy, quota (about) and public links
+FEATURES = {
+    "drive": {"hashes": ("md5", "sha1", "sha256"), "server_side": True, "about": True, "link": True},
+    "onedrive": {"hashes": ("quickxor", "sha1"), "server_side": True, "about": True, "link": True},
+    "dropbox": {"hashes": ("dropbox",), "server_side": True, "about": True, "link": True},
+    "box": {"hashes": ("sha1",), "server_side": True, "about": True, "link": True},
+    "pcloud": {"hashes": ("sha1", "md5"), "server_side": True, "about": True, "link": True},
+    "s3": {"hashes": ("md5",), "server_side": True, "link": True},
+    "b2": {"hashes": ("sha1",), "server_side": True, "link": True},
+    "azureblob": {"hashes": ("md5",), "server_side": True, "link": True},
+    "gcs": {"hashes": ("md5",), "server_side": True, "link": True},
+    "mega": {"server_side": True, "about": True, "link": True},
+    "local": {"hashes": ("md5", "sha1"), "slow_hash": True, "about": True},
+    "sftp": {"hashes": ("md5", "sha1"), "slow_hash": True, "about": True},
+    "webdav": {"about": True},
+}
+
+
+class Remote:
+    """One section of rclone.conf"""
+
+    __slots__ = ("name", "type", "options", "base")
+
+    def __init__(self, name, options):
+        self.name = name
+        self.type = options.get("type")
+        self.options = options
+        self.base = None  # the Remote a wrapper sits on, filled in by RcloneConfig
+
+    @property
+    def is_crypt(self):
+        return self.type == "crypt"
+
+    @property
+    def layers(self):
+        """This remote and the ones it wraps, outermost first"""
+        remote, seen = self, []
+        while remote is not None and remote not in seen:
+            seen.append(remote)
+            remote = remote.base
+        return seen
+
+    @property
+    def storage(self):
+        """The remote that stores the data, under any crypt, alias or chunker"""
+        return self.layers[-1]
+
+    @property
+    def upstreams(self):
+        """Names of the remotes whose files this one shows, for wrappers and mergers"""
+        if self.type in WRAPPERS:
+            specs = [self.options.get("remote", "")]
+        elif self.type in MERGERS:
+            # union lists remote:path[:mode], combine dir=remote:path
+            specs = [spec.partition("=")[2] or spec for spec in self.options.get("upstreams", "").split()]
+        else:
+            return []
+        return [name for name, colon, _ in (spec.partition(":") for spec in specs) if colon and name]
+
+    @property
+    def encrypted(self):
+        return any(layer.is_crypt for layer in self.layers)
+
+    def feature(self, name, default=False):
+        """A FEATURES flag of the storage backend, None when the backend is not known"""
+        features = FEATURES.get(self.storage.type)
+        if features is None:
+            return None
+        return features.get(name, default)
+
+    @property
+    def hashes(self):
+        """Hash types of the remote's files, crypt hides those of the storage"""
+        if self.encrypted:
+            return ()
+        return self.feature("hashes", ()) or ()
+
+    @property
+    def listing_hashes(self):
+        """Whether a listing carries the hashes without reading the files"""
+        return bool(self.hashes) and not self.feature("slow_hash")
+
+    @property
+    def about(self):
+        return self.feature("about")
+
+    @property
+    def public_link(self):
+        if self.encrypted:
+            return False
+        return self.feature("link")
+
+    def server_side_with(self, other):
+        """Whether copies between this remote and ``other`` can stay on the backend"""
+        if other is None or self.encrypted != other.encrypted:
+            return False
+        return self.storage.type == other.storage.type and self.feature("server_side")
+
+
+class RcloneConfig:
+    """rclone.conf parsed once and re-read only when the file changes
+
+    Lookups stat the file and parse it again when its modification time or
+    size moved, so edits (and a config uploaded at runtime) show up without
+    a restart and menus never read it from disk themselves.
+    """
+
+    def __init__(self, path=rclone_config):
+        self.path = path
+        self.lock = ThreadLock()
+        self.stamp = None
+        self.sections = {}
+        self.loads = 0
+
+    def _load(self):
+        try:
+            info = stat(self.path)
+            stamp = (info.st_mtime_ns, info.st_size)
+        except OSError:
+            stamp = None
+        if stamp == self.stamp:
+            return self.sections
+        with self.lock:
+            if stamp == self.stamp:
+                return self.sections
+            conf = ConfigParser(interpolation=None)
+            try:
+                if stamp is not None:
+                    conf.read(self.path)
+            except ConfigError as e:
+                LOGGER.error(f"Could not parse {self.path}: {e}")
+                return self.sections
+            sections = {name: Remote(name, dict(conf.items(name))) for name in conf.sections()}
+            for remote in sections.values():
+                if remote.type in WRAPPERS:
+                    target, colon, _ = remote.options.get("remote", "").partition(":")
+                    # a wrapper of a plain path wraps the local disk
+                    remote.base = sections.get(target) if colon else Remote("", {"type": "local"})
+            self.sections = sections
+            self.stamp = stamp
+            self.loads += 1
+        return self.sections
+
+    def remotes(self):
+        """Names of the configured remotes in file order"""
+        return list(self._load())
+
+    def get(self, name):
+        return self._load().get(name)
+
+    def type(self, name):
+        remote = self.get(name)
+        return remote.type if remote is not None else None
+
+
+RCLONE_CONF = RcloneConfig()
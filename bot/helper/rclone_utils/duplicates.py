@@ -0,0 +1,289 @@
+from collections import Counter
+from contextlib import asynccontextmanager
+from os import path as ospath, remove
+from secrets import token_hex
+
+from aiofiles import open as aiopen
+from aiofiles.os import makedirs
+
+from bot import LOGGER
+from bot.helper.ext_utils.bot_utils import sync_to_async
+from bot.helper.rclone_utils.bulk import FILTER_DIR
+from bot.helper.rclone_utils.config import RCLONE_CONF
+from bot.helper.rclone_utils.index import INDEX
+from bot.helper.rclone_utils.rc import rclone_config, rclone_op
+
+HASHSUM_BATCH = 500  # files per hashsum call
+HASHSUM_TIMEOUT = 1800
+# hashes that identify content together with the size, crc32 and the like do not
+STRONG_HASHES = {"md5", "sha1", "sha256", "sha512", "quickxor", "dropbox", "whirlpool", "blake3", "xxh128"}
+
+
+@asynccontextmanager
+async def files_from(paths):
+    """A ``--files-from-raw`` file listing ``paths``, removed after the block"""
+    await makedirs(FILTER_DIR, exist_ok=True)
+    name = ospath.join(FILTER_DIR, f"{token_hex(8)}.txt")
+    async with aiopen(name, "w") as f:
+        await f.write("\n".join(paths) + "\n")
+    try:
+        yield name
+    finally:
+        try:
+            remove(name)
+        except OSError:
+            pass
+
+
+async def hashsum(remote, paths):
+    """``{path: md5}`` of ``paths`` on ``remote``, paths the backend can't hash are left out"""
+    async with files_from(paths) as listed:
+        cmd = [
+            "rclone",
+            "hashsum",
+            "md5",
+            f"--config={rclone_config}",
+            f"--files-from-raw={listed}",
+            f"{remote}:",
+        ]
+        result, err = await rclone_op(
+            "operations/hashsum",
+            cmd,
+            timeout=HASHSUM_TIMEOUT,
+            fs=f"{remote}:",
+            hashType="md5",
+            _filter={"FilesFromRaw": [listed]},
+        )
+    if err is not None:
+        raise RuntimeError(err)
+    hashes = {}
+    for line in result.get("hashsum") or []:
+        value, _, path = line.partition("  ")
+        if path and value and value != "UNSUPPORTED":
+            hashes[path] = value
+    return hashes
+
+
+async def fill_hashes(remote, files, on_progress=None):
+    """Hash the ``(path, size, hashes, id)`` files that have no strong hash yet
+
+    Backends that list hashes already have them from the crawl; for the rest
+    rclone hashes the files in batches and the index keeps the result until
+    the file changes. The new hashes are added to ``files`` in place too.
+    Returns how many files still have no hash.
+    """
+    missing = [(path, hashes) for path, _, hashes, _ in files if not STRONG_HASHES & hashes.keys()]
+    conf = RCLONE_CONF.get(remote)
+    if not missing or conf is None or conf.listing_hashes:
+        return len(missing)
+    index = await sync_to_async(INDEX.get, remote)
+    unhashed = 0
+    for start in range(0, len(missing), HASHSUM_BATCH):
+        batch = missing[start : start + HASHSUM_BATCH]
+        try:
+            found = await hashsum(remote, [path for path, _ in batch])
+        except Exception as e:
+            LOGGER.error(f"hashsum of {remote} failed: {e}")
+            return unhashed + len(missing) - start
+        for path, hashes in batch:
+            if path in found:
+                hashes["md5"] = found[path]
+            else:
+                unhashed += 1
+        await sync_to_async(index.add_hashes, {path: {"md5": value} for path, value in found.items()})
+        if on_progress is not None:
+            await on_progress(remote, start + len(batch), len(missing))
+    return unhashed
+
+
+def group_duplicates(files):
+    """Groups of identical ``(remote, path, size, hashes, id)`` files
+
+    Two files are the same when they have the same size and agree on one
+    strong hash; files of different backends are joined through whichever
+    hash type they share. Groups come biggest saving first.
+    """
+    parent = list(range(len(files)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    first = {}
+    for i, (_, _, size, hashes, _) in enumerate(files):
+        for kind, value in hashes.items():
+            if kind not in STRONG_HASHES or not value:
+                continue
+            j = first.setdefault((size, kind, value.lower()), i)
+            if j != i:
+                parent[find(i)] = find(j)
+
+    groups = {}
+    for i in range(len(files)):
+        groups.setdefault(find(i), []).append(files[i])
+    groups = [sorted(group, key=lambda f: f[:2]) for group in groups.values() if len(group) > 1]
+    return sorted(groups, key=lambda group: group[0][2] * (len(group) - 1), reverse=True)
+
+
+def shadowing_remotes(remotes):
+    """The ``remotes`` that show files of another of ``remotes``
+
+    An alias, crypt, union or the like over a remote that is scanned too
+    lists the same stored files a second time.
+    """
+    names = set(remotes)
+    found = []
+    for remote in remotes:
+        conf = RCLONE_CONF.get(remote)
+        todo, seen = list(conf.upstreams) if conf is not None else [], set()
+        while todo:
+            name = todo.pop()
+            if name in seen:
+                continue
+            if name in names and name != remote:
+                found.append(remote)
+                break
+            seen.add(name)
+            upstream = RCLONE_CONF.get(name)
+            if upstream is not None:
+                todo.extend(upstream.upstreams)
+    return found
+
+
+def may_share_objects(group):
+    """Whether two members of ``group`` could be one stored object under two names
+
+    Rows with the same object id are the same object. Rows without an id on
+    different remotes of one backend type can't be told apart, those may be
+    remotes whose roots overlap.
+    """
+    ids = [file_id for *_, file_id in group if file_id]
+    if len(ids) != len(set(ids)):
+        return True
+    backends = {}
+    for remote, *_, file_id in group:
+        if file_id:
+            continue
+        conf = RCLONE_CONF.get(remote)
+        backends.setdefault(conf.storage.type if conf is not None else None, set()).add(remote)
+    return any(len(remotes) > 1 for remotes in backends.values())
+
+
+async def find_duplicates(remotes, on_progress=None):
+    """Duplicate groups across the indexed ``remotes``, returns ``(groups, stats)``
+
+    Only files whose size occurs more than once anywhere can be duplicates,
+    so only those are hashed and compared. Members are
+    ``(remote, path, size, hashes)``; remotes that show another scanned
+    remote and groups that may hold one object twice are left out, so
+    deleting copies never deletes the only one.
+    """
+    shadowing = shadowing_remotes(remotes)
+    indexes = {}
+    for remote in remotes:
+        if remote not in shadowing:
+            index = await sync_to_async(INDEX.ready, remote)
+            if index is not None:
+                indexes[remote] = index
+    sizes = Counter()
+    for index in indexes.values():
+        for size, count in await sync_to_async(index.size_counts):
+            sizes[size] += count
+    candidates = [size for size, count in sizes.items() if count > 1]
+
+    files = []
+    unhashed = 0
+    for remote, index in indexes.items():
+        rows = await sync_to_async(index.files_of_sizes, candidates)
+        unhashed += await fill_hashes(remote, rows, on_progress)
+        files.extend((remote, *row) for row in rows)
+
+    groups = await sync_to_async(group_duplicates, files)
+    shared = [group for group in groups if may_share_objects(group)]
+    groups = [[member[:4] for member in group] for group in groups if not may_share_objects(group)]
+    stats = {
+        "remotes": list(indexes),
+        "skipped": [r for r in remotes if r not in indexes and r not in shadowing],
+        "shadowing": shadowing,
+        "shared": len(shared),
+        "candidates": len(files),
+        "unhashed": unhashed,
+        "groups": len(groups),
+        "files": sum(len(group) for group in groups),
+        "reclaimable": sum(group[0][2] * (len(group) - 1) for group in groups),
+    }
+    return groups, stats
+
+
+def check_hash(hashes):
+    """``(type, value)`` to check a member by, md5 when it has one"""
+    kinds = sorted(STRONG_HASHES & hashes.keys(), key=lambda kind: (kind != "md5", kind))
+    return (kinds[0], hashes[kinds[0]].lower()) if kinds else (None, None)
+
+
+async def current_files(remote, paths, hash_type):
+    """``{path: (size, hash)}`` of ``paths`` on ``remote`` now, gone paths are left out"""
+    async with files_from(paths) as listed:
+        cmd = [
+            "rclone",
+            "lsjson",
+            "-R",
+            "--files-only",
+            "--hash",
+            f"--hash-type={hash_type}",
+            f"--config={rclone_config}",
+            f"--files-from-raw={listed}",
+            f"{remote}:",
+        ]
+        result, err = await rclone_op(
+            "operations/list",
+            cmd,
+            timeout=HASHSUM_TIMEOUT,
+            fs=f"{remote}:",
+            remote="",
+            opt={"recurse": True, "filesOnly": True, "showHash": True, "hashTypes": [hash_type]},
+            _filter={"FilesFromRaw": [listed]},
+        )
+    if err is not None:
+        raise RuntimeError(err)
+    return {
+        item["Path"]: (item.get("Size"), ((item.get("Hashes") or {}).get(hash_type) or "").lower())
+        for item in result.get("list") or []
+    }
+
+
+async def verify_selection(groups, selected):
+    """The ``(group, member)`` pairs of ``selected`` that are still safe to delete
+
+    The index may be behind the remotes, so every member of the affected
+    groups is read again: a selected copy is kept when it changed, and a
+    whole group is kept when none of its unselected copies is still there
+    unchanged.
+    """
+    touched = {g for g, _ in selected}
+    checks = {}
+    for g in touched:
+        for m, (remote, path, _, hashes) in enumerate(groups[g]):
+            kind, _ = check_hash(hashes)
+            if kind is not None:
+                checks.setdefault((remote, kind), []).append(path)
+    current = {}
+    for (remote, kind), paths in checks.items():
+        for start in range(0, len(paths), HASHSUM_BATCH):
+            found = await current_files(remote, paths[start : start + HASHSUM_BATCH], kind)
+            current.update(((remote, kind, path), state) for path, state in found.items())
+
+    def unchanged(member):
+        remote, path, size, hashes = member
+        kind, value = check_hash(hashes)
+        return kind is not None and current.get((remote, kind, path)) == (size, value)
+
+    safe = set()
+    for g in touched:
+        group = groups[g]
+        if not any(unchanged(member) for m, member in enumerate(group) if (g, m) not in selected):
+            continue
+        safe.update((g, m) for m, member in enumerate(group) if (g, m) in selected and unchanged(member))
+    return safe
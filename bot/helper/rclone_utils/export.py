@@ -0,0 +1,148 @@
+import csv
+import gzip
+from json import dumps, loads
+from os import makedirs, path as ospath, remove
+from time import time
+
+from bot import LOGGER
+from bot.helper.ext_utils.bot_utils import sync_to_async
+from bot.helper.rclone_utils.config import RCLONE_CONF
+from bot.helper.rclone_utils.index import INDEX
+from bot.helper.rclone_utils.jobs import HEAVY, JOBS, LIGHT
+from bot.helper.rclone_utils.progress import PROGRESS_INTERVAL
+from bot.helper.rclone_utils.rc import RcError, rclone_config, stream_lsjson
+
+EXPORT_DIR = "rclone_data/exports"
+EXPORT_BATCH = 1000  # entries written to the file at a time
+FIELDS = ("path", "size", "modtime", "is_dir", "mime")
+FORMATS = ("csv", "jsonl")
+
+
+class ExportWriter:
+    """gzip compressed CSV or JSON lines file of listing entries
+
+    CSV gets a column per hash type of the remote, JSON lines keep the
+    hashes as an object. Entries go to disk as they are written.
+    """
+
+    def __init__(self, dest, fmt, hash_types):
+        self.fmt = fmt
+        self.hash_types = hash_types
+        self.file = gzip.open(dest, "wt", encoding="utf-8", newline="")
+        self.rows = 0
+        if fmt == "csv":
+            self.csv = csv.writer(self.file)
+            self.csv.writerow((*FIELDS, *hash_types))
+
+    def write(self, records):
+        for record in records:
+            hashes = record.pop("hashes")
+            if self.fmt == "csv":
+                self.csv.writerow(
+                    (*(record[field] for field in FIELDS), *(hashes.get(h, "") for h in self.hash_types))
+                )
+            else:
+                record["hashes"] = hashes
+                self.file.write(dumps(record, ensure_ascii=False) + "\n")
+        self.rows += len(records)
+
+    def close(self):
+        self.file.close()
+
+
+def index_record(row):
+    path, size, modtime, is_dir, mime, hashes = row
+    return {
+        "path": path,
+        "size": size,
+        "modtime": modtime or "",
+        "is_dir": bool(is_dir),
+        "mime": mime or "",
+        "hashes": loads(hashes) if hashes else {},
+    }
+
+
+def lsjson_record(root, entry):
+    return {
+        "path": "/".join(p for p in (root, entry["Path"]) if p),
+        "size": entry.get("Size", -1),
+        "modtime": entry.get("ModTime", ""),
+        "is_dir": bool(entry.get("IsDir")),
+        "mime": entry.get("MimeType", ""),
+        "hashes": entry.get("Hashes") or {},
+    }
+
+
+async def _index_records(remote, root):
+    index = await sync_to_async(INDEX.ready, remote)
+    after = ""
+    while True:
+        rows = await sync_to_async(index.tree_rows, root, after, EXPORT_BATCH)
+        if not rows:
+            return
+        yield [index_record(row) for row in rows]
+        after = rows[-1][0]
+
+
+async def _lsjson_records(remote, root, hashes):
+    cmd = ["rclone", "lsjson", "-R", "--fast-list", f"--config={rclone_config}", f"{remote}:{root}"]
+    if hashes:
+        cmd.append("--hash")
+    batch = []
+    async for entry in stream_lsjson(cmd, lane=HEAVY):
+        batch.append(lsjson_record(root, entry))
+        if len(batch) >= EXPORT_BATCH:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def export_listing(remote, root, fmt, from_index=False, on_progress=None):
+    """Write every entry below ``remote:root`` to a compressed CSV or JSONL file
+
+    Entries come from the metadata index when ``from_index`` and the remote
+    has one, else from a recursive ``rclone lsjson`` as it prints them; they
+    are written in batches, so memory does not grow with the tree.
+    ``on_progress(entries)`` is awaited at most every PROGRESS_INTERVAL
+    seconds. Returns ``(file, entries, error)``, the caller removes the file.
+    """
+    root = root.strip("/")
+    conf = RCLONE_CONF.get(remote)
+    hash_types = list(conf.hashes) if conf is not None else []
+    from_index = from_index and await sync_to_async(INDEX.ready, remote) is not None
+    if from_index and "md5" not in hash_types:
+        # the duplicate finder stores md5 in the index for the other remotes
+        hash_types.append("md5")
+    makedirs(EXPORT_DIR, exist_ok=True)
+    name = f"{remote}_{root.replace('/', '_')}".strip("_")
+    dest = ospath.join(EXPORT_DIR, f"{name}_{int(time())}.{fmt}.gz")
+    writer = await sync_to_async(ExportWriter, dest, fmt, hash_types)
+    reported = time()
+    try:
+        if from_index:
+            # the index is read in the bot, a slot keeps it cancellable
+            async with JOBS.slot(LIGHT):
+                async for batch in _index_records(remote, root):
+                    await sync_to_async(writer.write, batch)
+                    if on_progress is not None and time() - reported > PROGRESS_INTERVAL:
+                        reported = time()
+                        await on_progress(writer.rows)
+        else:
+            listing_hashes = conf is not None and conf.listing_hashes
+            async for batch in _lsjson_records(remote, root, listing_hashes):
+                await sync_to_async(writer.write, batch)
+                if on_progress is not None and time() - reported > PROGRESS_INTERVAL:
+                    reported = time()
+                    await on_progress(writer.rows)
+    except (RcError, OSError) as e:
+        LOGGER.error(f"Export of {remote}:{root} failed: {e}")
+        await sync_to_async(writer.close)
+        remove(dest)
+        return None, writer.rows, str(e)
+    except BaseException:
+        await sync_to_async(writer.close)
+        remove(dest)
+        raise
+    await sync_to_async(writer.close)
+    return dest, writer.rows, None
@@ -0,0 +1,795 @@
+import sqlite3
+from asyncio import Lock
+from datetime import datetime, timedelta, timezone
+from json import dumps, loads
+from os import makedirs, path as ospath
+from threading import Lock as ThreadLock
+from time import time
+from urllib.parse import quote
+
+from apscheduler.triggers.interval import IntervalTrigger
+
+from bot import LOGGER, config_dict, scheduler
+from bot.helper.ext_utils.bot_utils import sync_to_async
+from bot.helper.rclone_utils.config import RCLONE_CONF
+from bot.helper.rclone_utils.jobs import BACKGROUND
+from bot.helper.rclone_utils.rc import (
+    RcError,
+    mutation_listeners,
+    rclone_config,
+    rclone_op,
+    stream_lsjson,
+)
+
+INDEX_DIR = "rclone_data/index"
+BATCH_SIZE = 2000
+# seconds a delta pass reaches back past its checkpoint, for modtimes that
+# land late or clocks that disagree
+DELTA_OVERLAP = 600
+DELTA_TIMEOUT = 600
+# backends that can list what changed server side, see MetadataIndex.delta
+DELTA_BACKENDS = {"drive"}
+FOLDER_MIME = "application/vnd.google-apps.folder"
+GOOGLE_APPS_MIME = "application/vnd.google-apps."
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    parent TEXT NOT NULL,
+    size INTEGER,
+    mime TEXT,
+    modtime TEXT,
+    is_dir INTEGER NOT NULL,
+    hashes TEXT,
+    id TEXT,
+    seen INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_parent ON files(parent);
+CREATE INDEX IF NOT EXISTS files_id ON files(id);
+CREATE VIRTUAL TABLE IF NOT EXISTS names USING fts5(
+    name, content='files', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS files_ai AFTER INSERT ON files BEGIN
+    INSERT INTO names(rowid, name) VALUES (new.rowid, new.name);
+END;
+CREATE TRIGGER IF NOT EXISTS files_ad AFTER DELETE ON files BEGIN
+    INSERT INTO names(names, rowid, name) VALUES ('delete', old.rowid, old.name);
+END;
+CREATE TRIGGER IF NOT EXISTS files_au AFTER UPDATE OF name ON files
+WHEN old.name <> new.name BEGIN
+    INSERT INTO names(names, rowid, name) VALUES ('delete', old.rowid, old.name);
+    INSERT INTO names(rowid, name) VALUES (new.rowid, new.name);
+END;
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS dirsizes (
+    path TEXT PRIMARY KEY,
+    files INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+"""
+
+UPSERT = """
+INSERT INTO files (path, name, parent, size, mime, modtime, is_dir, hashes, id, seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(path) DO UPDATE SET
+    name = excluded.name,
+    parent = excluded.parent,
+    size = excluded.size,
+    mime = excluded.mime,
+    modtime = excluded.modtime,
+    is_dir = excluded.is_dir,
+    hashes = CASE
+        WHEN excluded.hashes IS NOT NULL THEN excluded.hashes
+        WHEN files.size = excluded.size AND files.modtime IS excluded.modtime THEN files.hashes
+    END,
+    id = excluded.id,
+    seen = excluded.seen
+"""
+
+
+def _escape_like(text):
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _like_prefix(path):
+    return f"{_escape_like(path)}/%"
+
+
+def ancestors(path):
+    """The folders holding ``path``, innermost first, ending with the root ``""``"""
+    while path:
+        path = path.rsplit("/", 1)[0] if "/" in path else ""
+        yield path
+
+
+def rollup(top, folders, direct):
+    """``{folder: [files, bytes]}`` of ``top`` and the ``folders`` below it
+
+    ``direct`` holds ``(parent, files, bytes)`` of the files right inside each
+    folder, every folder gets the totals of the folders below it added.
+    """
+    totals = {path: [0, 0] for (path,) in folders}
+    totals[top] = [0, 0]
+    for parent, files, size in direct:
+        total = totals.setdefault(parent, [0, 0])
+        total[0] += files
+        total[1] += size
+    for path in list(totals):
+        if path == top:
+            continue
+        for parent in ancestors(path):
+            if parent in totals:
+                break
+            totals[parent] = [0, 0]
+    # deepest folders first, so each one is complete before it is added up
+    for path in sorted(totals, key=lambda p: p.count("/") if p else -1, reverse=True):
+        if path == top:
+            continue
+        parent = totals[path.rsplit("/", 1)[0] if "/" in path else ""]
+        parent[0] += totals[path][0]
+        parent[1] += totals[path][1]
+    return totals
+
+
+async def drive_query(remote, query):
+    """Drive files matching ``query`` in Drive's search syntax, ``(items, error)``"""
+    result, err = await rclone_op(
+        "backend/command",
+        ["rclone", "backend", "query", f"--config={rclone_config}", f"{remote}:", query],
+        timeout=DELTA_TIMEOUT,
+        lane=BACKGROUND,
+        command="query",
+        fs=f"{remote}:",
+        arg=[query],
+    )
+    if err is not None:
+        return None, err
+    return result.get("result") or [], None
+
+
+def drive_entry(item, parent):
+    """The lsjson entry of a Drive file object in the folder ``parent``"""
+    is_dir = item.get("mimeType") == FOLDER_MIME
+    # rclone shows a slash in a Drive name as a full width one
+    path = "/".join(p for p in (parent, item["name"].replace("/", "／")) if p)
+    hashes = {
+        kind: item[field]
+        for kind, field in (("md5", "md5Checksum"), ("sha1", "sha1Checksum"), ("sha256", "sha256Checksum"))
+        if item.get(field)
+    }
+    return {
+        "Path": path,
+        "Name": path.rsplit("/", 1)[-1],
+        "Size": -1 if is_dir else int(item.get("size", -1)),
+        "MimeType": "inode/directory" if is_dir else item.get("mimeType"),
+        "ModTime": item.get("modifiedTime"),
+        "IsDir": is_dir,
+        "Hashes": hashes,
+        "ID": item["id"],
+    }
+
+
+def entry_row(entry, root, generation):
+    path = "/".join(p for p in (root, entry["Path"]) if p)
+    parent = path.rsplit("/", 1)[0] if "/" in path else ""
+    hashes = entry.get("Hashes")
+    return (
+        path,
+        entry["Name"],
+        parent,
+        entry.get("Size", -1),
+        entry.get("MimeType"),
+        entry.get("ModTime"),
+        1 if entry.get("IsDir") else 0,
+        dumps(hashes) if hashes else None,
+        entry.get("ID"),
+        generation,
+    )
+
+
+class RemoteIndex:
+    """SQLite index of the files of one remote with a trigram name search
+
+    Crawls upsert every entry they see with a new generation number and then
+    sweep the rows of the crawled part that were not seen, so unchanged rows
+    and their search terms are left alone.
+    """
+
+    def __init__(self, remote, directory=INDEX_DIR):
+        self.remote = remote
+        makedirs(directory, exist_ok=True)
+        self.path = ospath.join(directory, f"{quote(remote, safe='')}.db")
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        self.lock = ThreadLock()
+
+    def get_meta(self, key, default=None):
+        with self.lock:
+            row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return loads(row[0]) if row else default
+
+    def set_meta(self, **values):
+        with self.lock, self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [(key, dumps(value)) for key, value in values.items()],
+            )
+
+    def next_generation(self):
+        generation = self.get_meta("generation", 0) + 1
+        self.set_meta(generation=generation)
+        return generation
+
+    def upsert(self, rows):
+        with self.lock, self.db:
+            self.db.executemany(UPSERT, rows)
+
+    def sweep(self, root, generation, recursive=True):
+        """Delete rows under ``root`` a crawl did not see, returns how many"""
+        with self.lock, self.db:
+            if recursive and not root:
+                cur = self.db.execute("DELETE FROM files WHERE seen <> ?", (generation,))
+                return cur.rowcount
+            if recursive:
+                cur = self.db.execute(
+                    "DELETE FROM files WHERE seen <> ? AND path LIKE ? ESCAPE '\\'",
+                    (generation, _like_prefix(root)),
+                )
+                return cur.rowcount
+            gone = self.db.execute(
+                "SELECT path, is_dir FROM files WHERE parent = ? AND seen <> ?",
+                (root, generation),
+            ).fetchall()
+            for path, is_dir in gone:
+                self.db.execute("DELETE FROM files WHERE path = ?", (path,))
+                if is_dir:
+                    self.db.execute(
+                        "DELETE FROM files WHERE path LIKE ? ESCAPE '\\'",
+                        (_like_prefix(path),),
+                    )
+                    self.db.execute(
+                        "DELETE FROM dirsizes WHERE path = ? OR path LIKE ? ESCAPE '\\'",
+                        (path, _like_prefix(path)),
+                    )
+            return len(gone)
+
+    def search(self, text, limit=50):
+        """Files whose name contains ``text``, ignoring case; returns (rows, total)"""
+        with self.lock:
+            if len(text) >= 3:
+                match = '"' + text.replace('"', '""') + '"'
+                where = "f.rowid IN (SELECT rowid FROM names WHERE names MATCH ?)"
+            else:
+                match = f"%{_escape_like(text)}%"
+                where = "f.name LIKE ? ESCAPE '\\'"
+            total = self.db.execute(
+                f"SELECT COUNT(*) FROM files f WHERE {where} AND f.is_dir = 0", (match,)
+            ).fetchone()[0]
+            rows = self.db.execute(
+                f"SELECT f.path, f.name, f.size, f.id FROM files f WHERE {where} AND f.is_dir = 0 "
+                "ORDER BY f.path LIMIT ?",
+                (match, limit),
+            ).fetchall()
+        return [
+            {"Path": path, "Name": name, "Size": size, "ID": file_id}
+            for path, name, size, file_id in rows
+        ], total
+
+    def children(self, path):
+        """Number of entries directly inside the folder ``path``"""
+        with self.lock:
+            return self.db.execute(
+                "SELECT COUNT(*) FROM files WHERE parent = ?", (path.strip("/"),)
+            ).fetchone()[0]
+
+    def compute_sizes(self):
+        """Roll file sizes up the tree into a files/bytes total per folder"""
+        with self.lock:
+            direct = self.db.execute(
+                "SELECT parent, COUNT(*), SUM(MAX(size, 0)) FROM files WHERE is_dir = 0 GROUP BY parent"
+            ).fetchall()
+            folders = self.db.execute("SELECT path FROM files WHERE is_dir = 1").fetchall()
+        totals = rollup("", folders, direct)
+        with self.lock, self.db:
+            self.db.execute("DELETE FROM dirsizes")
+            self.db.executemany(
+                "INSERT INTO dirsizes VALUES (?, ?, ?)",
+                ((path, files, size) for path, (files, size) in totals.items()),
+            )
+            self.db.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('sizes_at', ?)", (dumps(time()),)
+            )
+        return len(totals)
+
+    def update_sizes(self, root, recursive=True):
+        """Redo the folder totals of a crawled ``root`` and move the folders above by the change
+
+        A recursive crawl rolls up its subtree again, one level deep only the
+        files of ``root`` are counted again on top of the totals its subfolders
+        have. Either way the cost follows what was crawled, not the remote.
+        Nothing is done before the first full rollup.
+        """
+        root = root.strip("/")
+        if recursive and not root:
+            return self.compute_sizes()
+        low, high = f"{root}/", f"{root}0"
+        with self.lock:
+            if self.db.execute("SELECT 1 FROM meta WHERE key = 'sizes_at'").fetchone() is None:
+                return 0
+            old = self.db.execute(
+                "SELECT files, bytes FROM dirsizes WHERE path = ?", (root,)
+            ).fetchone() or (0, 0)
+            if recursive:
+                direct = self.db.execute(
+                    "SELECT parent, COUNT(*), SUM(MAX(size, 0)) FROM files "
+                    "WHERE is_dir = 0 AND path > ? AND path < ? GROUP BY parent",
+                    (low, high),
+                ).fetchall()
+                folders = self.db.execute(
+                    "SELECT path FROM files WHERE is_dir = 1 AND path > ? AND path < ?", (low, high)
+                ).fetchall()
+            else:
+                files, size = self.db.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(MAX(size, 0)), 0) FROM files "
+                    "WHERE parent = ? AND is_dir = 0",
+                    (root,),
+                ).fetchone()
+                below = self.db.execute(
+                    "SELECT COALESCE(SUM(d.files), 0), COALESCE(SUM(d.bytes), 0) FROM files f "
+                    "JOIN dirsizes d ON d.path = f.path WHERE f.parent = ? AND f.is_dir = 1",
+                    (root,),
+                ).fetchone()
+        if recursive:
+            totals = rollup(root, folders, direct)
+        else:
+            totals = {root: [files + below[0], size + below[1]]}
+        files, size = totals[root][0] - old[0], totals[root][1] - old[1]
+        with self.lock, self.db:
+            if recursive:
+                self.db.execute(
+                    "DELETE FROM dirsizes WHERE path > ? AND path < ?", (low, high)
+                )
+            self.db.executemany(
+                "INSERT OR REPLACE INTO dirsizes VALUES (?, ?, ?)",
+                ((path, files, size) for path, (files, size) in totals.items()),
+            )
+            if files or size:
+                parents = list(ancestors(root))
+                self.db.executemany(
+                    "INSERT OR IGNORE INTO dirsizes VALUES (?, 0, 0)", ((p,) for p in parents)
+                )
+                self.db.executemany(
+                    "UPDATE dirsizes SET files = files + ?, bytes = bytes + ? WHERE path = ?",
+                    ((files, size, path) for path in parents),
+                )
+        return len(totals)
+
+    def apply_delta(self, rows):
+        """Upsert the rows of a delta listing and move the folder totals by the change
+
+        Each file adds its change in size, and one file when it is new, to
+        every folder above it, so a delta does not need a full rollup.
+        Returns ``(files, bytes)``, the net change of the whole remote.
+        """
+        changes = {}
+
+        def count(path, files, size):
+            for parent in ancestors(path):
+                change = changes.setdefault(parent, [0, 0])
+                change[0] += files
+                change[1] += size
+
+        with self.lock, self.db:
+            sized = self.db.execute("SELECT 1 FROM meta WHERE key = 'sizes_at'").fetchone()
+            for row in rows:
+                path, size, is_dir, file_id = row[0], row[3], row[6], row[8]
+                if is_dir:
+                    continue
+                if file_id:
+                    # the same object under another path was moved or renamed
+                    for old_path, old_size in self.db.execute(
+                        "SELECT path, size FROM files WHERE id = ? AND path <> ? AND is_dir = 0",
+                        (file_id, path),
+                    ).fetchall():
+                        self.db.execute("DELETE FROM files WHERE path = ?", (old_path,))
+                        count(old_path, -1, -max(old_size or 0, 0))
+                old = self.db.execute(
+                    "SELECT size, is_dir FROM files WHERE path = ?", (path,)
+                ).fetchone()
+                files = 0 if old is not None and not old[1] else 1
+                size = max(size, 0) - (max(old[0] or 0, 0) if files == 0 else 0)
+                if files or size:
+                    count(path, files, size)
+            self.db.executemany(UPSERT, rows)
+            if sized:
+                self.db.executemany(
+                    "INSERT OR IGNORE INTO dirsizes VALUES (?, 0, 0)", ((p,) for p in changes)
+                )
+                self.db.executemany(
+                    "UPDATE dirsizes SET files = files + ?, bytes = bytes + ? WHERE path = ?",
+                    ((files, size, path) for path, (files, size) in changes.items()),
+                )
+        return tuple(changes.get("", (0, 0)))
+
+    def paths_of_ids(self, ids):
+        """``{id: (path, is_dir)}`` of the indexed entries with one of ``ids``"""
+        with self.lock:
+            self.db.execute("CREATE TEMP TABLE IF NOT EXISTS wanted_ids (id TEXT PRIMARY KEY)")
+            self.db.execute("DELETE FROM wanted_ids")
+            self.db.executemany("INSERT OR IGNORE INTO wanted_ids VALUES (?)", ((i,) for i in ids))
+            rows = self.db.execute(
+                "SELECT id, path, is_dir FROM files WHERE id IN (SELECT id FROM wanted_ids)"
+            ).fetchall()
+            self.db.execute("DELETE FROM wanted_ids")
+        return {file_id: (path, bool(is_dir)) for file_id, path, is_dir in rows}
+
+    def folder_size(self, path):
+        """``(files, bytes, as_of)`` of the folder ``path`` from the last rollup, or None"""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT files, bytes FROM dirsizes WHERE path = ?", (path.strip("/"),)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1], self.get_meta("sizes_at")
+
+    def tree_rows(self, root, after="", limit=BATCH_SIZE):
+        """Next ``limit`` entries below the folder ``root`` in path order, after the path ``after``
+
+        Rows are ``(path, size, modtime, is_dir, mime, hashes)``. The paths
+        below ``root`` are the primary key range between ``root/`` and
+        ``root0``, so paging through a tree never scans the rest.
+        """
+        root = root.strip("/")
+        with self.lock:
+            if not root:
+                return self.db.execute(
+                    "SELECT path, size, modtime, is_dir, mime, hashes FROM files "
+                    "WHERE path > ? ORDER BY path LIMIT ?",
+                    (after, limit),
+                ).fetchall()
+            return self.db.execute(
+                "SELECT path, size, modtime, is_dir, mime, hashes FROM files "
+                "WHERE path > ? AND path < ? ORDER BY path LIMIT ?",
+                (max(after, f"{root}/"), f"{root}0", limit),
+            ).fetchall()
+
+    def size_counts(self):
+        """``(size, files)`` for every size of a non-empty file"""
+        with self.lock:
+            return self.db.execute(
+                "SELECT size, COUNT(*) FROM files WHERE is_dir = 0 AND size > 0 GROUP BY size"
+            ).fetchall()
+
+    def files_of_sizes(self, sizes):
+        """``(path, size, hashes, id)`` of the files with one of ``sizes``"""
+        with self.lock:
+            self.db.execute("CREATE TEMP TABLE IF NOT EXISTS wanted_sizes (size INTEGER PRIMARY KEY)")
+            self.db.execute("DELETE FROM wanted_sizes")
+            self.db.executemany("INSERT OR IGNORE INTO wanted_sizes VALUES (?)", ((s,) for s in sizes))
+            rows = self.db.execute(
+                "SELECT path, size, hashes, id FROM files WHERE is_dir = 0 "
+                "AND size IN (SELECT size FROM wanted_sizes)"
+            ).fetchall()
+            self.db.execute("DELETE FROM wanted_sizes")
+        return [
+            (path, size, loads(hashes) if hashes else {}, file_id)
+            for path, size, hashes, file_id in rows
+        ]
+
+    def add_hashes(self, hashes):
+        """Merge ``{path: {type: value}}`` into the stored hashes of those files"""
+        with self.lock, self.db:
+            for path, values in hashes.items():
+                row = self.db.execute("SELECT hashes FROM files WHERE path = ?", (path,)).fetchone()
+                if row is None:
+                    continue
+                merged = {**(loads(row[0]) if row[0] else {}), **values}
+                self.db.execute(
+                    "UPDATE files SET hashes = ? WHERE path = ?", (dumps(merged), path)
+                )
+
+    def entries(self):
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+class MetadataIndex:
+    """Background crawler keeping a RemoteIndex per configured remote
+
+    Every remote gets a full crawl each RCLONE_INDEX_INTERVAL hours. Folders
+    written through the bot are marked dirty and their listing is recrawled
+    within a couple of minutes, so the index follows the bot's own changes.
+    In between, Drive remotes get a delta pass every RCLONE_INDEX_DELTA
+    minutes: one search for the files modified since the last checkpoint,
+    filtered by Drive, merged by object id. Other backends have no change
+    source rclone exposes and wait for the full crawl, as do deletions and
+    moves of files that keep their modification time.
+    """
+
+    def __init__(self, config=rclone_config, directory=INDEX_DIR):
+        self.config = config
+        self.directory = directory
+        self.indexes = {}
+        self.dirty = {}
+        self.crawling = None
+        self._crawl_lock = Lock()
+
+    def remotes(self):
+        wanted = config_dict["RCLONE_INDEX_REMOTES"].split()
+        return [remote for remote in RCLONE_CONF.remotes() if not wanted or remote in wanted]
+
+    def get(self, remote):
+        if remote not in self.indexes:
+            self.indexes[remote] = RemoteIndex(remote, self.directory)
+        return self.indexes[remote]
+
+    def ready(self, remote):
+        """Index of ``remote`` if one full crawl finished, else None"""
+        if not ospath.exists(ospath.join(self.directory, f"{quote(remote, safe='')}.db")):
+            return None
+        index = self.get(remote)
+        return index if index.get_meta("full_crawl") else None
+
+    def last_crawl(self, remote):
+        """When the last full crawl of ``remote`` finished, 0 if none did"""
+        return self.get(remote).get_meta("full_crawl", 0)
+
+    def mark_dirty(self, remote, path, recursive=False):
+        """Recrawl the folder holding ``path`` on the next dirty refresh
+
+        Called from the event loop after every write, so it only takes note;
+        remotes without an index are skipped when the refresh runs.
+        """
+        parent = path.strip("/").rsplit("/", 1)[0] if "/" in path.strip("/") else ""
+        folders = self.dirty.setdefault(remote, {})
+        folders[parent] = folders.get(parent, False) or recursive
+        if recursive:
+            folders[path.strip("/")] = True
+
+    async def crawl(self, remote, root="", recursive=True):
+        """List ``remote:root`` with rclone lsjson and merge it into the index"""
+        async with self._crawl_lock:
+            self.crawling = f"{remote}:{root}"
+            try:
+                return await self._crawl(remote, root.strip("/"), recursive)
+            finally:
+                self.crawling = None
+
+    async def _crawl(self, remote, root, recursive):
+        index = self.get(remote)
+        generation = await sync_to_async(index.next_generation)
+        cmd = ["rclone", "lsjson", f"--config={self.config}", f"{remote}:{root}"]
+        if recursive:
+            cmd.extend(["-R", "--fast-list"])
+        # hashes that come with the listing, not those rclone would read the files for
+        conf = RCLONE_CONF.get(remote)
+        if conf is not None and conf.listing_hashes:
+            cmd.append("--hash")
+        start = time()
+        batch = []
+        seen = 0
+        try:
+            async for entry in stream_lsjson(cmd, lane=BACKGROUND):
+                batch.append(entry_row(entry, root, generation))
+                if len(batch) >= BATCH_SIZE:
+                    await sync_to_async(index.upsert, batch)
+                    seen += len(batch)
+                    batch = []
+            if batch:
+                await sync_to_async(index.upsert, batch)
+                seen += len(batch)
+        except RcError as e:
+            # a partial crawl must not sweep what it did not get to
+            LOGGER.error(f"Index crawl of {remote}:{root} failed: {e}")
+            return None
+        removed = await sync_to_async(index.sweep, root, generation, recursive)
+        now = time()
+        if recursive and not root:
+            # the crawl saw everything modified before it started
+            await sync_to_async(
+                index.set_meta, full_crawl=now, crawl_duration=now - start, checkpoint=start
+            )
+        entries = await sync_to_async(index.entries)
+        await sync_to_async(index.set_meta, updated=now, entries=entries)
+        if await sync_to_async(index.get_meta, "full_crawl"):
+            await sync_to_async(index.update_sizes, root, recursive)
+        LOGGER.info(
+            f"Indexed {remote}:{root}: {seen} entries, {removed} removed in {now - start:.1f}s"
+        )
+        return seen
+
+    async def delta(self, remote):
+        """Merge the files of a Drive ``remote`` modified since the last checkpoint into its index
+
+        Drive's search filters by modification time on its side, so a pass
+        costs one paged files.list of what changed instead of a walk of the
+        remote. Paths come from the parents' ids, which the index has.
+        """
+        async with self._crawl_lock:
+            self.crawling = f"{remote}: (delta)"
+            try:
+                return await self._delta(remote)
+            finally:
+                self.crawling = None
+
+    async def _drive_root(self, remote, conf, index):
+        """Drive id of the folder ``remote:`` lists, found once and kept in the index"""
+        root_id = (
+            conf.options.get("root_folder_id")
+            or conf.options.get("team_drive")
+            or await sync_to_async(index.get_meta, "root_id")
+        )
+        if root_id:
+            return root_id
+        items, err = await drive_query(remote, "'root' in parents and trashed = false")
+        if err is not None:
+            LOGGER.error(f"Could not find the root of {remote}: {err}")
+            return None
+        root_id = next((item["parents"][0] for item in items if item.get("parents")), None)
+        if root_id is not None:
+            await sync_to_async(index.set_meta, root_id=root_id)
+        return root_id
+
+    async def _delta(self, remote):
+        index = await sync_to_async(self.ready, remote)
+        conf = RCLONE_CONF.get(remote)
+        if index is None or conf is None or conf.type not in DELTA_BACKENDS:
+            return None
+        start = time()
+        root_id = await self._drive_root(remote, conf, index)
+        if root_id is None:
+            return None
+        checkpoint = await sync_to_async(index.get_meta, "checkpoint")
+        checkpoint = checkpoint or await sync_to_async(index.get_meta, "full_crawl")
+        since = datetime.fromtimestamp(checkpoint - DELTA_OVERLAP, timezone.utc)
+        items, err = await drive_query(
+            remote, f"modifiedTime > '{since.strftime('%Y-%m-%dT%H:%M:%S')}' and trashed = false"
+        )
+        if err is not None:
+            # the checkpoint stays, so the next pass covers this window again
+            LOGGER.error(f"Index delta of {remote} failed: {err}")
+            return None
+        ids = {item["id"] for item in items}
+        ids.update(parent for item in items for parent in item.get("parents") or ())
+        known = await sync_to_async(index.paths_of_ids, ids)
+        folders = {file_id: path for file_id, (path, is_dir) in known.items() if is_dir}
+        folders[root_id] = ""
+        # google docs get an export extension in rclone's paths, the crawl has them right
+        pending = [
+            item
+            for item in items
+            if item.get("mimeType") == FOLDER_MIME
+            or not item.get("mimeType", "").startswith(GOOGLE_APPS_MIME)
+        ]
+        entries = []
+        while pending:
+            left = []
+            for item in pending:
+                parent = folders.get((item.get("parents") or [None])[0])
+                if parent is None:
+                    left.append(item)
+                    continue
+                entry = drive_entry(item, parent)
+                if entry["IsDir"]:
+                    folders[item["id"]] = entry["Path"]
+                entries.append(entry)
+            if len(left) == len(pending):
+                break
+            pending = left
+        generation = await sync_to_async(index.next_generation)
+        rows = [entry_row(entry, "", generation) for entry in entries]
+        files = size = 0
+        for first in range(0, len(rows), BATCH_SIZE):
+            changed = await sync_to_async(index.apply_delta, rows[first : first + BATCH_SIZE])
+            files, size = files + changed[0], size + changed[1]
+        # a moved or renamed folder keeps its modtime, so do its contents
+        for entry in entries:
+            old = known.get(entry["ID"])
+            if entry["IsDir"] and old is not None and old[0] != entry["Path"]:
+                self.mark_dirty(remote, old[0])
+                self.mark_dirty(remote, entry["Path"], recursive=True)
+        now = time()
+        entries_total = await sync_to_async(index.entries)
+        await sync_to_async(index.set_meta, checkpoint=start, updated=now, entries=entries_total)
+        LOGGER.info(
+            f"Index delta of {remote}: {len(items)} changed, {len(entries)} merged, "
+            f"{len(pending)} outside the remote, {files:+} files {size:+} bytes "
+            f"in {now - start:.1f}s"
+        )
+        return len(entries)
+
+    async def crawl_all(self):
+        interval = config_dict["RCLONE_INDEX_INTERVAL"] * 3600
+        for remote in self.remotes():
+            last = await sync_to_async(self.last_crawl, remote)
+            if time() - last < interval * 0.9:
+                continue
+            try:
+                await self.crawl(remote)
+            except Exception as e:
+                LOGGER.error(f"Index crawl of {remote} failed: {e}")
+
+    async def delta_all(self):
+        interval = config_dict["RCLONE_INDEX_INTERVAL"] * 3600
+        for remote in self.remotes():
+            conf = RCLONE_CONF.get(remote)
+            if conf is None or conf.type not in DELTA_BACKENDS:
+                continue
+            last = await sync_to_async(self.last_crawl, remote)
+            # a full crawl that is due anyway covers the delta, with none there is nothing to update
+            if not last or time() - last >= interval * 0.9:
+                continue
+            try:
+                await self.delta(remote)
+            except Exception as e:
+                LOGGER.error(f"Index delta of {remote} failed: {e}")
+
+    async def refresh_dirty(self):
+        dirty, self.dirty = self.dirty, {}
+        for remote, folders in dirty.items():
+            if await sync_to_async(self.ready, remote) is None:
+                continue
+            for folder, recursive in folders.items():
+                try:
+                    await self.crawl(remote, folder, recursive)
+                except Exception as e:
+                    LOGGER.error(f"Index refresh of {remote}:{folder} failed: {e}")
+
+    def status(self, remote):
+        """One line about how fresh the index of ``remote`` is"""
+        index = self.ready(remote)
+        if index is None:
+            return "<i>No index yet, searched the remote directly</i>"
+        updated = index.get_meta("updated") or index.get_meta("full_crawl")
+        crawled = datetime.fromtimestamp(index.get_meta("full_crawl")).strftime("%d %b %H:%M")
+        ago = int(time() - updated)
+        return (
+            f"<i>Index: {index.get_meta('entries', 0)} entries, full crawl {crawled}, "
+            f"updated {ago // 60}m ago</i>"
+        )
+
+    def add_jobs(self):
+        hours = config_dict["RCLONE_INDEX_INTERVAL"]
+        if not hours:
+            return
+        mutation_listeners.append(self.mark_dirty)
+        scheduler.add_job(
+            self.crawl_all,
+            trigger=IntervalTrigger(hours=1),
+            id="rclone_index_crawl",
+            name="rclone metadata index",
+            misfire_grace_time=60,
+            max_instances=1,
+            next_run_time=datetime.now() + timedelta(seconds=60),
+            replace_existing=True,
+        )
+        if config_dict["RCLONE_INDEX_DELTA"]:
+            scheduler.add_job(
+                self.delta_all,
+                trigger=IntervalTrigger(minutes=config_dict["RCLONE_INDEX_DELTA"]),
+                id="rclone_index_delta",
+                name="rclone metadata index delta",
+                misfire_grace_time=60,
+                max_instances=1,
+                replace_existing=True,
+            )
+        scheduler.add_job(
+            self.refresh_dirty,
+            trigger=IntervalTrigger(minutes=2),
+            id="rclone_index_dirty",
+            name="rclone metadata index refresh",
+            misfire_grace_time=30,
+            max_instances=1,
+            replace_existing=True,
+        )
+
+
+INDEX = MetadataIndex()
@@ -0,0 +1,240 @@
+from asyncio import CancelledError, TimeoutError as WaitTimeout, current_task, get_running_loop, wait_for
+from bisect import insort
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from itertools import count
+from time import time
+
+from bot import LOGGER, config_dict
+
+INTERACTIVE, LIGHT, HEAVY, BACKGROUND = range(4)
+JOB_WAIT = 120  # seconds a menu action waits for a slot before giving up
+LANE_NAMES = ("interactive", "light", "heavy", "background")
+# rc methods by lane, anything else is LIGHT
+METHOD_LANES = {
+    "operations/list": INTERACTIVE,
+    "operations/stat": INTERACTIVE,
+    "operations/mkdir": INTERACTIVE,
+    "operations/movefile": INTERACTIVE,
+    "operations/publiclink": LIGHT,
+    "operations/about": LIGHT,
+    "operations/deletefile": LIGHT,
+    "operations/size": HEAVY,
+    "operations/purge": HEAVY,
+    "operations/delete": HEAVY,
+    "operations/rmdirs": HEAVY,
+    "operations/hashsum": HEAVY,
+    "sync/copy": HEAVY,
+    "sync/move": HEAVY,
+}
+
+# who the rclone work of the running handler is for, and how to tell them it is queued
+JOB_USER = ContextVar("rclone_job_user", default=None)
+JOB_QUEUED = ContextVar("rclone_job_queued", default=None)
+# whether that work is a background transfer, which has its own budget
+JOB_TRANSFER = ContextVar("rclone_job_transfer", default=False)
+
+
+class JobsBusy(TimeoutError):
+    """No slot freed up for a job within JOB_WAIT"""
+
+
+class Job:
+    __slots__ = ("lane", "user", "transfer", "task", "since", "future")
+
+    def __init__(self, lane, user, transfer=False):
+        self.lane = lane
+        self.user = user
+        self.transfer = transfer
+        self.task = current_task()
+        self.since = time()
+        self.future = None
+
+
+class JobScheduler:
+    """Admission control for rclone work: a global cap, a cap per user and lanes
+
+    Waiting jobs start in lane order (interactive listings before links and
+    mediainfo before size, purge and dedupe, background crawls last) and in
+    arrival order within a lane. Heavy and background jobs never take the last
+    slot, so a listing can always start. Jobs belong to the task that runs
+    them, which is what cancel() and the timeout of slot() cancel.
+
+    Background transfers count against a budget of their own, per user and
+    at most half the slots overall, so long copies don't lock their user
+    out of browsing. Menu work that finds no slot within JOB_WAIT seconds
+    raises JobsBusy instead of hanging.
+    """
+
+    def __init__(self, limit=None, per_user=None, wait=JOB_WAIT):
+        self.limit = limit or config_dict["RCLONE_JOBS"]
+        self.per_user = per_user or config_dict["RCLONE_USER_JOBS"]
+        self.heavy_limit = max(1, self.limit - 1)
+        self.transfer_limit = max(1, self.limit // 2)
+        self.wait = wait
+        self.active = set()
+        self.waiting = []
+        self.following = set()
+        self._seq = count()
+        self.started = self.queued = self.timeouts = self.cancelled = self.busy = 0
+
+    def _fits(self, job):
+        if len(self.active) >= self.limit:
+            return False
+        if job.lane >= HEAVY and sum(j.lane >= HEAVY for j in self.active) >= self.heavy_limit:
+            return False
+        if job.transfer and sum(j.transfer for j in self.active) >= self.transfer_limit:
+            return False
+        if job.user is not None and (
+            sum(j.user == job.user and j.transfer == job.transfer for j in self.active)
+            >= self.per_user
+        ):
+            return False
+        return True
+
+    def _wake(self):
+        for entry in list(self.waiting):
+            job = entry[2]
+            if self._fits(job):
+                self.waiting.remove(entry)
+                self.active.add(job)
+                job.future.set_result(None)
+
+    def position(self, job):
+        for i, entry in enumerate(self.waiting, 1):
+            if entry[2] is job:
+                return i
+        return 0
+
+    def _withdraw(self, job):
+        self.waiting = [entry for entry in self.waiting if entry[2] is not job]
+        if job in self.active:
+            self.active.discard(job)
+            self._wake()
+
+    async def _acquire(self, job):
+        if not any(entry[0] <= job.lane for entry in self.waiting) and self._fits(job):
+            self.active.add(job)
+            return
+        job.future = get_running_loop().create_future()
+        insort(self.waiting, (job.lane, next(self._seq), job))
+        # jobs ahead of it may only be waiting for their own user's slots
+        self._wake()
+        if job.future.done():
+            await job.future
+            job.since = time()
+            return
+        self.queued += 1
+        try:
+            notify = JOB_QUEUED.get()
+            if notify is not None and job.lane < BACKGROUND and not job.future.done():
+                try:
+                    await notify(self.position(job))
+                except Exception as e:
+                    LOGGER.error(f"Queue notice failed: {e}")
+            # crawls and transfers have their own status and may wait for long
+            if job.lane == BACKGROUND or job.transfer or not self.wait:
+                await job.future
+            else:
+                await wait_for(job.future, self.wait)
+        except WaitTimeout:
+            self._withdraw(job)
+            self.busy += 1
+            raise JobsBusy(
+                f"rclone is busy, no slot freed up within {self.wait}s. Try again later"
+            ) from None
+        except CancelledError:
+            self._withdraw(job)
+            self.cancelled += 1
+            raise
+        job.since = time()
+
+    @asynccontextmanager
+    async def slot(self, lane, timeout=None):
+        """Hold a slot in ``lane`` for the body, cancelled after ``timeout`` seconds"""
+        job = Job(lane, JOB_USER.get(), JOB_TRANSFER.get())
+        await self._acquire(job)
+        self.started += 1
+        expired = False
+
+        def expire():
+            nonlocal expired
+            expired = True
+            job.task.cancel()
+
+        timer = get_running_loop().call_later(timeout, expire) if timeout else None
+        try:
+            yield job
+        except CancelledError:
+            if expired:
+                self.timeouts += 1
+                if hasattr(job.task, "uncancel"):
+                    job.task.uncancel()
+                raise TimeoutError(f"rclone job timed out after {timeout}s") from None
+            self.cancelled += 1
+            raise
+        finally:
+            if timer is not None:
+                timer.cancel()
+            self.active.discard(job)
+            self._wake()
+
+    @contextmanager
+    def follow(self):
+        """Let cancel() reach the current task while it waits on shared work
+
+        For tasks that wait on a job started for several users, which holds
+        the slot under nobody's name. No slot is taken.
+        """
+        job = Job(None, JOB_USER.get())
+        self.following.add(job)
+        try:
+            yield
+        finally:
+            self.following.discard(job)
+
+    def cancel(self, user_id, keep=()):
+        """Cancel the running and waiting jobs of a user but those of the ``keep`` tasks, returns how many"""
+        me = current_task()
+        jobs = [j for j in self.active if j.user == user_id]
+        jobs += [entry[2] for entry in self.waiting if entry[2].user == user_id]
+        jobs += [j for j in self.following if j.user == user_id]
+        tasks = {job.task for job in jobs if job.task is not me and job.task not in keep}
+        for task in tasks:
+            task.cancel()
+        return len(tasks)
+
+    def stats(self):
+        now = time()
+        return {
+            "limit": self.limit,
+            "per_user": self.per_user,
+            "running": [(LANE_NAMES[j.lane], j.user, now - j.since) for j in self.active],
+            "waiting": [(LANE_NAMES[e[0]], e[2].user) for e in self.waiting],
+            "started": self.started,
+            "queued": self.queued,
+            "timeouts": self.timeouts,
+            "cancelled": self.cancelled,
+            "busy": self.busy,
+        }
+
+
+@contextmanager
+def job_context(user_id, on_queued=None, transfer=False):
+    """Run rclone jobs started inside the block for ``user_id``
+
+    ``on_queued(position)`` is awaited when one of them has to wait for a slot.
+    ``transfer`` puts them in the budget of background transfers.
+    """
+    user = JOB_USER.set(user_id)
+    queued = JOB_QUEUED.set(on_queued)
+    kind = JOB_TRANSFER.set(transfer)
+    try:
+        yield
+    finally:
+        JOB_USER.reset(user)
+        JOB_QUEUED.reset(queued)
+        JOB_TRANSFER.reset(kind)
+
+
+JOBS = JobScheduler()
@@ -0,0 +1,108 @@
+import sqlite3
+from asyncio import Semaphore, as_completed
+from os import makedirs, path as ospath
+from threading import Lock as ThreadLock
+from time import time
+
+from bot.helper.ext_utils.bot_utils import sync_to_async
+from bot.helper.rclone_utils.jobs import JOB_QUEUED
+from bot.helper.rclone_utils.rc import mutation_listeners, rclone_config, rclone_op
+
+LINKS_DB = "rclone_data/links.db"
+LINK_TTL = 30 * 86400
+FAILED_TTL = 600  # don't retry objects without a public link for a while
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS links (
+    remote TEXT NOT NULL,
+    path TEXT NOT NULL,
+    file_id TEXT,
+    url TEXT NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (remote, path)
+);
+"""
+
+
+class LinkResolver:
+    """Public links of remote objects, resolved concurrently and kept on disk
+
+    A cached link is reused while the object keeps the same file id (when the
+    backend has ids) and it is younger than LINK_TTL. Renames and deletes made
+    through the bot drop the links below the written path.
+    """
+
+    def __init__(self, path=LINKS_DB, concurrency=8):
+        makedirs(ospath.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+        self.lock = ThreadLock()
+        self.semaphore = Semaphore(concurrency)
+        self.failed = {}
+        mutation_listeners.append(self.forget)
+
+    def cached(self, remote, path, file_id=None):
+        with self.lock:
+            row = self.db.execute(
+                "SELECT url, file_id, created FROM links WHERE remote = ? AND path = ?",
+                (remote, path),
+            ).fetchone()
+        if row is None:
+            return None
+        url, cached_id, created = row
+        if time() - created > LINK_TTL or (file_id and cached_id and file_id != cached_id):
+            return None
+        return url
+
+    def store(self, remote, path, file_id, url):
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO links VALUES (?, ?, ?, ?, ?)",
+                (remote, path, file_id, url, time()),
+            )
+
+    def forget(self, remote, path=""):
+        path = path.strip("/")
+        with self.lock, self.db:
+            if not path:
+                self.db.execute("DELETE FROM links WHERE remote = ?", (remote,))
+            else:
+                self.db.execute(
+                    "DELETE FROM links WHERE remote = ? AND (path = ? OR substr(path, 1, ?) = ?)",
+                    (remote, path, len(path) + 1, f"{path}/"),
+                )
+
+    async def resolve(self, remote, path, file_id=None, timeout=10):
+        """Public link of ``remote:path``, None when the backend gives none"""
+        url = await sync_to_async(self.cached, remote, path, file_id)
+        if url is not None:
+            return url
+        if time() - self.failed.get((remote, path), 0) < FAILED_TTL:
+            return None
+        async with self.semaphore:
+            result, err = await rclone_op(
+                "operations/publiclink",
+                ["rclone", "link", f"--config={rclone_config}", f"{remote}:{path}"],
+                timeout=timeout,
+                fs=f"{remote}:",
+                remote=path,
+            )
+        if err is not None or not result.get("url"):
+            self.failed[(remote, path)] = time()
+            return None
+        await sync_to_async(self.store, remote, path, file_id, result["url"])
+        return result["url"]
+
+    async def resolve_many(self, remote, files):
+        """Yield ``(position, url)`` for ``files`` as their links resolve"""
+
+        async def resolve(position, file):
+            # runs in its own task, the search message is not a queue notice
+            JOB_QUEUED.set(None)
+            return position, await self.resolve(remote, file["Path"], file.get("ID"))
+
+        for done in as_completed([resolve(i, file) for i, file in enumerate(files)]):
+            yield await done
+
+
+LINKS = LinkResolver()
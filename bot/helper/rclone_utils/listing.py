@@ -0,0 +1,219 @@
+from array import array
+from asyncio import create_task, shield
+from contextvars import Context
+from heapq import nsmallest
+from sys import getsizeof, intern
+from time import time
+
+from bot import LOGGER
+from bot.helper.rclone_utils.jobs import JOB_QUEUED, JOBS
+from bot.helper.rclone_utils.rc import LISTINGS, rclone_config, rclone_op, stream_lsjson
+
+PAGE_SIZE = 10
+PARTIAL_SORT = 100  # pages up to this many entries are picked with a heap
+STREAM_THRESHOLD = 2000  # folders known to be smaller are listed through rcd
+LOADING = {}  # SharedLoad of the listings being loaded, by listing cache key
+
+
+class Listing:
+    """One folder listing kept in columns: names, sizes and directory flags
+
+    Entries are appended as rclone prints them. Pages are sorted on request:
+    the first pages of a complete listing come from a heap, deeper pages from
+    a full sort that is computed once per order and kept. Once complete a
+    Listing is never changed, so users browsing the same folder share it.
+    """
+
+    __slots__ = ("names", "sizes", "dirs", "complete", "truncated", "nbytes", "_orders")
+
+    def __init__(self):
+        self.names = []
+        self.sizes = array("q")
+        self.dirs = bytearray()
+        self.complete = False
+        self.truncated = False
+        self.nbytes = 200
+        self._orders = {}
+
+    @classmethod
+    def from_entries(cls, entries):
+        listing = cls()
+        for entry in entries:
+            listing.append(entry)
+        listing.complete = True
+        return listing
+
+    def append(self, entry):
+        name = intern(entry["Path"])
+        self.names.append(name)
+        self.sizes.append(entry.get("Size", -1))
+        self.dirs.append(1 if entry.get("IsDir") else 0)
+        self.nbytes += getsizeof(name) + 17
+
+    def __len__(self):
+        return len(self.names)
+
+    def is_dir(self, i):
+        return bool(self.dirs[i])
+
+    def _key(self, by_name):
+        if by_name:
+            return self.names.__getitem__
+        sizes = self.sizes
+        return lambda i: -sizes[i]
+
+    def page(self, offset, count=PAGE_SIZE, by_name=False):
+        """Positions of the entries on one page, biggest first unless ``by_name``"""
+        total = len(self)
+        if not self.complete:
+            # still loading, show entries in the order they arrived
+            return list(range(offset, min(offset + count, total)))
+        order = self._orders.get(by_name)
+        if order is None:
+            if offset + count <= PARTIAL_SORT and total > 4 * PARTIAL_SORT:
+                return nsmallest(offset + count, range(total), key=self._key(by_name))[offset:]
+            order = self._orders[by_name] = sorted(range(total), key=self._key(by_name))
+            self.nbytes += getsizeof(order)
+        return order[offset:offset + count]
+
+
+async def load_listing(
+    remote, path, listing=None, on_progress=None, progress_interval=5, small=False, max_bytes=None
+):
+    """List ``remote:path`` one level deep into a Listing
+
+    Folders known to be ``small`` go through rcd in one call. Others are read
+    from a streaming ``rclone lsjson`` so ``on_progress(listing)`` can show the
+    first page while the rest arrives; it is called once a page is loaded and
+    then every ``progress_interval`` seconds. Loading stops, marking the
+    listing truncated, once it takes ``max_bytes``; a folder that keeps
+    streaming is never cut off, only a stalled rclone is (see stream_lsjson).
+    Returns ``(listing, error)``.
+    """
+    listing = listing if listing is not None else Listing()
+    cmd = [
+        "rclone",
+        "lsjson",
+        f"--config={rclone_config}",
+        f"{remote}:{path}",
+        "--max-depth=1",
+        "--no-modtime",
+        "--no-mimetype",
+    ]
+    if small:
+        result, err = await rclone_op(
+            "operations/list",
+            cmd,
+            fs=f"{remote}:{path}",
+            remote="",
+            opt={"noModTime": True, "noMimeType": True},
+        )
+        if err is not None:
+            return None, err
+        for entry in result["list"]:
+            if max_bytes and listing.nbytes > max_bytes:
+                listing.truncated = True
+                break
+            listing.append(entry)
+        listing.complete = True
+        return listing, None
+    last_progress = None
+    entries = stream_lsjson(cmd)
+    try:
+        async for entry in entries:
+            listing.append(entry)
+            if max_bytes and listing.nbytes > max_bytes:
+                listing.truncated = True
+                break
+            if on_progress is None:
+                continue
+            if last_progress is None:
+                if len(listing) < PAGE_SIZE:
+                    continue
+            elif time() - last_progress < progress_interval:
+                continue
+            last_progress = time()
+            await on_progress(listing)
+    except Exception as e:
+        return None, str(e)
+    finally:
+        await entries.aclose()
+    listing.complete = True
+    return listing, None
+
+
+class SharedLoad:
+    """One folder load shared by every user opening that folder meanwhile
+
+    The load runs in a context of its own, so it holds its rclone slot under
+    no user and the cancel of one user doesn't stop it for the others; it is
+    cancelled once the last waiting user leaves. Progress and queue notices
+    go to every waiting user.
+    """
+
+    __slots__ = ("key", "version", "listing", "task", "waiters", "progress", "queued", "abandoned")
+
+    def __init__(self, key, remote, path, small=False, max_bytes=None):
+        self.key = key
+        # writes after this make the listing unfit for the cache, see ListingCache.put
+        self.version = LISTINGS.version(remote)
+        self.listing = Listing()
+        self.waiters = 0
+        self.progress = []
+        self.queued = []
+        self.abandoned = False
+        context = Context()
+        context.run(JOB_QUEUED.set, self._on_queued)
+        self.task = context.run(
+            create_task,
+            load_listing(
+                remote, path, self.listing, self._on_progress, small=small, max_bytes=max_bytes
+            ),
+        )
+        self.task.add_done_callback(self._done)
+
+    def _done(self, _):
+        if LOADING.get(self.key) is self:
+            del LOADING[self.key]
+
+    async def _notify(self, callbacks, *args):
+        for callback in list(callbacks):
+            try:
+                await callback(*args)
+            except Exception as e:
+                LOGGER.error(f"Listing notice failed: {e}")
+
+    async def _on_progress(self, listing):
+        await self._notify(self.progress, listing)
+
+    async def _on_queued(self, position):
+        await self._notify(self.queued, position)
+
+    async def wait(self, on_progress=None):
+        """``(listing, error)`` once loaded, ``on_progress(listing)`` is awaited meanwhile"""
+        on_queued = JOB_QUEUED.get()
+        self.waiters += 1
+        if on_progress is not None:
+            self.progress.append(on_progress)
+        if on_queued is not None:
+            self.queued.append(on_queued)
+        try:
+            with JOBS.follow():
+                return await shield(self.task)
+        finally:
+            self.waiters -= 1
+            if on_progress is not None:
+                self.progress.remove(on_progress)
+            if on_queued is not None:
+                self.queued.remove(on_queued)
+            if not self.waiters and not self.task.done():
+                self.abandoned = True
+                self.task.cancel()
+
+
+def start_loading(key, remote, path, small=False, max_bytes=None):
+    """SharedLoad of ``key``, joining a load already running"""
+    load = LOADING.get(key)
+    if load is None or load.abandoned:
+        load = LOADING[key] = SharedLoad(key, remote, path, small, max_bytes)
+    return load
@@ -0,0 +1,262 @@
+import sqlite3
+from asyncio import gather, wait_for, TimeoutError
+from asyncio.subprocess import DEVNULL, PIPE, create_subprocess_exec as exec
+from json import dumps, loads
+from os import O_WRONLY, SEEK_SET, close, lseek, makedirs as makedirs_sync, open as osopen, path as ospath
+from secrets import token_hex
+from threading import Lock as ThreadLock
+from time import time
+
+from aiofiles.os import makedirs
+from aioshutil import rmtree
+
+from bot import LOGGER
+from bot.helper.ext_utils.bot_utils import cmd_exec, sync_to_async
+from bot.helper.rclone_utils.jobs import JOBS, LIGHT
+from bot.helper.rclone_utils.rc import mutation_listeners, rclone_config, rclone_op
+
+PROBE_DIR = "rclone_data/probe"
+MEDIAINFO_DB = "rclone_data/mediainfo.db"
+MEDIAINFO_CACHE_SIZE = 64 * 1024 * 1024
+MEDIAINFO_TTL = 90 * 86400
+MEDIAINFO_TIMEOUT = 60
+HEAD_BYTES = 10 * 1024 * 1024
+TAIL_BYTES = 4 * 1024 * 1024
+# containers that may keep their index (moov atom) at the end of the file
+TAIL_EXTENSIONS = {".mp4", ".m4v", ".m4a", ".mov", ".3gp"}
+
+
+def byte_ranges(name, size):
+    """``(offset, count)`` ranges mediainfo needs from a file of ``size`` bytes"""
+    if size is None or size < 0:
+        return [(0, HEAD_BYTES)]
+    if size <= HEAD_BYTES + TAIL_BYTES:
+        return [(0, size)]
+    ranges = [(0, HEAD_BYTES)]
+    if ospath.splitext(name)[1].lower() in TAIL_EXTENSIONS:
+        ranges.append((size - TAIL_BYTES, TAIL_BYTES))
+    return ranges
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS mediainfo (
+    remote TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    modtime TEXT NOT NULL,
+    id TEXT NOT NULL,
+    report TEXT NOT NULL,
+    json TEXT NOT NULL,
+    bytes INTEGER NOT NULL,
+    created REAL NOT NULL,
+    used REAL NOT NULL,
+    PRIMARY KEY (remote, path)
+);
+CREATE INDEX IF NOT EXISTS mediainfo_used ON mediainfo(used);
+"""
+
+
+async def stat_object(remote, path):
+    """lsjson item of ``remote:path``, None when it can't be read"""
+    result, err = await rclone_op(
+        "operations/stat",
+        ["rclone", "lsjson", "--stat", f"--config={rclone_config}", f"{remote}:{path}"],
+        timeout=30,
+        fs=f"{remote}:",
+        remote=path,
+    )
+    if err is not None:
+        LOGGER.error(f"stat {remote}:{path}: {err}")
+        return None
+    return result.get("item")
+
+
+async def fetch_range(remote, path, dest, offset, count):
+    """Write bytes ``offset..offset+count`` of ``remote:path`` at the same offset of ``dest``
+
+    rclone writes straight into the file through a descriptor positioned at
+    ``offset``, so the data never passes through the bot.
+    """
+    fd = osopen(dest, O_WRONLY)
+    try:
+        lseek(fd, offset, SEEK_SET)
+        process = await exec(
+            "rclone",
+            "cat",
+            f"--config={rclone_config}",
+            f"--offset={offset}",
+            f"--count={count}",
+            f"{remote}:{path}",
+            stdin=DEVNULL,
+            stdout=fd,
+            stderr=PIPE,
+        )
+    finally:
+        close(fd)
+    try:
+        _, stderr = await process.communicate()
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+    if process.returncode != 0:
+        raise RuntimeError(stderr.decode().strip()[:200] or "rclone cat failed")
+
+
+async def remote_mediainfo(remote, path, item=None, timeout=MEDIAINFO_TIMEOUT):
+    """mediainfo report of ``remote:path`` read from the byte ranges it needs
+
+    The ranges land in a sparse file as big as the remote object, so
+    mediainfo sees the real size and finds a trailing MP4/MOV index where it
+    expects it. Returns ``(report, error)``.
+    """
+    if item is None:
+        item = await stat_object(remote, path)
+    size = item.get("Size") if item else None
+    name = ospath.basename(path.rstrip("/"))
+    workdir = ospath.join(PROBE_DIR, token_hex(8))
+    dest = ospath.join(workdir, name)
+    await makedirs(workdir, exist_ok=True)
+    try:
+        with open(dest, "wb") as f:
+            if size is not None and size > 0:
+                f.truncate(size)
+        async with JOBS.slot(LIGHT):
+            await wait_for(
+                gather(
+                    *(
+                        fetch_range(remote, path, dest, offset, count)
+                        for offset, count in byte_ranges(name, size)
+                    )
+                ),
+                timeout=timeout,
+            )
+            stdout, stderr, code = await wait_for(cmd_exec(["mediainfo", dest]), timeout=timeout)
+    except TimeoutError:
+        return None, "Operation timed out"
+    except Exception as e:
+        return None, str(e)
+    finally:
+        await rmtree(workdir, ignore_errors=True)
+    if code != 0:
+        return None, stderr[:200] or "mediainfo failed"
+    return stdout.replace(dest, f"{remote}:{path}"), None
+
+
+def parse_report(report):
+    """mediainfo's text report as a list of sections, each a dict of its fields"""
+    sections = []
+    for block in report.strip().split("\n\n"):
+        lines = block.strip().splitlines()
+        if not lines:
+            continue
+        section = {"@type": lines[0].strip()}
+        for line in lines[1:]:
+            key, sep, value = line.partition(":")
+            if sep:
+                section[key.strip()] = value.strip()
+        sections.append(section)
+    return sections
+
+
+class MediainfoCache:
+    """mediainfo reports of remote objects, kept on disk
+
+    Entries are tied to the object's size, modification time and id (when the
+    backend has ids), so a replaced file is probed again. The least recently
+    used reports are dropped once the cache grows past ``max_bytes``, and
+    writes through the bot forget the reports below the written path.
+    """
+
+    def __init__(self, path=MEDIAINFO_DB, max_bytes=MEDIAINFO_CACHE_SIZE, ttl=MEDIAINFO_TTL):
+        makedirs_sync(ospath.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+        self.lock = ThreadLock()
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = self.misses = 0
+        mutation_listeners.append(self.forget)
+
+    @staticmethod
+    def identity(item):
+        return item.get("Size", -1), item.get("ModTime") or "", item.get("ID") or ""
+
+    def get(self, remote, path, item):
+        """Cached ``(report, sections)`` of the object ``item`` describes, or None"""
+        with self.lock:
+            row = self.db.execute(
+                "SELECT size, modtime, id, report, json, created FROM mediainfo "
+                "WHERE remote = ? AND path = ?",
+                (remote, path),
+            ).fetchone()
+            if row is None or row[:3] != self.identity(item) or time() - row[5] > self.ttl:
+                self.misses += 1
+                return None
+            with self.db:
+                self.db.execute(
+                    "UPDATE mediainfo SET used = ? WHERE remote = ? AND path = ?",
+                    (time(), remote, path),
+                )
+        self.hits += 1
+        return row[3], loads(row[4])
+
+    def put(self, remote, path, item, report):
+        sections = parse_report(report)
+        data = dumps(sections, ensure_ascii=False)
+        now = time()
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO mediainfo VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (remote, path, *self.identity(item), report, data, len(report) + len(data), now, now),
+            )
+            self.evict()
+        return sections
+
+    def evict(self):
+        self.db.execute("DELETE FROM mediainfo WHERE created < ?", (time() - self.ttl,))
+        total = self.db.execute("SELECT COALESCE(SUM(bytes), 0) FROM mediainfo").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # oldest used first until the cache fits again
+        excess = total - self.max_bytes
+        for remote, path, size in self.db.execute(
+            "SELECT remote, path, bytes FROM mediainfo ORDER BY used"
+        ).fetchall():
+            self.db.execute("DELETE FROM mediainfo WHERE remote = ? AND path = ?", (remote, path))
+            excess -= size
+            if excess <= 0:
+                break
+
+    def forget(self, remote, path=""):
+        path = path.strip("/")
+        with self.lock, self.db:
+            if not path:
+                self.db.execute("DELETE FROM mediainfo WHERE remote = ?", (remote,))
+            else:
+                self.db.execute(
+                    "DELETE FROM mediainfo WHERE remote = ? AND (path = ? OR substr(path, 1, ?) = ?)",
+                    (remote, path, len(path) + 1, f"{path}/"),
+                )
+
+    def stats(self):
+        with self.lock:
+            entries, size = self.db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM mediainfo"
+            ).fetchone()
+        return {"entries": entries, "bytes": size, "hits": self.hits, "misses": self.misses}
+
+    async def report(self, remote, path, timeout=MEDIAINFO_TIMEOUT):
+        """``(report, error, cached)`` for ``remote:path``, probing it on a miss"""
+        item = await stat_object(remote, path)
+        if item is not None:
+            cached = await sync_to_async(self.get, remote, path, item)
+            if cached is not None:
+                return cached[0], None, True
+        report, err = await remote_mediainfo(remote, path, item, timeout)
+        if err is None and report and item is not None:
+            await sync_to_async(self.put, remote, path, item, report)
+        return report, err, False
+
+
+MEDIAINFO = MediainfoCache()
@@ -0,0 +1,147 @@
+from hashlib import sha1
+from os import listdir, makedirs as makedirs_sync, path as ospath, remove, replace, scandir, utime
+from secrets import token_hex
+from threading import Lock as ThreadLock
+
+from PIL import Image
+from aioshutil import rmtree
+
+from bot import LOGGER
+from bot.helper.ext_utils.bot_utils import sync_to_async
+from bot.helper.ext_utils.media_utils import create_thumbnail, take_ss
+from bot.helper.rclone_utils.jobs import JOBS, LIGHT
+from bot.helper.rclone_utils.mediainfo import stat_object
+from bot.helper.rclone_utils.rc import SERVER
+
+PREVIEW_DIR = "rclone_data/previews"
+PREVIEW_CACHE_SIZE = 256 * 1024 * 1024
+PREVIEW_SHOTS = 6
+SHEET_COLUMNS = 2
+SHEET_WIDTH = 640  # width of each screenshot on the sheet
+VIDEO_EXTENSIONS = {
+    ".mkv", ".mp4", ".m4v", ".mov", ".avi", ".webm", ".ts",
+    ".m2ts", ".wmv", ".flv", ".mpg", ".mpeg", ".3gp",
+}
+
+
+def is_video(name):
+    return ospath.splitext(name)[1].lower() in VIDEO_EXTENSIONS
+
+
+def make_sheet(images, dest, columns=SHEET_COLUMNS, width=SHEET_WIDTH):
+    """Tile ``images`` into one JPEG at ``dest``, ``columns`` wide"""
+    frames = []
+    for image in images:
+        with Image.open(image) as frame:
+            frame = frame.convert("RGB")
+            frames.append(frame.resize((width, max(1, frame.height * width // frame.width))))
+    height = max(frame.height for frame in frames)
+    rows = -(-len(frames) // columns)
+    sheet = Image.new("RGB", (width * min(columns, len(frames)), height * rows))
+    for i, frame in enumerate(frames):
+        sheet.paste(frame, ((i % columns) * width, (i // columns) * height))
+    sheet.save(dest, "JPEG", quality=85)
+
+
+class PreviewCache:
+    """Screenshot sheets of remote videos, kept on disk by object identity
+
+    The file name is a digest of the remote path, size, modification time and
+    id, so a replaced video gets a new sheet and the old one just ages out.
+    Sheets are dropped least recently used first past ``max_bytes``.
+    """
+
+    def __init__(self, directory=PREVIEW_DIR, max_bytes=PREVIEW_CACHE_SIZE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = ThreadLock()
+        self.hits = self.misses = 0
+        makedirs_sync(directory, exist_ok=True)
+
+    def path(self, remote, path, item):
+        key = "\0".join(
+            str(part)
+            for part in (remote, path, item.get("Size", -1), item.get("ModTime"), item.get("ID"))
+        )
+        return ospath.join(self.directory, f"{sha1(key.encode()).hexdigest()}.jpg")
+
+    def get(self, remote, path, item):
+        sheet = self.path(remote, path, item)
+        if not ospath.exists(sheet):
+            self.misses += 1
+            return None
+        utime(sheet)
+        self.hits += 1
+        return sheet
+
+    def put(self, remote, path, item, image):
+        sheet = self.path(remote, path, item)
+        replace(image, sheet)
+        self.evict()
+        return sheet
+
+    def evict(self):
+        with self.lock:
+            # tmp_ files are previews still being made
+            files = [
+                entry
+                for entry in scandir(self.directory)
+                if entry.is_file() and not entry.name.startswith("tmp_")
+            ]
+            total = sum(entry.stat().st_size for entry in files)
+            for entry in sorted(files, key=lambda e: e.stat().st_mtime):
+                if total <= self.max_bytes:
+                    break
+                total -= entry.stat().st_size
+                remove(entry.path)
+
+    def stats(self):
+        files = [entry for entry in scandir(self.directory) if entry.is_file()]
+        return {
+            "entries": len(files),
+            "bytes": sum(entry.stat().st_size for entry in files),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    async def preview(self, remote, path, shots=PREVIEW_SHOTS):
+        """``(sheet, error, cached)`` for the remote video ``remote:path``
+
+        ffmpeg reads the video straight from the serving rclone daemon with range
+        requests and seeks before decoding, so only the container index and
+        the frames around each screenshot are fetched.
+        """
+        item = await stat_object(remote, path)
+        if item is None:
+            return None, "Could not read the file", False
+        sheet = await sync_to_async(self.get, remote, path, item)
+        if sheet is not None:
+            return sheet, None, True
+        if not await SERVER.ready():
+            return None, "Previews need the rclone daemon, try again later", False
+        url = SERVER.serve_url(remote, path)
+        workdir = ospath.join(self.directory, f"tmp_{token_hex(8)}")
+        dest = f"{workdir}.jpg"
+        try:
+            async with JOBS.slot(LIGHT):
+                shots_dir = await take_ss(url, shots, f"{workdir}/")
+                if shots_dir:
+                    images = sorted(ospath.join(shots_dir, name) for name in listdir(shots_dir))
+                    await sync_to_async(make_sheet, images, dest)
+                else:
+                    # no duration in the container, one frame from near the start
+                    thumbnail = await create_thumbnail(url, None)
+                    if thumbnail is None:
+                        return None, "ffmpeg could not read this video", False
+                    replace(thumbnail, dest)
+        except Exception as e:
+            LOGGER.error(f"Preview of {remote}:{path} failed: {e}")
+            if ospath.exists(dest):
+                remove(dest)
+            return None, str(e), False
+        finally:
+            await rmtree(workdir, ignore_errors=True)
+        return await sync_to_async(self.put, remote, path, item, dest), None, False
+
+
+PREVIEWS = PreviewCache()
@@ -0,0 +1,155 @@
+import asyncio
+from asyncio import CancelledError, create_task
+from asyncio.subprocess import PIPE, create_subprocess_exec as exec
+from collections import deque
+from json import JSONDecodeError, loads
+from time import time
+
+from aiohttp import ClientError
+
+from bot import LOGGER
+from bot.helper.rclone_utils.jobs import HEAVY, JOBS
+from bot.helper.rclone_utils.rc import CLI_RESULTS, DAEMON, RcError, invalidate_listings
+
+STATS_INTERVAL = 2  # seconds between rclone stats
+PROGRESS_INTERVAL = 5  # seconds between progress callbacks
+STALL_TIMEOUT = 180  # stop a job whose stats did not move for this long
+# stats counters that show a job is still getting somewhere
+PROGRESS_KEYS = ("listed", "checks", "deletes", "deletedDirs", "renames", "transfers", "bytes")
+
+
+def readable_time(seconds):
+    seconds = int(seconds or 0)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m {seconds}s" if minutes else f"{seconds}s"
+
+
+def stats_marker(stats):
+    return tuple(stats.get(key, 0) for key in PROGRESS_KEYS)
+
+
+class ProgressWatch:
+    """Throttles progress callbacks and notices when a job stops moving"""
+
+    def __init__(self, on_progress, stall=STALL_TIMEOUT, interval=PROGRESS_INTERVAL):
+        self.on_progress = on_progress
+        self.stall = stall
+        self.interval = interval
+        self.marker = None
+        self.moved = time()
+        self.reported = 0
+
+    @property
+    def stalled(self):
+        return self.stall and time() - self.moved > self.stall
+
+    async def update(self, stats):
+        marker = stats_marker(stats)
+        if marker != self.marker:
+            self.marker = marker
+            self.moved = time()
+        if self.on_progress is None or time() - self.reported < self.interval:
+            return
+        self.reported = time()
+        try:
+            await self.on_progress(stats)
+        except Exception as e:
+            LOGGER.error(f"Progress update failed: {e}")
+
+
+async def _rc_job(method, params, watch):
+    started = await DAEMON.call(method, _async=True, **params)
+    jobid = started["jobid"]
+    try:
+        while True:
+            await asyncio.sleep(STATS_INTERVAL)
+            status = await DAEMON.call("job/status", timeout=30, jobid=jobid)
+            if status.get("finished"):
+                if not status.get("success"):
+                    return None, status.get("error") or "rclone job failed"
+                return status.get("output") or {}, None
+            await watch.update(await DAEMON.call("core/stats", timeout=30, group=f"job/{jobid}"))
+            if watch.stalled:
+                await DAEMON.call("job/stop", timeout=30, jobid=jobid)
+                return None, f"No progress for {readable_time(watch.stall)}, stopped"
+    except CancelledError:
+        try:
+            await DAEMON.call("job/stop", timeout=10, jobid=jobid)
+        except Exception as e:
+            LOGGER.error(f"Could not stop rc job {jobid}: {e}")
+        raise
+
+
+async def _cli_job(method, cmd, watch):
+    process = await exec(
+        *cmd,
+        "--use-json-log",
+        f"--stats={STATS_INTERVAL}s",
+        "--stats-log-level=NOTICE",
+        stdout=PIPE,
+        stderr=PIPE,
+        limit=1024 * 1024,
+    )
+    stdout = create_task(process.stdout.read())
+    errors = deque(maxlen=10)
+    try:
+        while True:
+            try:
+                line = await asyncio.wait_for(process.stderr.readline(), STATS_INTERVAL * 5)
+            except asyncio.TimeoutError:
+                line = None
+            if line == b"":
+                break
+            if line:
+                try:
+                    log = loads(line)
+                except JSONDecodeError:
+                    errors.append(line.decode(errors="replace").strip())
+                    continue
+                if "stats" in log:
+                    await watch.update(log["stats"])
+                elif log.get("level") in ("error", "critical"):
+                    errors.append(log.get("msg", "").strip())
+            if watch.stalled:
+                return None, f"No progress for {readable_time(watch.stall)}, stopped"
+        await process.wait()
+        out = (await stdout).decode().strip()
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        stdout.cancel()
+    if process.returncode != 0:
+        return None, " ".join(errors) or f"rclone exited with {process.returncode}"
+    return CLI_RESULTS.get(method, lambda out: {})(out), None
+
+
+async def rclone_progress_op(method, cmd, on_progress=None, lane=HEAVY, stall=STALL_TIMEOUT, **params):
+    """rclone_op for long operations, reporting rclone's stats while they run
+
+    On the daemon the method runs as an async rc job polled through
+    ``core/stats``; without it ``cmd`` runs with JSON logs and its stats lines
+    are parsed as they come. ``on_progress(stats)`` is awaited at most every
+    PROGRESS_INTERVAL seconds. There is no overall timeout: a job is stopped
+    only once its counters did not move for ``stall`` seconds, or when the
+    task is cancelled. ``method`` None always runs ``cmd``.
+    Returns ``(result, error)`` like rclone_op.
+    """
+    watch = ProgressWatch(on_progress, stall)
+    try:
+        async with JOBS.slot(lane):
+            if method is not None and await DAEMON.ready():
+                try:
+                    return await _rc_job(method, params, watch)
+                except RcError as e:
+                    return None, str(e)
+                except ClientError as e:
+                    LOGGER.error(f"rc connection error, falling back to rclone: {e}")
+            return await _cli_job(method, cmd, watch)
+    finally:
+        if method is not None:
+            invalidate_listings(method, params)
+
@@ -0,0 +1,359 @@
+import asyncio
+from asyncio import create_task
+from asyncio.subprocess import DEVNULL, PIPE, create_subprocess_exec as exec
+from collections import deque
+from contextlib import asynccontextmanager
+from json import JSONDecodeError, loads
+from os import environ
+from secrets import token_urlsafe
+from socket import socket
+from time import time
+from urllib.parse import quote
+
+from aiohttp import BasicAuth, ClientError, ClientSession, ClientTimeout, ContentTypeError, TCPConnector
+
+from bot import LOGGER
+from bot.helper.rclone_utils.cache import ListingCache, split_fs
+from bot.helper.rclone_utils.config import RCLONE_CONF, rclone_config
+from bot.helper.rclone_utils.jobs import HEAVY, INTERACTIVE, JOBS, LIGHT, METHOD_LANES, JobsBusy
+
+RCLONE_TIMEOUT = 300  # 5 minutes default timeout
+RCD_RETRY = 60  # seconds before trying to start a failed daemon again
+LISTINGS = ListingCache(config=RCLONE_CONF)
+# rc methods that change a remote, with the fs/path parameters they write to
+MUTATIONS = {
+    "operations/mkdir": [("fs", "remote")],
+    "operations/rmdir": [("fs", "remote")],
+    "operations/rmdirs": [("fs", "remote")],
+    "operations/purge": [("fs", "remote")],
+    "operations/delete": [("fs", None)],
+    "operations/deletefile": [("fs", "remote")],
+    "operations/copyfile": [("dstFs", "dstRemote")],
+    "operations/movefile": [("srcFs", "srcRemote"), ("dstFs", "dstRemote")],
+    "sync/copy": [("dstFs", None)],
+    "sync/move": [("srcFs", None), ("dstFs", None)],
+}
+
+
+class RcError(Exception):
+    """An rc call the daemon answered with an error"""
+
+    def __init__(self, message, status=500):
+        super().__init__(message)
+        self.status = status
+
+
+@asynccontextmanager
+async def rclone_process(*args, timeout=RCLONE_TIMEOUT):
+    """Context manager for rclone processes with proper cleanup"""
+    process = None
+    try:
+        process = await exec(*args, stdout=PIPE, stderr=PIPE)
+        yield process
+    except Exception as e:
+        LOGGER.error(f"Process error: {e}")
+        raise
+    finally:
+        if process and process.returncode is None:
+            try:
+                process.terminate()
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=5)
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+            except Exception as e:
+                LOGGER.error(f"Process cleanup error: {e}")
+
+
+async def execute_rclone_cmd(cmd, timeout=RCLONE_TIMEOUT):
+    """Execute rclone command with error handling"""
+    try:
+        async with rclone_process(*cmd, timeout=timeout) as process:
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(), timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                LOGGER.error(f"Command timeout: {' '.join(cmd)}")
+                return None, "Operation timed out", -1
+
+            return_code = process.returncode
+            stdout = stdout.decode().strip()
+            stderr = stderr.decode().strip()
+
+            return stdout, stderr, return_code
+
+    except Exception as e:
+        LOGGER.error(f"Command execution error: {e}")
+        return None, str(e), -1
+
+
+def parse_lsjson_line(line):
+    """One entry of ``rclone lsjson`` output, which prints an entry per line"""
+    line = line.strip().rstrip(",")
+    if not line or line in ("[", "]"):
+        return None
+    return loads(line)
+
+
+async def stream_lsjson(cmd, lane=INTERACTIVE, stall=RCLONE_TIMEOUT):
+    """Yield the entries of an ``rclone lsjson`` command as rclone prints them
+
+    Raises RcError with the last lines of rclone's log when it fails, after
+    the entries it managed to print. The process holds a JOBS slot in ``lane``
+    and is killed when it prints nothing for ``stall`` seconds, so a hung
+    remote doesn't keep the slot.
+    """
+    async with JOBS.slot(lane):
+        process = await exec(*cmd, stdout=PIPE, stderr=PIPE, limit=1024 * 1024)
+        errors = deque(maxlen=20)
+
+        async def read_errors():
+            async for line in process.stderr:
+                errors.append(line.decode(errors="replace").strip())
+
+        error_reader = create_task(read_errors())
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(process.stdout.readline(), timeout=stall)
+                except asyncio.TimeoutError:
+                    raise RcError(f"rclone printed nothing for {stall}s") from None
+                if not line:
+                    break
+                entry = parse_lsjson_line(line.decode())
+                if entry is not None:
+                    yield entry
+            try:
+                await asyncio.wait_for(process.wait(), timeout=stall)
+            except asyncio.TimeoutError:
+                raise RcError(f"rclone did not exit {stall}s after its listing") from None
+            await asyncio.wait_for(error_reader, timeout=5)
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            error_reader.cancel()
+    if process.returncode != 0:
+        raise RcError(" ".join(errors) or f"rclone exited with {process.returncode}")
+
+
+class RcloneDaemon:
+    """One long-lived ``rclone rcd`` shared by every rclone action of the bot
+
+    Backend logins and the directory cache of the daemon survive between
+    requests, unlike a fresh process per command. It listens on a random
+    localhost port with random credentials, passed in its environment so
+    they don't show in the process list, is started on first use and
+    restarted lazily if it dies; until then callers fall back to subprocesses.
+
+    With ``serve`` it is a second daemon that only serves remote objects over
+    HTTP with range requests, for tools like ffmpeg that read only the parts
+    of a file they need. It has no credentials, so URLs handed to those tools
+    (and their logs and command lines) hold none; without them rclone refuses
+    every rc method that needs authentication.
+    """
+
+    def __init__(self, config=rclone_config, host="127.0.0.1", connections=20, serve=False):
+        self.config = config
+        self.serve = serve
+        self.host = host
+        self.connections = connections
+        self.port = None
+        self.url = None
+        self.auth = None
+        self.process = None
+        self.session = None
+        self._failed_at = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def running(self):
+        return self.process is not None and self.process.returncode is None
+
+    @staticmethod
+    def _free_port(host):
+        with socket() as sock:
+            sock.bind((host, 0))
+            return sock.getsockname()[1]
+
+    async def start(self):
+        self.port = self._free_port(self.host)
+        self.url = f"http://{self.host}:{self.port}/"
+        cmd = ["rclone", "rcd", f"--config={self.config}", f"--rc-addr={self.host}:{self.port}"]
+        env = dict(environ)
+        if self.serve:
+            self.auth = None
+            cmd.append("--rc-serve")
+        else:
+            user, password = token_urlsafe(12), token_urlsafe(24)
+            self.auth = BasicAuth(user, password)
+            env.update(RCLONE_RC_USER=user, RCLONE_RC_PASS=password)
+        self.process = await exec(
+            *cmd,
+            "--log-level=ERROR",
+            env=env,
+            stdin=DEVNULL,
+            stdout=DEVNULL,
+            stderr=DEVNULL,
+        )
+        if self.session is None or self.session.closed:
+            self.session = ClientSession(
+                connector=TCPConnector(limit=self.connections)
+            )
+        for _ in range(50):
+            if not self.running:
+                break
+            try:
+                await self.call("rc/noop", timeout=2)
+                kind = "serving objects" if self.serve else "listening"
+                LOGGER.info(f"rclone rcd {kind} on {self.host}:{self.port}")
+                return True
+            except (ClientError, asyncio.TimeoutError, RcError):
+                await asyncio.sleep(0.2)
+        LOGGER.error("rclone rcd did not start, using rclone subprocesses")
+        await self.stop()
+        return False
+
+    async def ready(self):
+        """Whether the daemon can take calls, starting it when needed"""
+        if self.running:
+            return True
+        if time() - self._failed_at < RCD_RETRY:
+            return False
+        async with self._lock:
+            if self.running:
+                return True
+            try:
+                if await self.start():
+                    return True
+            except Exception as e:
+                LOGGER.error(f"Could not start rclone rcd: {e}")
+            self._failed_at = time()
+            return False
+
+    def serve_url(self, remote, path):
+        """HTTP URL of the object ``remote:path`` on the running serving daemon"""
+        return f"{self.url}{quote(f'[{remote}:]', safe='')}/{quote(path)}"
+
+    async def call(self, method, timeout=RCLONE_TIMEOUT, **params):
+        async with self.session.post(
+            f"{self.url}{method}",
+            json=params,
+            auth=self.auth,
+            timeout=ClientTimeout(total=timeout),
+        ) as response:
+            try:
+                data = await response.json(content_type=None)
+            except (ContentTypeError, JSONDecodeError, UnicodeDecodeError):
+                # a proxy or a dying daemon answering with a page instead of JSON
+                text = (await response.text(errors="replace")).strip()
+                raise RcError(
+                    f"{method}: {response.status} {response.reason}: {text[:200]}", response.status
+                ) from None
+            if response.status != 200:
+                raise RcError(
+                    (data or {}).get("error", response.reason), response.status
+                )
+            return data or {}
+
+    async def stop(self):
+        if self.running:
+            self.process.terminate()
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                self.process.kill()
+        self.process = None
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+
+DAEMON = RcloneDaemon()
+SERVER = RcloneDaemon(connections=4, serve=True)
+
+# rc result shapes built from the output of the equivalent rclone command
+CLI_RESULTS = {
+    "operations/list": lambda out: {"list": loads(out) if out else []},
+    "operations/about": lambda out: loads(out) if out else {},
+    "operations/size": lambda out: loads(out) if out else {},
+    "operations/publiclink": lambda out: {"url": out},
+    "operations/stat": lambda out: {"item": loads(out) if out else None},
+    "operations/hashsum": lambda out: {"hashsum": out.splitlines()},
+    "backend/command": lambda out: {"result": loads(out) if out else None},
+}
+
+
+mutation_listeners = []  # called with (remote, path) after a write
+
+
+def invalidate_listings(method, params):
+    for fs_key, path_key in MUTATIONS.get(method, ()):
+        if fs_key in params:
+            notify_mutation(*split_fs(params[fs_key], params.get(path_key, "")))
+
+
+def notify_mutation(remote, path=""):
+    """Tell the listing cache and other listeners that ``remote:path`` was written"""
+    LISTINGS.invalidate(remote, path)
+    for listener in mutation_listeners:
+        listener(remote, path)
+
+
+def method_lane(method, params):
+    if method == "operations/list" and params.get("opt", {}).get("recurse"):
+        return HEAVY
+    return METHOD_LANES.get(method, LIGHT)
+
+
+async def rclone_op(method, cmd, timeout=RCLONE_TIMEOUT, cache_key=None, lane=None, **params):
+    """Run rc ``method`` on the daemon, or the equivalent command ``cmd`` without it
+
+    Returns ``(result, error)``: the rc style result dict, or None and the
+    error text. Backend errors reported by the daemon are not retried.
+    ``cache_key`` (``(remote, path, variant)``) serves listings from LISTINGS;
+    methods in MUTATIONS invalidate what they touch. The call waits for a JOBS
+    slot in ``lane``, by default the lane of the method.
+    """
+    if cache_key:
+        cache_key = (cache_key[0], cache_key[1].strip("/"), *cache_key[2:])
+        result = LISTINGS.get(cache_key)
+        if result is not None:
+            return result, None
+    version = LISTINGS.version(cache_key[0]) if cache_key else None
+    if lane is None:
+        lane = method_lane(method, params)
+    try:
+        async with JOBS.slot(lane, timeout + 30):
+            return await _rclone_op(method, cmd, timeout, cache_key, version, params)
+    except JobsBusy as e:
+        return None, str(e)
+    except TimeoutError:
+        LOGGER.error(f"rclone job timeout: {method} {params}")
+        return None, "Operation timed out"
+    finally:
+        invalidate_listings(method, params)
+
+
+async def _rclone_op(method, cmd, timeout, cache_key, version, params):
+    result = None
+    if await DAEMON.ready():
+        try:
+            result = await DAEMON.call(method, timeout=timeout, **params)
+        except RcError as e:
+            return None, str(e)
+        except asyncio.TimeoutError:
+            LOGGER.error(f"rc timeout: {method} {params}")
+            return None, "Operation timed out"
+        except ClientError as e:
+            LOGGER.error(f"rc connection error, falling back to rclone: {e}")
+    if result is None:
+        stdout, stderr, return_code = await execute_rclone_cmd(cmd, timeout=timeout)
+        if return_code != 0:
+            return None, stderr
+        result = CLI_RESULTS.get(method, lambda out: {})(stdout)
+    if cache_key:
+        LISTINGS.put(cache_key, result, version)
+    return result, None
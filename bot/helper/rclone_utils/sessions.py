@@ -0,0 +1,116 @@
+from sys import getsizeof
+from time import time
+
+from bot import config_dict
+
+PRUNE_INTERVAL = 60
+BIG_VALUE = 64 * 1024  # values from this size count against the budget of a user
+
+
+def value_size(value):
+    """Rough memory a session value holds, Listings report their own"""
+    if hasattr(value, "nbytes"):
+        return value.nbytes
+    if isinstance(value, dict):
+        return getsizeof(value) + sum(value_size(k) + value_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return getsizeof(value) + sum(value_size(item) for item in value)
+    return getsizeof(value)
+
+
+class BrowseSessions:
+    """What each user is browsing in myfiles, forgotten after a while idle
+
+    A session holds small values (remote, folder), a reference to the
+    folder's Listing, which is an immutable snapshot shared with the listing
+    cache and with every other user looking at the same folder, and the
+    results of /rcdupes. Big values of one user share a budget of ``max_bytes``:
+    storing one evicts the user's older ones until it fits.
+    """
+
+    def __init__(self, ttl=None, max_bytes=None):
+        self.ttl = ttl if ttl is not None else config_dict["RCLONE_SESSION_TTL"] * 60
+        self.max_bytes = max_bytes or config_dict["RCLONE_SESSION_SIZE"] * 1024 * 1024
+        self.sessions = {}
+        self.big = {}  # keys of the big values of each user, oldest first
+        self.touched = {}
+        self._pruned = time()
+        self.expired = self.evicted = self.refused = 0
+
+    def get(self, user_id, key, default=""):
+        values = self.sessions.get(user_id)
+        if values is None:
+            return default
+        self.touched[user_id] = time()
+        return values.get(key, default)
+
+    def set(self, user_id, key, value):
+        """Store ``value`` for the user, returns False when it was refused for its size
+
+        A value bigger than the whole budget on its own is refused, Listings
+        aside, whose loading already stops at that size.
+        """
+        self.prune()
+        values = self.sessions.setdefault(user_id, {})
+        big = self.big.setdefault(user_id, {})
+        big.pop(key, None)
+        size = value_size(value)
+        if size > self.max_bytes and not hasattr(value, "nbytes"):
+            values.pop(key, None)
+            self.refused += 1
+            return False
+        values[key] = value
+        self.touched[user_id] = time()
+        if size >= BIG_VALUE:
+            self._make_room(user_id, size)
+            big[key] = True
+        return True
+
+    def _make_room(self, user_id, size):
+        """Evict the oldest big values of the user until ``size`` more bytes fit"""
+        values, big = self.sessions[user_id], self.big[user_id]
+        used = self.usage(user_id)
+        for key in list(big):
+            if used + size <= self.max_bytes:
+                break
+            del big[key]
+            used -= value_size(values.pop(key))
+            self.evicted += 1
+
+    def usage(self, user_id):
+        """Bytes the big values of the user take now"""
+        values = self.sessions.get(user_id, {})
+        return sum(value_size(values[key]) for key in self.big.get(user_id, ()))
+
+    def clear(self, user_id):
+        self.sessions.pop(user_id, None)
+        self.big.pop(user_id, None)
+        self.touched.pop(user_id, None)
+
+    def prune(self):
+        now = time()
+        if now - self._pruned < PRUNE_INTERVAL:
+            return
+        self._pruned = now
+        for user_id, touched in list(self.touched.items()):
+            if now - touched > self.ttl:
+                self.clear(user_id)
+                self.expired += 1
+
+    def stats(self):
+        listings = {}
+        for values in self.sessions.values():
+            for value in values.values():
+                if hasattr(value, "nbytes"):
+                    listings[id(value)] = value.nbytes
+        return {
+            "sessions": len(self.sessions),
+            "listings": len(listings),
+            "bytes": sum(listings.values()),
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "refused": self.refused,
+        }
+
+
+SESSIONS = BrowseSessions()
@@ -0,0 +1,196 @@
+from asyncio import CancelledError
+from itertools import count
+from time import time
+
+from bot import LOGGER, bot_loop, config_dict
+from bot.helper.rclone_utils.config import RCLONE_CONF
+from bot.helper.rclone_utils.jobs import job_context
+from bot.helper.rclone_utils.progress import rclone_progress_op
+from bot.helper.rclone_utils.rc import rclone_config
+
+TRANSFER_HISTORY = 20  # finished transfers kept for the list
+
+
+def transfer_options(src, dst):
+    """CLI flags and rc ``_config`` of a tuned copy or move between two remotes
+
+    Remotes on the same backend copy server side, also across configs; for
+    everything else several files move at a time with big files split over
+    several streams.
+    """
+    transfers = config_dict["RCLONE_TRANSFERS"]
+    flags = [f"--transfers={transfers}", f"--checkers={transfers * 2}"]
+    config = {"Transfers": transfers, "Checkers": transfers * 2}
+    src_conf = RCLONE_CONF.get(src.partition(":")[0])
+    if src_conf is not None and src_conf.server_side_with(RCLONE_CONF.get(dst.partition(":")[0])):
+        flags.append("--server-side-across-configs")
+        config["ServerSideAcrossConfigs"] = True
+    else:
+        streams = config_dict["RCLONE_MULTI_THREAD_STREAMS"]
+        flags.append(f"--multi-thread-streams={streams}")
+        config["MultiThreadStreams"] = streams
+    return flags, config
+
+
+def parse_destination(text, remote, inside=(), same=()):
+    """``(remote:path, None)`` for a destination typed by a user, else ``(None, error)``
+
+    Only remotes of rclone.conf are accepted, so on-the-fly backends
+    (``:local:``) and connection strings can't reach the bot's disk or other
+    hosts. A path alone is on ``remote``. The destination may not be one of
+    the ``same`` paths of ``remote`` nor one of the ``inside`` paths or a
+    folder below them.
+    """
+    text = text.strip()
+    if text.startswith(":"):
+        return None, "On-the-fly remotes are not allowed"
+    if ":" in text:
+        name, _, path = text.partition(":")
+        if "," in name or name not in RCLONE_CONF.remotes():
+            return None, f"Unknown remote <code>{name}</code>"
+    else:
+        name, path = remote, text
+    path = path.strip().strip("/")
+    if ".." in path.split("/"):
+        return None, "The path may not contain .."
+    if name == remote:
+        for source in inside:
+            source = source.strip("/")
+            if path == source or path.startswith(f"{source}/") or not source:
+                return None, "The destination is inside the source"
+        if path in (p.strip("/") for p in same):
+            return None, "The destination is the source folder"
+    return f"{name}:{path}", None
+
+
+async def copy_or_move(action, src, dst, on_progress=None, is_folder=True):
+    """Copy or move ``src`` to ``dst``, both ``remote:path``, returns an error or None
+
+    A folder is copied into ``dst``; a file is copied to the folder ``dst``
+    under its own name.
+    """
+    flags, config = transfer_options(src, dst)
+    if is_folder:
+        method = "sync/move" if action == "move" else "sync/copy"
+        cmd = ["rclone", action, f"--config={rclone_config}", *flags, src, dst]
+        params = {"srcFs": src, "dstFs": dst, "createEmptySrcDirs": True}
+        if action == "move":
+            params["deleteEmptySrcDirs"] = True
+            cmd.append("--delete-empty-src-dirs")
+    else:
+        src_fs, _, src_path = src.partition(":")
+        dst_fs, _, dst_dir = dst.partition(":")
+        name = src_path.rstrip("/").rsplit("/", 1)[-1]
+        dst_path = f"{dst_dir.strip('/')}/{name}".strip("/")
+        method = "operations/movefile" if action == "move" else "operations/copyfile"
+        cmd = [
+            "rclone",
+            f"{action}to",
+            f"--config={rclone_config}",
+            *flags,
+            src,
+            f"{dst_fs}:{dst_path}",
+        ]
+        params = {
+            "srcFs": f"{src_fs}:",
+            "srcRemote": src_path,
+            "dstFs": f"{dst_fs}:",
+            "dstRemote": dst_path,
+        }
+    _, err = await rclone_progress_op(method, cmd, on_progress, _config=config, **params)
+    return err
+
+
+class Transfer:
+    __slots__ = ("id", "user", "title", "src", "dst", "task", "stats", "started", "finished", "error")
+
+    def __init__(self, transfer_id, user, title, src, dst):
+        self.id = transfer_id
+        self.user = user
+        self.title = title
+        self.src = src
+        self.dst = dst
+        self.task = None
+        self.stats = {}
+        self.started = time()
+        self.finished = None
+        self.error = None
+
+    @property
+    def running(self):
+        return self.finished is None
+
+
+class TransferManager:
+    """Copies and moves that run in the background of the menu that started them
+
+    Each transfer is its own task holding a heavy JOBS slot from the transfer
+    budget of its user, so closing the menu does not stop it and browsing
+    keeps its own slots; it is listed until TRANSFER_HISTORY newer transfers
+    finished and can be cancelled from the list.
+    """
+
+    def __init__(self, history=TRANSFER_HISTORY):
+        self.history = history
+        self.transfers = {}
+        self._ids = count(1)
+
+    def start(self, user_id, title, src, dst, run, on_update=None):
+        """Run ``run(on_progress)`` as a transfer, ``on_update(transfer)`` is awaited on progress and at the end"""
+        transfer = Transfer(next(self._ids), user_id, title, src, dst)
+        self.transfers[transfer.id] = transfer
+
+        async def update():
+            if on_update is None:
+                return
+            try:
+                await on_update(transfer)
+            except Exception as e:
+                LOGGER.error(f"Transfer update failed: {e}")
+
+        async def progress(stats):
+            transfer.stats = stats
+            await update()
+
+        async def runner():
+            with job_context(user_id, transfer=True):
+                try:
+                    transfer.error = await run(progress)
+                except CancelledError:
+                    transfer.error = "Cancelled"
+                except Exception as e:
+                    LOGGER.error(f"Transfer {transfer.id} failed: {e}")
+                    transfer.error = str(e)
+            transfer.finished = time()
+            self.prune()
+            await update()
+
+        transfer.task = bot_loop.create_task(runner())
+        return transfer
+
+    def get(self, transfer_id):
+        return self.transfers.get(int(transfer_id))
+
+    def list(self, user_id=None):
+        """Transfers of ``user_id`` (or everyone), running ones first and newest first"""
+        transfers = [t for t in self.transfers.values() if user_id is None or t.user == user_id]
+        return sorted(transfers, key=lambda t: (not t.running, -t.id))
+
+    def cancel(self, transfer_id, user_id=None):
+        """Cancel a running transfer, of ``user_id`` when given; returns whether it was"""
+        transfer = self.get(transfer_id)
+        if transfer is None or not transfer.running or (user_id is not None and transfer.user != user_id):
+            return False
+        transfer.task.cancel()
+        return True
+
+    def tasks(self):
+        return {t.task for t in self.transfers.values() if t.running}
+
+    def prune(self):
+        finished = [t for t in self.transfers.values() if not t.running]
+        for transfer in sorted(finished, key=lambda t: t.finished)[: -self.history or None]:
+            del self.transfers[transfer.id]
+
+
+TRANSFERS = TransferManager()
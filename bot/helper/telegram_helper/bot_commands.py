@@ -17,6 +17,11 @@ class _BotCommands:
         self.BotSetCommand = f"bsetting"
         self.RssCommand = f"rss"
         self.MediainfoCommand = f"mediainfo"
+        self.FeedStatsCommand = f"feedstats"
+        self.FeedBenchCommand = f"feedbench"
+        self.RcloneStatsCommand = f"rcstats"
+        self.RcloneTransfersCommand = f"rctransfers"
+        self.RcloneDupesCommand = f"rcdupes"
 
 
 BotCommands = _BotCommands()
@@ -1,36 +1,54 @@
 import asyncio
-from json import loads
-from math import floor
+from math import ceil, floor
 from time import time
 from os.path import splitext
-from configparser import ConfigParser
 from aiofiles import open as aiopen
 from aiofiles.os import path as aiopath, remove
-from asyncio.subprocess import PIPE, create_subprocess_exec as exec
 from asyncio import sleep, TimeoutError
-from functools import lru_cache
-from contextlib import asynccontextmanager
+from functools import lru_cache, wraps
 
 from pyrogram import filters
 from pyrogram.filters import command, regex
 from pyrogram.handlers import MessageHandler, CallbackQueryHandler
 
-from bot import LOGGER, bot
-from bot.helper.ext_utils.bot_utils import sync_to_async, cmd_exec
+from bot import LOGGER, bot, config_dict
+from bot.helper.ext_utils.bot_utils import sync_to_async, cmd_exec, new_task
+from bot.helper.rclone_utils.about import QUOTAS, as_of
+from bot.helper.rclone_utils.bulk import bulk_op
+from bot.helper.rclone_utils.config import RCLONE_CONF
+from bot.helper.rclone_utils.duplicates import find_duplicates, verify_selection
+from bot.helper.rclone_utils.export import FORMATS, export_listing
+from bot.helper.rclone_utils.index import INDEX
+from bot.helper.rclone_utils.jobs import JOBS, JobsBusy, job_context
+from bot.helper.rclone_utils.links import LINKS
+from bot.helper.rclone_utils.listing import PAGE_SIZE, STREAM_THRESHOLD, start_loading
+from bot.helper.rclone_utils.mediainfo import MEDIAINFO
+from bot.helper.rclone_utils.preview import PREVIEWS, is_video
+from bot.helper.rclone_utils.progress import readable_time, rclone_progress_op
+from bot.helper.rclone_utils.rc import (
+    DAEMON,
+    LISTINGS,
+    SERVER,
+    notify_mutation,
+    rclone_config,
+    rclone_op,
+)
+from bot.helper.rclone_utils.sessions import SESSIONS
+from bot.helper.rclone_utils.transfers import TRANSFERS, copy_or_move, parse_destination
+from bot.helper.telegram_helper.bot_commands import BotCommands
 from bot.helper.telegram_helper.filters import CustomFilters
 from bot.helper.telegram_helper.button_build import ButtonMaker
 from bot.helper.telegram_helper.message_utils import send_message, edit_message, delete_message, send_file
 
 
 # Configuration
-rclone_config = "/usr/src/app/rclone.conf"
 SIZE_UNITS = ["B", "KB", "MB", "GB", "TB", "PB"]
-RCLONE_TIMEOUT = 300  # 5 minutes default timeout
 MEDIAINFO_TIMEOUT = 60  # 1 minute for mediainfo
 SEARCH_TIMEOUT = 180  # 3 minutes for search
-MAX_STREAM_CHUNK = 8192  # Increased chunk size for better performance
-rclone_dict = {}
-process_cache = {}  # Cache for process results
+LINK_EDIT_INTERVAL = 3  # seconds between edits while search links resolve
+SESSION_EXPIRED = "This menu has expired, open it again with /myfiles"
+DUPES_PAGE = 5  # duplicate groups per page
+DUPES_SHOWN = 10  # copies listed per group
 
 
 class Menus:
@@ -54,59 +72,80 @@ def get_readable_file_size(size_in_bytes: int):
     )
 
 
-def rcloneListNextPage(info, offset=0, max_results=10):
-    """Paginate rclone list results"""
-    start = offset
-    end = max_results + start
-    total = len(info)
-    next_offset = offset + max_results
-
-    if end > total:
-        next_page = info[start:]
-    elif start >= total:
-        next_page = []
-    else:
-        next_page = info[start:end]
-
-    return next_page, next_offset
-
-
-def rcloneListButtonMaker(info, button, menu_type, dir_callback, file_callback, user_id):
-    """Create buttons for rclone list items"""
-    for index, dir in enumerate(info):
-        path = dir["Path"]
-        update_rclone_data(str(index), path, user_id)
-
-        if dir["MimeType"] == "inode/directory":
+def rcloneListButtonMaker(
+    listing, positions, button, menu_type, dir_callback, file_callback, user_id, selected=None
+):
+    """Create buttons for the entries of a Listing at ``positions``
+
+    With a ``selected`` set of positions the entries become checkboxes.
+    """
+    for index in positions:
+        path = listing.names[index]
+        if selected is not None:
+            mark = "☑" if index in selected else "☐"
+            icon = "📁 " if listing.is_dir(index) else ""
+            button.data_button(f"{mark} {icon}{path}", data=f"{menu_type}^pick^{index}^{user_id}")
+        elif listing.is_dir(index):
             button.data_button(
                 f"📁 {path}", data=f"{menu_type}^{dir_callback}^{index}^{user_id}"
             )
         else:
-            size = get_readable_file_size(dir["Size"])
+            size = get_readable_file_size(listing.sizes[index])
             button.data_button(
                 f"[{size}] {path}",
                 data=f"{menu_type}^{file_callback}^{index}^True^{user_id}",
             )
 
 
-def get_rclone_data(key, user_id):
+def rclone_jobs(func):
+    """Queue the rclone work of a callback handler under the user who tapped it"""
+
+    @wraps(func)
+    async def wrapper(client, query):
+        async def queued(position):
+            await edit_message(
+                query.message, f"⏳ Waiting for a free rclone slot, position {position} in queue"
+            )
+
+        with job_context(query.from_user.id, queued):
+            try:
+                return await func(client, query)
+            except JobsBusy as e:
+                await edit_message(query.message, f"⏳ {e}")
+
+    return wrapper
+
+
+def get_rclone_data(key, user_id, default=""):
     """Get user-specific rclone data"""
-    value_dict = rclone_dict.get(user_id, {})
-    return value_dict.get(key, "")
+    return SESSIONS.get(user_id, key, default)
 
 
 def update_rclone_data(key, value, user_id):
-    """Update user-specific rclone data"""
-    if user_id in rclone_dict:
-        rclone_dict[user_id][key] = value
-    else:
-        rclone_dict[user_id] = {key: value}
+    """Update user-specific rclone data, False when it is too big to keep"""
+    return SESSIONS.set(user_id, key, value)
 
 
 def clear_rclone_data(user_id):
     """Clear user-specific rclone data"""
-    if user_id in rclone_dict:
-        del rclone_dict[user_id]
+    SESSIONS.clear(user_id)
+
+
+def listing_name(user_id, position):
+    """Name of the entry at ``position`` of the folder the user is browsing"""
+    listing = get_rclone_data("info", user_id, None)
+    if listing is None or int(position) >= len(listing):
+        return None
+    return listing.names[int(position)]
+
+
+def selected_entries(user_id):
+    """``(name, is_dir)`` of the entries the user selected, None if the session expired"""
+    listing = get_rclone_data("info", user_id, None)
+    selected = get_rclone_data("selected", user_id, None)
+    if listing is None or selected is None:
+        return None
+    return [(listing.names[i], listing.is_dir(i)) for i in sorted(selected) if i < len(listing)]
 
 
 async def create_next_buttons(
@@ -122,22 +161,22 @@ async def create_next_buttons(
     is_second_menu=False,
 ):
     """Create pagination buttons"""
-    current_page = round(int(next_offset) / 10) + 1
-    total_pages = max(round(total / 10), 1)
+    current_page = int(next_offset) // PAGE_SIZE + 1
+    total_pages = max(ceil(total / PAGE_SIZE), 1)
 
     if next_offset == 0:
         buttons.data_button(
             f"📑 {current_page} / {total_pages}",
-            f"{menu_type}^pages",
+            f"{menu_type}^pages^{user_id}",
             "footer",
         )
-        if total > 10:
+        if total > PAGE_SIZE:
             buttons.data_button(
                 "NEXT ⏩",
                 f"{filter} {_next_offset} {is_second_menu} {data_back_cb}",
                 "footer",
             )
-    elif next_offset >= total:
+    elif _next_offset >= total:
         buttons.data_button(
             "⏪ BACK",
             f"{filter} {prev_offset} {is_second_menu} {data_back_cb}",
@@ -145,7 +184,7 @@ async def create_next_buttons(
         )
         buttons.data_button(
             f"📑 {current_page} / {total_pages}",
-            f"{menu_type}^pages",
+            f"{menu_type}^pages^{user_id}",
             "footer",
         )
     else:
@@ -156,7 +195,7 @@ async def create_next_buttons(
         )
         buttons.data_button(
             f"📑 {current_page} / {total_pages}",
-            f"{menu_type}^pages",
+            f"{menu_type}^pages^{user_id}",
             "footer",
         )
         buttons.data_button(
@@ -173,87 +212,6 @@ async def create_next_buttons(
     )
 
 
-@asynccontextmanager
-async def rclone_process(*args, timeout=RCLONE_TIMEOUT):
-    """Context manager for rclone processes with proper cleanup"""
-    process = None
-    try:
-        process = await exec(*args, stdout=PIPE, stderr=PIPE)
-        yield process
-    except Exception as e:
-        LOGGER.error(f"Process error: {e}")
-        raise
-    finally:
-        if process and process.returncode is None:
-            try:
-                process.terminate()
-                try:
-                    await asyncio.wait_for(process.wait(), timeout=5)
-                except asyncio.TimeoutError:
-                    process.kill()
-                    await process.wait()
-            except Exception as e:
-                LOGGER.error(f"Process cleanup error: {e}")
-
-
-async def execute_rclone_cmd(cmd, timeout=RCLONE_TIMEOUT, cache_key=None):
-    """Execute rclone command with error handling and optional caching"""
-    # Check cache first
-    if cache_key and cache_key in process_cache:
-        cache_time, result = process_cache[cache_key]
-        if time() - cache_time < 60:  # Cache valid for 60 seconds
-            return result
-
-    try:
-        async with rclone_process(*cmd, timeout=timeout) as process:
-            try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), timeout=timeout
-                )
-            except asyncio.TimeoutError:
-                LOGGER.error(f"Command timeout: {' '.join(cmd)}")
-                return None, "Operation timed out", -1
-
-            return_code = process.returncode
-            stdout = stdout.decode().strip()
-            stderr = stderr.decode().strip()
-
-            result = (stdout, stderr, return_code)
-
-            # Cache successful results
-            if cache_key and return_code == 0:
-                process_cache[cache_key] = (time(), result)
-
-            return result
-
-    except Exception as e:
-        LOGGER.error(f"Command execution error: {e}")
-        return None, str(e), -1
-
-
-async def is_valid_path(remote, path, message):
-    """Validate if rclone path exists"""
-    try:
-        user_id = message.reply_to_message.from_user.id
-        cmd = [
-            "rclone",
-            "lsjson",
-            f"--config={rclone_config}",
-            f"{remote}:{path}",
-            "--fast-list",
-            "--max-depth=1",
-        ]
-        stdout, stderr, return_code = await execute_rclone_cmd(cmd, timeout=30)
-
-        if return_code != 0:
-            LOGGER.error(f"Invalid path: {remote}:{path} - {stderr}")
-            return False
-        return True
-    except Exception as e:
-        LOGGER.error(f"Path validation error: {e}")
-        return False
-
-
 async def list_remotes(
     message, menu_type, remote_type="remote", is_second_menu=False, edit=False
 ):
@@ -264,14 +222,12 @@ async def list_remotes(
         else:
             user_id = message.from_user.id
 
-        conf = ConfigParser()
-        conf.read(rclone_config)
         buttons = ButtonMaker()
 
-        for remote in conf.sections():
+        for remote in RCLONE_CONF.remotes():
             crypt_icon = ""
             is_crypt = False
-            if conf.get(remote, "type") == "crypt":
+            if RCLONE_CONF.get(remote).is_crypt:
                 is_crypt = True
                 crypt_icon = "🔐"
             buttons.data_button(
@@ -302,6 +258,67 @@ async def list_remotes(
             await send_message(message, error_msg)
 
 
+async def send_listing_page(
+    message, listing, rclone_remote, base_dir, offset, user_id, is_second_menu=False, edit=True
+):
+    """Show one page of a folder Listing, which may still be loading"""
+    update_rclone_data("offset", offset, user_id)
+    update_rclone_data("by_name", is_second_menu, user_id)
+    selected = get_rclone_data("selected", user_id, None)
+    buttons = ButtonMaker()
+    msg = f"Your cloud files are listed below\n\n<b>Path:</b><code>{rclone_remote}:{base_dir}</code>"
+    if selected is None:
+        buttons.data_button("⚙️ Folder Options", f"{Menus.MYFILES}^folder_action^{user_id}")
+        buttons.data_button("🔍 Search", f"{Menus.MYFILES}^search^{user_id}")
+        buttons.data_button("☑️ Select", f"{Menus.MYFILES}^select^{user_id}")
+    else:
+        msg += f"\n\n<b>Selected:</b> {len(selected)}"
+        if selected:
+            for action, label in (("delete", "🗑 Delete"), ("move", "📦 Move"), ("copy", "📄 Copy")):
+                buttons.data_button(label, f"{Menus.MYFILES}^bulk^{action}^{user_id}", "header")
+        buttons.data_button("☑️ Select page", f"{Menus.MYFILES}^select_page^{user_id}")
+        buttons.data_button("✅ Done", f"{Menus.MYFILES}^select_done^{user_id}")
+    total = len(listing)
+    if not listing.complete:
+        msg += f"\n\n⏳ Loading... {total} entries so far"
+    elif listing.truncated:
+        msg += f"\n\n⚠️ Only the first {total} entries are shown, this folder is too big to list"
+
+    if total == 0:
+        buttons.data_button("❌Nothing to show❌", f"{Menus.MYFILES}^pages^{user_id}")
+        buttons.data_button("⬅️ Back", f"{Menus.MYFILES}^back^{user_id}", "footer")
+        buttons.data_button("✘ Close", f"{Menus.MYFILES}^close^{user_id}", "footer")
+    else:
+        positions = await sync_to_async(listing.page, offset, PAGE_SIZE, is_second_menu)
+        rcloneListButtonMaker(
+            listing,
+            positions,
+            buttons,
+            menu_type=Menus.MYFILES,
+            dir_callback="remote_dir",
+            file_callback="file_action",
+            user_id=user_id,
+            selected=selected,
+        )
+        await create_next_buttons(
+            offset,
+            max(offset - PAGE_SIZE, 0),
+            offset + PAGE_SIZE,
+            "back",
+            total,
+            user_id,
+            buttons,
+            filter="next_myfiles",
+            menu_type=Menus.MYFILES,
+            is_second_menu=is_second_menu,
+        )
+
+    if edit:
+        await edit_message(message, msg, buttons.build_menu(1))
+    else:
+        await send_message(message, msg, buttons.build_menu(1))
+
+
 async def list_folder(
     message,
     rclone_remote,
@@ -311,105 +328,56 @@ async def list_folder(
     is_crypt=False,
     edit=False,
 ):
-    """List folder contents from rclone remote"""
+    """List folder contents from rclone remote, returns whether it worked
+
+    Big folders are streamed: the first page is shown as soon as rclone
+    printed it and the message is refreshed while the rest arrives. Folders
+    the index knows to be small are listed through rcd in one call.
+    """
     try:
         user_id = message.reply_to_message.from_user.id
-        buttons = ButtonMaker()
-        msg = ""
-        next_type = ""
-        dir_callback = "remote_dir"
-        file_callback = ""
-        back_callback = "back"
-
-        cmd = [
-            "rclone",
-            "lsjson",
-            f"--config={rclone_config}",
-            f"{rclone_remote}:{base_dir}",
-            "--fast-list",
-            "--max-depth=1",
-        ]
-
-        if menu_type == Menus.MYFILES:
-            next_type = "next_myfiles"
-            file_callback = "file_action"
-            cmd.extend(["--no-modtime"])
-            buttons.data_button(
-                "⚙️ Folder Options", f"{menu_type}^folder_action^{user_id}"
-            )
-            buttons.data_button("🔍 Search", f"myfilesmenu^search^{user_id}")
-            msg = f"Your cloud files are listed below\n\n<b>Path:</b><code>{rclone_remote}:{base_dir}</code>"
-
-        # Use cache for frequently accessed folders
-        cache_key = f"{rclone_remote}:{base_dir}"
-        res, err, rc = await execute_rclone_cmd(cmd, cache_key=cache_key)
-
-        if rc != 0:
-            LOGGER.error(f"Error listing folder: {err}")
-            error_msg = "Failed to list folder contents. The path may not exist."
-            if edit:
-                await edit_message(message, error_msg)
-            else:
-                await send_message(message, error_msg)
-            return
-
-        info = loads(res) if res else []
-
-        if is_second_menu:
-            sinfo = sorted(info, key=lambda x: x.get("Name", ""))
-        else:
-            sinfo = sorted(info, key=lambda x: x.get("Size", 0), reverse=True)
-
-        total = len(info)
-        update_rclone_data("info", sinfo, user_id)
-
-        if total == 0:
-            buttons.data_button("❌Nothing to show❌", f"{menu_type}^pages^{user_id}")
-        else:
-            page, next_offset = await sync_to_async(rcloneListNextPage, sinfo)
-
-            await sync_to_async(
-                rcloneListButtonMaker,
-                info=page,
-                button=buttons,
-                menu_type=menu_type,
-                dir_callback=dir_callback,
-                file_callback=file_callback,
-                user_id=user_id,
-            )
-
-            current_page = 1
-            total_pages = max(round(total / 10), 1)
-
-            if total <= 10:
-                buttons.data_button(
-                    f"📑 {current_page} / {total_pages}",
-                    f"{menu_type}^pages^{user_id}",
-                    "footer",
-                )
-            else:
-                buttons.data_button(
-                    f"📑 {current_page} / {total_pages}",
-                    f"{menu_type}^pages^{user_id}",
-                    "footer",
-                )
-                buttons.data_button(
-                    "NEXT ⏩",
-                    f"{next_type} {next_offset} {is_second_menu} {back_callback}",
-                    "footer",
+        # a selection holds positions of the folder it was made in
+        update_rclone_data("selected", None, user_id)
+        cache_key = (rclone_remote, base_dir.strip("/"), menu_type)
+        listing = LISTINGS.get(cache_key)
+
+        if listing is None:
+            small = False
+            remote_index = await sync_to_async(INDEX.ready, rclone_remote)
+            if remote_index is not None:
+                children = await sync_to_async(remote_index.children, base_dir)
+                small = 0 < children < STREAM_THRESHOLD
+
+            async def show_partial(partial):
+                await send_listing_page(
+                    message, partial, rclone_remote, base_dir, 0, user_id, is_second_menu
                 )
 
-        buttons.data_button(
-            "⬅️ Back", f"{menu_type}^{back_callback}^{user_id}", "footer"
-        )
-        buttons.data_button(
-            "✘ Close", f"{menu_type}^close^{user_id}", "footer"
+            # users opening a folder that is already loading share that load
+            load = start_loading(
+                cache_key,
+                rclone_remote,
+                base_dir,
+                small=small,
+                max_bytes=config_dict["RCLONE_SESSION_SIZE"] * 1024 * 1024,
+            )
+            update_rclone_data("info", load.listing, user_id)
+            listing, err = await load.wait(show_partial if edit else None)
+            if err is not None:
+                LOGGER.error(f"Error listing folder: {err}")
+                error_msg = "Failed to list folder contents. The path may not exist."
+                if edit:
+                    await edit_message(message, error_msg)
+                else:
+                    await send_message(message, error_msg)
+                return False
+            LISTINGS.put(cache_key, listing, load.version)
+
+        update_rclone_data("info", listing, user_id)
+        await send_listing_page(
+            message, listing, rclone_remote, base_dir, 0, user_id, is_second_menu, edit
         )
-
-        if edit:
-            await edit_message(message, msg, buttons.build_menu(1))
-        else:
-            await send_message(message, msg, buttons.build_menu(1))
+        return True
 
     except Exception as e:
         LOGGER.error(f"Error in list_folder: {e}")
@@ -418,8 +386,11 @@ async def list_folder(
             await edit_message(message, error_msg)
         else:
             await send_message(message, error_msg)
+        return False
 
 
+@new_task
+@rclone_jobs
 async def storage_menu_cb(client, callback_query):
     """Handle storage menu callbacks"""
     try:
@@ -435,11 +406,15 @@ async def storage_menu_cb(client, callback_query):
 
         if cmd[1] == "remote":
             await rclone_about(message, query, cmd[2], user_id)
+        elif cmd[1] == "refresh":
+            await query.answer("Refreshing...")
+            await rclone_about(message, query, cmd[2], user_id, refresh=True)
         elif cmd[1] == "back":
             await list_remotes(message, menu_type=Menus.STORAGE, edit=True)
             await query.answer()
         elif cmd[1] == "close":
             await query.answer()
+            JOBS.cancel(user_id, keep=TRANSFERS.tasks())
             await delete_message(message.reply_to_message)
             await delete_message(message)
 
@@ -448,27 +423,20 @@ async def storage_menu_cb(client, callback_query):
         await query.answer("An error occurred", show_alert=True)
 
 
-async def rclone_about(message, query, remote_name, user_id):
-    """Get storage information for a remote"""
+async def rclone_about(message, query, remote_name, user_id, refresh=False):
+    """Get storage information for a remote, from the quota cache unless ``refresh``"""
     try:
         button = ButtonMaker()
-        cmd = [
-            "rclone",
-            "about",
-            "--json",
-            f"--config={rclone_config}",
-            f"{remote_name}:",
-        ]
+        cached = None if refresh else QUOTAS.get(remote_name)
+        if cached is None:
+            cached = await QUOTAS.fetch(remote_name)
+        info, err, fetched = cached
 
-        stdout, stderr, return_code = await execute_rclone_cmd(cmd, timeout=30)
-
-        if return_code != 0:
-            LOGGER.error(f"Error getting storage info: {stderr}")
+        if err is not None:
+            LOGGER.error(f"Error getting storage info: {err}")
             await query.answer("Failed to get storage information", show_alert=True)
             return
 
-        info = loads(stdout) if stdout else {}
-
         if len(info) == 0:
             await query.answer("Team Drive with Unlimited Storage", show_alert=True)
             return
@@ -493,7 +461,9 @@ async def rclone_about(message, query, remote_name, user_id):
         except KeyError as e:
             LOGGER.error(f"Missing key in storage info: {e}")
             result_msg += f"<b>\nN/A:</b> Information not available"
+        result_msg += f"\n\n<i>{as_of(fetched)}</i>"
 
+        button.data_button("🔄 Refresh", f"storagemenu^refresh^{remote_name}^{user_id}")
         button.data_button("⬅️ Back", f"storagemenu^back^{user_id}", "footer")
         button.data_button("✘ Close", f"storagemenu^close^{user_id}", "footer")
 
@@ -526,6 +496,8 @@ async def myfiles_settings(message, remote, remote_path, edit=False, is_folder=F
             buttons.data_button("📁 Create empty dir", f"myfilesmenu^mkdir^{user_id}")
             buttons.data_button("🗑 Delete empty dir", f"myfilesmenu^rmdir^{user_id}")
             buttons.data_button("🗑 Delete duplicate files", f"myfilesmenu^dedupe^{user_id}")
+            buttons.data_button("📄 Copy to", f"myfilesmenu^transfer^copy^folder^{user_id}")
+            buttons.data_button("📤 Export listing", f"myfilesmenu^export^{user_id}")
         else:
             if is_folder:
                 buttons.data_button("📊 Folder size", f"myfilesmenu^size^{user_id}")
@@ -533,11 +505,20 @@ async def myfiles_settings(message, remote, remote_path, edit=False, is_folder=F
                 buttons.data_button("🗑 Delete folder", f"myfilesmenu^delete^folder^{user_id}")
                 buttons.data_button("📁 Create empty dir", f"myfilesmenu^mkdir^{user_id}")
                 buttons.data_button("🗑 Delete empty dir", f"myfilesmenu^rmdir^{user_id}")
+                buttons.data_button("📄 Copy to", f"myfilesmenu^transfer^copy^folder^{user_id}")
+                buttons.data_button("📦 Move to", f"myfilesmenu^transfer^move^folder^{user_id}")
+                buttons.data_button("📤 Export listing", f"myfilesmenu^export^{user_id}")
             else:
                 buttons.data_button("📝 Rename", f"myfilesmenu^rename^file^{user_id}")
                 buttons.data_button("🗑 Delete", f"myfilesmenu^delete^file^{user_id}")
-                buttons.data_button("🔗 Get Link", f"myfilesmenu^getlink^{user_id}")
+                conf = RCLONE_CONF.get(remote)
+                if conf is None or conf.public_link is not False:
+                    buttons.data_button("🔗 Get Link", f"myfilesmenu^getlink^{user_id}")
                 buttons.data_button("📄 Get Mediainfo", f"myfilesmenu^mediainfo^{user_id}")
+                if is_video(remote_path):
+                    buttons.data_button("🎞 Preview", f"myfilesmenu^preview^{user_id}")
+                buttons.data_button("📄 Copy to", f"myfilesmenu^transfer^copy^file^{user_id}")
+                buttons.data_button("📦 Move to", f"myfilesmenu^transfer^move^file^{user_id}")
 
         buttons.data_button("⬅️ Back", f"myfilesmenu^back_remotes_menu^{user_id}", "footer")
         buttons.data_button("✘ Close", f"myfilesmenu^close^{user_id}", "footer")
@@ -553,15 +534,23 @@ async def myfiles_settings(message, remote, remote_path, edit=False, is_folder=F
         LOGGER.error(f"Error in myfiles_settings: {e}")
 
 
-async def calculate_size(message, remote_path, remote, user_id):
-    """Calculate total size of a folder"""
+async def calculate_size(message, remote_path, remote, user_id, exact=False):
+    """Calculate total size of a folder, from the index rollup unless ``exact``"""
     try:
         buttons = ButtonMaker()
-        data = await rclone_size(message, remote_path, remote, rclone_config)
+        data = None
+        if not exact and (remote_index := await sync_to_async(INDEX.ready, remote)) is not None:
+            data = await sync_to_async(remote_index.folder_size, remote_path)
+        if data is None:
+            data = await rclone_size(message, remote_path, remote, rclone_config)
+            note = "<i>Exact size, just now</i>"
+        else:
+            note = f"<i>From the index, {as_of(data[2])}</i>"
+            buttons.data_button("🔄 Exact size", f"myfilesmenu^size_exact^{user_id}")
 
         if data is not None:
             total_size = get_readable_file_size(data[1])
-            msg = f"<b>Total Files:</b> {data[0]}\n<b>Folder Size:</b> {total_size}"
+            msg = f"<b>Total Files:</b> {data[0]}\n<b>Folder Size:</b> {total_size}\n\n{note}"
             buttons.data_button("⬅️ Back", f"myfilesmenu^back_remotes_menu^{user_id}", "footer")
             buttons.data_button("✘ Close", f"myfilesmenu^close^{user_id}", "footer")
             await edit_message(message, msg, buttons.build_menu(1))
@@ -591,54 +580,41 @@ async def search_action(client, message, query, remote, user_id):
                             "**⏳Searching file(s) on remote...**\n\nPlease wait, it may take some time"
                         )
 
-                        cmd = [
-                            "rclone",
-                            "lsjson",
-                            "--files-only",
-                            "--fast-list",
-                            "--no-modtime",
-                            "--ignore-case",
-                            "-R",
-                            f"--config={rclone_config}",
-                            "--include",
-                            f"*{text}*",
-                            f"{remote}:",
-                        ]
-
-                        out, err, return_code = await execute_rclone_cmd(cmd, timeout=SEARCH_TIMEOUT)
+                        remote_index = await sync_to_async(INDEX.ready, remote)
+                        if remote_index is not None:
+                            data, total = await sync_to_async(remote_index.search, text)
+                        else:
+                            data, total = await search_remote(remote, text)
 
-                        if return_code != 0:
-                            LOGGER.error(f"Search error: {err}")
+                        if data is None:
                             await edit_message(question, "An error occurred during search.")
-                        elif out and len(out) > 0:
-                            data = loads(out)
-                            msg = f"<b>Found {len(data)} files:\n\n</b>"
-
-                            for index, file in enumerate(data[:50], start=1):  # Limit to 50 results
-                                name = file["Name"]
-                                path = file["Path"]
-
-                                # Try to get link
-                                cmd_link = [
-                                    "rclone",
-                                    "link",
-                                    f"--config={rclone_config}",
-                                    f"{remote}:{path}",
-                                ]
-
-                                link_out, link_err, link_rc = await execute_rclone_cmd(cmd_link, timeout=10)
-
-                                if link_rc == 0 and link_out:
-                                    msg += f"{index}. <a href='{link_out}'>{name}</a>\n"
-                                else:
-                                    msg += f"{index}. <code>{name}</code>\n"
-
-                            if len(data) > 50:
-                                msg += f"\n<i>... and {len(data) - 50} more files</i>"
-
-                            await edit_message(question, msg)
+                        elif data:
+                            data = data[:50]  # Limit to 50 results
+                            status = await sync_to_async(INDEX.status, remote)
+                            links = {}
+                            await edit_message(
+                                question, search_results_msg(data, total, links, status)
+                            )
+                            # fill in links as they resolve, a few edits at most
+                            last_edit = time()
+                            pending = False
+                            async for position, url in LINKS.resolve_many(remote, data):
+                                if url:
+                                    links[position] = url
+                                    pending = True
+                                if pending and time() - last_edit >= LINK_EDIT_INTERVAL:
+                                    await edit_message(
+                                        question, search_results_msg(data, total, links, status)
+                                    )
+                                    last_edit = time()
+                                    pending = False
+                            if pending:
+                                await edit_message(
+                                    question, search_results_msg(data, total, links, status)
+                                )
                         else:
-                            await edit_message(question, "No file(s) found")
+                            status = await sync_to_async(INDEX.status, remote)
+                            await edit_message(question, f"No file(s) found\n\n{status}")
 
                 client.remove_handler(handler)
 
@@ -654,6 +630,96 @@ async def search_action(client, message, query, remote, user_id):
         LOGGER.error(f"Error in search_action: {e}")
 
 
+def search_results_msg(data, total, links, status):
+    """Search results with the links resolved so far"""
+    msg = f"<b>Found {total} files:\n\n</b>"
+    for index, file in enumerate(data, start=1):
+        name = file["Name"]
+        link = links.get(index - 1)
+        if link:
+            msg += f"{index}. <a href='{link}'>{name}</a>\n"
+        else:
+            msg += f"{index}. <code>{name}</code>\n"
+    if total > len(data):
+        msg += f"\n<i>... and {total - len(data)} more files</i>"
+    msg += f"\n\n{status}"
+    return msg
+
+
+async def search_remote(remote, text):
+    """Search a remote that has no index yet by listing it recursively"""
+    cmd = [
+        "rclone",
+        "lsjson",
+        "--files-only",
+        "--fast-list",
+        "--no-modtime",
+        "--ignore-case",
+        "-R",
+        f"--config={rclone_config}",
+        "--include",
+        f"*{text}*",
+        f"{remote}:",
+    ]
+
+    out, err = await rclone_op(
+        "operations/list",
+        cmd,
+        timeout=SEARCH_TIMEOUT,
+        fs=f"{remote}:",
+        remote="",
+        opt={"recurse": True, "filesOnly": True, "noModTime": True},
+        _filter={"IncludeRule": [f"*{text}*"], "IgnoreCase": True},
+        _config={"UseListR": True},
+    )
+
+    if err is not None:
+        LOGGER.error(f"Search error: {err}")
+        return None, 0
+    return out["list"], len(out["list"])
+
+
+def rclone_stats_msg(title, stats):
+    """Progress text from rclone stats: objects seen, bytes, rate and ETA"""
+    msg = f"<b>⏳ {title}</b>\n"
+    counters = [
+        ("Listed", stats.get("listed")),
+        ("Checked", stats.get("checks")),
+        ("Deleted", stats.get("deletes")),
+        ("Deleted dirs", stats.get("deletedDirs")),
+        ("Transferred", stats.get("transfers")),
+    ]
+    shown = [f"<b>{name}:</b> {value:,}" for name, value in counters if value]
+    if shown:
+        msg += "\n" + " | ".join(shown)
+    if stats.get("bytes"):
+        msg += f"\n<b>Bytes:</b> {get_readable_file_size(stats['bytes'])}"
+        if stats.get("totalBytes"):
+            msg += f" of {get_readable_file_size(stats['totalBytes'])}"
+    if stats.get("speed"):
+        msg += f"\n<b>Rate:</b> {get_readable_file_size(stats['speed'])}/s"
+    if stats.get("eta"):
+        msg += f" | <b>ETA:</b> {readable_time(stats['eta'])}"
+    if stats.get("errors"):
+        msg += f"\n<b>Errors:</b> {stats['errors']}"
+    msg += f"\n<b>Elapsed:</b> {readable_time(stats.get('elapsedTime'))}"
+    return msg
+
+
+async def progress_reporter(message, title):
+    """Show ``title`` with a Cancel button, returns the callback for rclone stats"""
+    user_id = message.reply_to_message.from_user.id
+    buttons = ButtonMaker()
+    buttons.data_button("✘ Cancel", f"myfilesmenu^cancel^{user_id}")
+    markup = buttons.build_menu(1)
+    await edit_message(message, f"<b>⏳ {title}</b>\n\nStarting...", markup)
+
+    async def report(stats):
+        await edit_message(message, rclone_stats_msg(title, stats), markup)
+
+    return report
+
+
 async def delete_selection(message, user_id, is_folder=False):
     """Confirmation dialog for deletion"""
     try:
@@ -725,13 +791,192 @@ async def delete_empty_dir(message, user_id, remote, remote_path):
         await edit_message(message, "An error occurred.")
 
 
+async def show_current_page(message, user_id):
+    """Show the listing page the user was on again"""
+    listing = get_rclone_data("info", user_id, None)
+    if listing is None:
+        await edit_message(message, SESSION_EXPIRED)
+        return
+    await send_listing_page(
+        message,
+        listing,
+        get_rclone_data("MYFILES_REMOTE", user_id),
+        get_rclone_data("MYFILES_BASE_DIR", user_id),
+        get_rclone_data("offset", user_id, 0),
+        user_id,
+        is_second_menu=get_rclone_data("by_name", user_id, False),
+    )
+
+
+async def bulk_delete_selection(message, user_id):
+    """Confirmation dialog for deleting the selected entries"""
+    entries = selected_entries(user_id)
+    if not entries:
+        await edit_message(message, SESSION_EXPIRED)
+        return
+    buttons = ButtonMaker()
+    buttons.data_button("Yes", f"myfilesmenu^bulk_yes^{user_id}")
+    buttons.data_button("No", f"myfilesmenu^bulk_no^{user_id}")
+    names = "\n".join(f"• <code>{name}</code>" for name, _ in entries[:10])
+    if len(entries) > 10:
+        names += f"\n... and {len(entries) - 10} more"
+    msg = f"⚠️ Delete these {len(entries)} items permanently?\n\n{names}"
+    await edit_message(message, msg, buttons.build_menu(2))
+
+
+async def bulk_delete_selected(message, user_id, remote, base_dir):
+    """Delete the selected entries as one rclone job"""
+    entries = selected_entries(user_id)
+    if not entries:
+        await edit_message(message, SESSION_EXPIRED)
+        return
+    try:
+        report = await progress_reporter(message, f"Deleting {len(entries)} items...")
+        err = await bulk_op("delete", remote, base_dir, entries, report)
+    except Exception as e:
+        LOGGER.error(f"Error in bulk delete: {e}")
+        err = str(e)
+
+    buttons = ButtonMaker()
+    buttons.data_button("⬅️ Back", f"myfilesmenu^bulk_done^{user_id}", "footer")
+    buttons.data_button("✘ Close", f"myfilesmenu^close^{user_id}", "footer")
+    if err is not None:
+        msg = f"❌ Failed to delete the selected items.\n\n<code>{err[:200]}</code>"
+    else:
+        msg = f"✅ {len(entries)} items deleted successfully!"
+    await edit_message(message, msg, buttons.build_menu(1))
+
+
+def transfer_msg(transfer):
+    """Status text of a background copy or move"""
+    if transfer.running:
+        msg = rclone_stats_msg(transfer.title, transfer.stats)
+    elif transfer.error is None:
+        msg = f"<b>✅ {transfer.title}</b>\n\n"
+        msg += f"<b>Done in:</b> {readable_time(transfer.finished - transfer.started)}"
+    else:
+        msg = f"<b>❌ {transfer.title}</b>\n\n<code>{transfer.error[:200]}</code>"
+    msg += f"\n\n<b>From: </b><code>{transfer.src}</code>\n<b>To: </b><code>{transfer.dst}</code>"
+    return msg
+
+
+async def start_transfer(message, user_id, title, src, dst, run):
+    """Run a copy or move in the background with its own status message"""
+    status = await send_message(message, f"<b>⏳ {title}</b>\n\nStarting...")
+
+    async def on_update(transfer):
+        markup = None
+        if transfer.running:
+            buttons = ButtonMaker()
+            buttons.data_button("✘ Cancel", f"myfilesmenu^tcancel^{transfer.id}^{user_id}")
+            markup = buttons.build_menu(1)
+        await edit_message(status, transfer_msg(transfer), markup)
+
+    transfer = TRANSFERS.start(user_id, title, src, dst, run, on_update)
+    await on_update(transfer)
+    return transfer
+
+
+async def ask_destination(client, message, user_id, remote, prompt, on_dest, inside=(), same=()):
+    """Ask for a destination folder, ``on_dest(dest)`` gets it as ``remote:path`` or None
+
+    ``inside`` and ``same`` are paths of ``remote`` the destination may not
+    be in or be, see parse_destination.
+    """
+    question = await send_message(
+        message,
+        f"{prompt}\n\nSend destination folder as <code>remote:path</code> "
+        "or a path on this remote, /ignore to cancel",
+    )
+
+    async def handle_response(client, response_message):
+        try:
+            client.remove_handler(handler)
+            text = response_message.text.strip()
+            await delete_message(response_message)
+            await delete_message(question)
+            if "/ignore" in text:
+                await on_dest(None)
+                return
+            dest, err = parse_destination(text, remote, inside, same)
+            if err is not None:
+                await send_message(message, f"❌ {err}")
+            await on_dest(dest)
+        except Exception as e:
+            LOGGER.error(f"Error in destination response handler: {e}")
+            await edit_message(message, "An error occurred.")
+
+    handler = MessageHandler(handle_response, filters.text & filters.user(user_id))
+    client.add_handler(handler)
+
+
+async def bulk_transfer(client, message, user_id, remote, base_dir, action):
+    """Move or copy the selected entries in the background"""
+    entries = selected_entries(user_id)
+    if not entries:
+        await edit_message(message, SESSION_EXPIRED)
+        return
+
+    async def on_dest(dest):
+        if dest is not None:
+            await start_transfer(
+                message,
+                user_id,
+                f"{'Moving' if action == 'move' else 'Copying'} {len(entries)} items",
+                f"{remote}:{base_dir}",
+                dest,
+                lambda report: bulk_op(action, remote, base_dir, entries, report, dest),
+            )
+            update_rclone_data("selected", None, user_id)
+        await show_current_page(message, user_id)
+
+    await ask_destination(
+        client,
+        message,
+        user_id,
+        remote,
+        f"{action.title()} {len(entries)} selected items",
+        on_dest,
+        inside=[f"{base_dir}{name}" for name, is_dir in entries if is_dir],
+        same=[base_dir],
+    )
+
+
+async def rclone_transfer(client, message, user_id, remote, remote_path, action, is_folder):
+    """Copy or move a file or folder to another folder or remote in the background"""
+    src = f"{remote}:{remote_path}"
+
+    async def on_dest(dest):
+        if dest is not None:
+            await start_transfer(
+                message,
+                user_id,
+                f"{'Moving' if action == 'move' else 'Copying'} {'folder' if is_folder else 'file'}",
+                src,
+                dest,
+                lambda report: copy_or_move(action, src, dest, report, is_folder),
+            )
+
+    if is_folder:
+        inside, same = [remote_path], []
+    else:
+        inside, same = [], [remote_path.rstrip("/").rsplit("/", 1)[0] if "/" in remote_path else ""]
+    await ask_destination(
+        client,
+        message,
+        user_id,
+        remote,
+        f"{action.title()} <code>{src}</code>",
+        on_dest,
+        inside=inside,
+        same=same,
+    )
+
+
 async def rclone_size(message, remote_path, remote, rclone_config):
     """Calculate folder size"""
     try:
-        await edit_message(
-            message,
-            "**⏳Calculating Folder Size...**\n\nPlease wait, it will take some time depending on number of files"
-        )
+        report = await progress_reporter(message, "Calculating Folder Size...")
 
         cmd = [
             "rclone",
@@ -742,13 +987,17 @@ async def rclone_size(message, remote_path, remote, rclone_config):
             "--json",
         ]
 
-        stdout, stderr, return_code = await execute_rclone_cmd(cmd, timeout=RCLONE_TIMEOUT)
+        data, err = await rclone_progress_op(
+            "operations/size",
+            cmd,
+            report,
+            fs=f"{remote}:{remote_path}",
+            _config={"UseListR": True},
+        )
 
-        if return_code != 0:
-            LOGGER.error(f"Error calculating size: {stderr}")
+        if err is not None:
+            LOGGER.error(f"Error calculating size: {err}")
             return None
-
-        data = loads(stdout) if stdout else {}
         files = data.get("count", 0)
         size = data.get("bytes", 0)
         return (files, size)
@@ -761,11 +1010,14 @@ async def rclone_size(message, remote_path, remote, rclone_config):
 async def rclone_purge(message, remote_path, remote, rclone_config):
     """Purge (delete) a folder"""
     try:
+        report = await progress_reporter(message, "Deleting folder...")
         cmd = ["rclone", "purge", f"--config={rclone_config}", f"{remote}:{remote_path}"]
-        stdout, stderr, return_code = await execute_rclone_cmd(cmd, timeout=RCLONE_TIMEOUT)
+        _, err = await rclone_progress_op(
+            "operations/purge", cmd, report, fs=f"{remote}:", remote=remote_path
+        )
 
-        if return_code != 0:
-            LOGGER.error(f"Error purging folder: {stderr}")
+        if err is not None:
+            LOGGER.error(f"Error purging folder: {err}")
             return False
         return True
 
@@ -778,10 +1030,12 @@ async def rclone_delete(message, remote_path, remote, rclone_config):
     """Delete a file"""
     try:
         cmd = ["rclone", "delete", f"--config={rclone_config}", f"{remote}:{remote_path}"]
-        stdout, stderr, return_code = await execute_rclone_cmd(cmd, timeout=60)
+        _, err = await rclone_op(
+            "operations/deletefile", cmd, timeout=60, fs=f"{remote}:", remote=remote_path
+        )
 
-        if return_code != 0:
-            LOGGER.error(f"Error deleting file: {stderr}")
+        if err is not None:
+            LOGGER.error(f"Error deleting file: {err}")
             return False
         return True
 
@@ -793,16 +1047,15 @@ async def rclone_delete(message, remote_path, remote, rclone_config):
 async def rclone_rmdirs(message, remote, remote_path, rclone_config):
     """Remove empty directories"""
     try:
-        await edit_message(
-            message,
-            "**⏳Removing empty directories...**\n\nPlease wait, it may take some time depending on number of dirs"
-        )
+        report = await progress_reporter(message, "Removing empty directories...")
 
         cmd = ["rclone", "rmdirs", f"--config={rclone_config}", f"{remote}:{remote_path}"]
-        stdout, stderr, return_code = await execute_rclone_cmd(cmd, timeout=RCLONE_TIMEOUT)
+        _, err = await rclone_progress_op(
+            "operations/rmdirs", cmd, report, fs=f"{remote}:", remote=remote_path, leaveRoot=False
+        )
 
-        if return_code != 0:
-            LOGGER.error(f"Error removing directories: {stderr}")
+        if err is not None:
+            LOGGER.error(f"Error removing directories: {err}")
             return False
         return True
 
@@ -835,10 +1088,12 @@ async def rclone_mkdir(client, message, remote, remote_path, tag):
                             f"{remote}:{path}",
                         ]
 
-                        stdout, stderr, return_code = await execute_rclone_cmd(cmd, timeout=30)
+                        _, err = await rclone_op(
+                            "operations/mkdir", cmd, timeout=30, fs=f"{remote}:", remote=path
+                        )
 
-                        if return_code != 0:
-                            LOGGER.error(f"Error creating directory: {stderr}")
+                        if err is not None:
+                            LOGGER.error(f"Error creating directory: {err}")
                             await edit_message(question, "An error occurred during directory creation.")
                         else:
                             msg = "<b>✅ Directory created successfully.</b>\n\n"
@@ -863,9 +1118,7 @@ async def rclone_mkdir(client, message, remote, remote_path, tag):
 async def rclone_dedupe(message, remote, remote_path, user_id, tag):
     """Remove duplicate files"""
     try:
-        msg = "**⏳Deleting duplicate files**\n"
-        msg += "\nIt may take some time depending on number of duplicates files"
-        await edit_message(message, msg)
+        report = await progress_reporter(message, "Deleting duplicate files...")
 
         cmd = [
             "rclone",
@@ -880,10 +1133,13 @@ async def rclone_dedupe(message, remote, remote_path, user_id, tag):
             f"{remote}:{remote_path}",
         ]
 
-        stdout, stderr, return_code = await execute_rclone_cmd(cmd, timeout=RCLONE_TIMEOUT)
+        try:
+            _, err = await rclone_progress_op(None, cmd, report)
+        finally:
+            notify_mutation(remote, remote_path)
 
-        if return_code != 0:
-            LOGGER.error(f"Error deduplicating: {stderr}")
+        if err is not None:
+            LOGGER.error(f"Error deduplicating: {err}")
             msg = "❌ Dedupe failed. Please try again."
         else:
             msg = "<b>✅ Dedupe completed successfully</b>\n"
@@ -934,10 +1190,18 @@ async def rclone_rename(client, message, remote, remote_path, tag):
                             f"{remote}:{path}",
                         ]
 
-                        stdout, stderr, return_code = await execute_rclone_cmd(cmd, timeout=60)
+                        _, err = await rclone_op(
+                            "operations/movefile",
+                            cmd,
+                            timeout=60,
+                            srcFs=f"{remote}:",
+                            srcRemote=remote_path,
+                            dstFs=f"{remote}:",
+                            dstRemote=path,
+                        )
 
-                        if return_code != 0:
-                            LOGGER.error(f"Error renaming file: {stderr}")
+                        if err is not None:
+                            LOGGER.error(f"Error renaming file: {err}")
                             await edit_message(question, "An error occurred during renaming.")
                         else:
                             msg = "<b>✅ File renamed successfully.</b>\n\n"
@@ -963,18 +1227,26 @@ async def rclone_rename(client, message, remote, remote_path, tag):
 async def rclone_get_link(client, message, remote, remote_path, user_id):
     """Get direct link for a file"""
     try:
-        cmd_link = ["rclone", "link", f"--config={rclone_config}", f"{remote}:{remote_path}"]
-        stdout, stderr, return_code = await execute_rclone_cmd(cmd_link, timeout=30)
+        cached = await sync_to_async(LINKS.cached, remote, remote_path)
+        if cached:
+            result, err = {"url": cached}, None
+        else:
+            cmd_link = ["rclone", "link", f"--config={rclone_config}", f"{remote}:{remote_path}"]
+            result, err = await rclone_op(
+                "operations/publiclink", cmd_link, timeout=30, fs=f"{remote}:", remote=remote_path
+            )
+            if err is None and result.get("url"):
+                await sync_to_async(LINKS.store, remote, remote_path, None, result["url"])
 
         buttons = ButtonMaker()
         buttons.data_button("⬅️ Back", f"myfilesmenu^back_remotes_menu^{user_id}", "footer")
         buttons.data_button("✘ Close", f"myfilesmenu^close^{user_id}", "footer")
 
-        if return_code != 0:
-            error_msg = stderr if stderr else "Unknown error"
+        if err is not None:
+            error_msg = err if err else "Unknown error"
             await edit_message(message, f"❌ Error: {error_msg[:200]}", buttons.build_menu(2))
         else:
-            direct_link = stdout if stdout else "No link available"
+            direct_link = result.get("url") or "No link available"
             await edit_message(
                 message,
                 f"<b>🔗 Direct Link:</b> <code>{direct_link}</code>",
@@ -994,59 +1266,29 @@ async def rclone_get_mediainfo(client, message, remote, remote_path, user_id):
 
     await edit_message(message, "⏳ Getting media info...", buttons.build_menu(2))
 
-    rclone_proc = None
-    mediainfo_proc = None
     file_name = None
 
     try:
-        file_name = f"mediainfo_{user_id}_{int(time())}.txt"
-
-        # Start rclone cat process
-        rclone_proc = await exec(
-            "rclone",
-            "cat",
-            f"--config={rclone_config}",
-            f"{remote}:{remote_path}",
-            "--count=10485760",  # 10MB limit
-            stdout=PIPE,
-            stderr=PIPE
-        )
+        output, err, cached = await MEDIAINFO.report(remote, remote_path, timeout=MEDIAINFO_TIMEOUT)
+        if err is not None:
+            await edit_message(message, f"❌ Mediainfo error: {err[:200]}", buttons.build_menu(2))
+            return
+        if not output:
+            await edit_message(message, "No media information found", buttons.build_menu(2))
+            return
 
-        # Start mediainfo process
-        mediainfo_proc = await exec(
-            "mediainfo",
-            "-",
-            stdin=PIPE,
-            stdout=PIPE,
-            stderr=PIPE
-        )
+        file_name = f"mediainfo_{user_id}_{int(time())}.txt"
+        async with aiopen(file_name, "w") as f:
+            await f.write(output)
 
-        # Process streams with timeout
-        await asyncio.wait_for(
-            process_streams(rclone_proc, mediainfo_proc, file_name, message, buttons),
-            timeout=MEDIAINFO_TIMEOUT
-        )
+        await send_file(message, file_name)
+        done = "✅ Mediainfo from cache" if cached else "✅ Mediainfo generated successfully"
+        await edit_message(message, done, buttons.build_menu(2))
 
-    except asyncio.TimeoutError:
-        await edit_message(message, "⏱️ Operation timed out", buttons.build_menu(2))
     except Exception as e:
         LOGGER.error(f"Error in rclone_get_mediainfo: {e}")
         await edit_message(message, f"❌ Error: {str(e)[:300]}", buttons.build_menu(2))
     finally:
-        # Cleanup processes
-        for proc in [rclone_proc, mediainfo_proc]:
-            if proc and proc.returncode is None:
-                try:
-                    proc.terminate()
-                    try:
-                        await asyncio.wait_for(proc.wait(), timeout=5)
-                    except asyncio.TimeoutError:
-                        proc.kill()
-                        await proc.wait()
-                except Exception as e:
-                    LOGGER.error(f"Process cleanup error: {e}")
-
-        # Cleanup temporary file
         if file_name and await aiopath.exists(file_name):
             try:
                 await remove(file_name)
@@ -1054,49 +1296,90 @@ async def rclone_get_mediainfo(client, message, remote, remote_path, user_id):
                 LOGGER.error(f"File cleanup error: {e}")
 
 
-async def process_streams(rclone, mediainfo, file_name, message, buttons):
-    """Process streams between rclone and mediainfo"""
+async def rclone_preview(message, remote, remote_path, user_id):
+    """Send a screenshot sheet of a remote video"""
+    buttons = ButtonMaker()
+    buttons.data_button("⬅️ Back", f"myfilesmenu^back_remotes_menu^{user_id}", "footer")
+    buttons.data_button("✘ Close", f"myfilesmenu^close^{user_id}", "footer")
+
+    await edit_message(message, "⏳ Making preview...", buttons.build_menu(2))
+
     try:
-        # Stream data from rclone to mediainfo
-        while True:
-            chunk = await rclone.stdout.read(MAX_STREAM_CHUNK)
-            if not chunk:
-                break
-            mediainfo.stdin.write(chunk)
-            await mediainfo.stdin.drain()
-
-        mediainfo.stdin.close()
-        stdout, stderr = await mediainfo.communicate()
-
-        # Check rclone errors
-        if await rclone.wait() != 0:
-            rclone_err = (await rclone.stderr.read()).decode().strip()
-            await edit_message(message, f"❌ Rclone error: {rclone_err[:200]}", buttons.build_menu(2))
+        sheet, err, cached = await PREVIEWS.preview(remote, remote_path)
+        if err is not None:
+            await edit_message(message, f"❌ Preview error: {err[:200]}", buttons.build_menu(2))
             return
+        await send_file(message, sheet, f"<code>{remote}:{remote_path}</code>")
+        done = "✅ Preview from cache" if cached else "✅ Preview generated successfully"
+        await edit_message(message, done, buttons.build_menu(2))
 
-        # Check mediainfo errors
-        if mediainfo.returncode != 0:
-            mediainfo_err = stderr.decode().strip()
-            await edit_message(message, f"❌ Mediainfo error: {mediainfo_err[:200]}", buttons.build_menu(2))
-            return
+    except Exception as e:
+        LOGGER.error(f"Error in rclone_preview: {e}")
+        await edit_message(message, f"❌ Error: {str(e)[:300]}", buttons.build_menu(2))
 
-        output = stdout.decode().strip()
-        if not output:
-            await edit_message(message, "No media information found", buttons.build_menu(2))
-            return
 
-        # Write to file and send
-        async with aiopen(file_name, "w") as f:
-            await f.write(output)
+async def export_menu(message, remote, remote_path, user_id):
+    """Formats and sources of a listing export"""
+    buttons = ButtonMaker()
+    index = await sync_to_async(INDEX.ready, remote)
+    for fmt in FORMATS:
+        buttons.data_button(f"📄 {fmt.upper()}", f"myfilesmenu^export_run^{fmt}^live^{user_id}")
+        if index is not None:
+            buttons.data_button(
+                f"🗂 {fmt.upper()} from index", f"myfilesmenu^export_run^{fmt}^index^{user_id}"
+            )
+    buttons.data_button("⬅️ Back", f"myfilesmenu^folder_action^{user_id}", "footer")
+    buttons.data_button("✘ Close", f"myfilesmenu^close^{user_id}", "footer")
+    msg = f"<b>Export listing of</b> <code>{remote}:{remote_path}</code>\n\n"
+    msg += "Every file and folder below it, gzip compressed."
+    if index is not None:
+        status = await sync_to_async(INDEX.status, remote)
+        msg += f"\nThe index is quick but may be behind the remote.\n{status}"
+    await edit_message(message, msg, buttons.build_menu(2))
 
-        await send_file(message, file_name)
-        await edit_message(message, "✅ Mediainfo generated successfully", buttons.build_menu(2))
+
+async def rclone_export(message, remote, remote_path, user_id, fmt, from_index):
+    """Send the listing below a folder as a compressed CSV or JSONL file"""
+    buttons = ButtonMaker()
+    buttons.data_button("⬅️ Back", f"myfilesmenu^back_remotes_menu^{user_id}", "footer")
+    buttons.data_button("✘ Close", f"myfilesmenu^close^{user_id}", "footer")
+    cancel = ButtonMaker()
+    cancel.data_button("✘ Cancel", f"myfilesmenu^cancel^{user_id}")
+    title = f"Exporting <code>{remote}:{remote_path}</code>"
+    await edit_message(message, f"<b>⏳ {title}</b>\n\nStarting...", cancel.build_menu(1))
+
+    async def progress(entries):
+        await edit_message(
+            message, f"<b>⏳ {title}</b>\n\n<b>Entries:</b> {entries}", cancel.build_menu(1)
+        )
+
+    file_name = None
+    try:
+        file_name, entries, err = await export_listing(
+            remote, remote_path, fmt, from_index, progress
+        )
+        if err is not None:
+            await edit_message(message, f"❌ Export error: {err[:200]}", buttons.build_menu(2))
+            return
+        indexed = from_index and await sync_to_async(INDEX.ready, remote) is not None
+        source = "index" if indexed else "remote"
+        caption = f"<code>{remote}:{remote_path}</code>\n<b>Entries:</b> {entries} (from the {source})"
+        await send_file(message, file_name, caption)
+        await edit_message(message, f"✅ Exported {entries} entries", buttons.build_menu(2))
 
     except Exception as e:
-        LOGGER.error(f"Error in process_streams: {e}")
-        await edit_message(message, f"❌ Stream error: {str(e)[:200]}", buttons.build_menu(2))
+        LOGGER.error(f"Error in rclone_export: {e}")
+        await edit_message(message, f"❌ Error: {str(e)[:300]}", buttons.build_menu(2))
+    finally:
+        if file_name and await aiopath.exists(file_name):
+            try:
+                await remove(file_name)
+            except Exception as e:
+                LOGGER.error(f"File cleanup error: {e}")
 
 
+@new_task
+@rclone_jobs
 async def myfiles_callback(client, callback_query):
     """Handle myfiles menu callbacks"""
     try:
@@ -1117,18 +1400,21 @@ async def myfiles_callback(client, callback_query):
         if cmd[1] == "remote":
             update_rclone_data("MYFILES_BASE_DIR", "", user_id)  # Reset Dir
             update_rclone_data("MYFILES_REMOTE", cmd[2], user_id)
-            await list_folder(message, cmd[2], "", menu_type=Menus.MYFILES, edit=True)
             await query.answer()
+            await list_folder(message, cmd[2], "", menu_type=Menus.MYFILES, edit=True)
 
         elif cmd[1] == "remote_dir":
-            path = get_rclone_data(cmd[2], user_id)
-            base_dir += path + "/"
-            if await is_valid_path(rclone_remote, base_dir, message):
-                update_rclone_data("MYFILES_BASE_DIR", base_dir, user_id)
-                await list_folder(
-                    message, rclone_remote, base_dir, menu_type=Menus.MYFILES, edit=True
-                )
+            path = listing_name(user_id, cmd[2])
+            if path is None:
+                await query.answer(SESSION_EXPIRED, show_alert=True)
+                return
             await query.answer()
+            # set before listing so entries clicked while it loads resolve here
+            update_rclone_data("MYFILES_BASE_DIR", f"{base_dir}{path}/", user_id)
+            if not await list_folder(
+                message, rclone_remote, f"{base_dir}{path}/", menu_type=Menus.MYFILES, edit=True
+            ):
+                update_rclone_data("MYFILES_BASE_DIR", base_dir, user_id)
 
         elif cmd[1] == "back":
             if len(base_dir) == 0:
@@ -1142,17 +1428,20 @@ async def myfiles_callback(client, callback_query):
                 base_dir += "/"
 
             update_rclone_data("MYFILES_BASE_DIR", base_dir, user_id)
+            await query.answer()
             await list_folder(
                 message, rclone_remote, base_dir, menu_type=Menus.MYFILES, edit=True
             )
-            await query.answer()
 
         elif cmd[1] == "back_remotes_menu":
             await list_remotes(message, menu_type=Menus.MYFILES, edit=True)
             await query.answer()
 
         elif cmd[1] == "file_action":
-            path = get_rclone_data(cmd[2], user_id)
+            path = listing_name(user_id, cmd[2])
+            if path is None:
+                await query.answer(SESSION_EXPIRED, show_alert=True)
+                return
             base_dir += path
             update_rclone_data("MYFILES_BASE_DIR", base_dir, user_id)
             await myfiles_settings(
@@ -1180,6 +1469,10 @@ async def myfiles_callback(client, callback_query):
             await query.answer()
             await calculate_size(message, base_dir, rclone_remote, user_id)
 
+        elif cmd[1] == "size_exact":
+            await query.answer()
+            await calculate_size(message, base_dir, rclone_remote, user_id, exact=True)
+
         elif cmd[1] == "mkdir":
             await query.answer()
             await rclone_mkdir(client, message, rclone_remote, base_dir, tag)
@@ -1204,6 +1497,20 @@ async def myfiles_callback(client, callback_query):
             await query.answer()
             await rclone_get_mediainfo(client, message, rclone_remote, base_dir, user_id)
 
+        elif cmd[1] == "preview":
+            await query.answer()
+            await rclone_preview(message, rclone_remote, base_dir, user_id)
+
+        elif cmd[1] == "export":
+            await query.answer()
+            await export_menu(message, rclone_remote, base_dir, user_id)
+
+        elif cmd[1] == "export_run":
+            await query.answer()
+            await rclone_export(
+                message, rclone_remote, base_dir, user_id, cmd[2], cmd[3] == "index"
+            )
+
         elif cmd[1] == "yes":
             if cmd[2] == "folder":
                 is_folder = True
@@ -1217,11 +1524,90 @@ async def myfiles_callback(client, callback_query):
             await delete_message(message.reply_to_message)
             await delete_message(message)
 
+        elif cmd[1] == "select":
+            await query.answer()
+            update_rclone_data("selected", set(), user_id)
+            await show_current_page(message, user_id)
+
+        elif cmd[1] == "pick":
+            selected = get_rclone_data("selected", user_id, None)
+            if selected is None or listing_name(user_id, cmd[2]) is None:
+                await query.answer(SESSION_EXPIRED, show_alert=True)
+                return
+            selected ^= {int(cmd[2])}
+            await query.answer(f"{len(selected)} selected")
+            await show_current_page(message, user_id)
+
+        elif cmd[1] == "select_page":
+            listing = get_rclone_data("info", user_id, None)
+            selected = get_rclone_data("selected", user_id, None)
+            if listing is None or selected is None:
+                await query.answer(SESSION_EXPIRED, show_alert=True)
+                return
+            selected.update(
+                await sync_to_async(
+                    listing.page,
+                    get_rclone_data("offset", user_id, 0),
+                    PAGE_SIZE,
+                    get_rclone_data("by_name", user_id, False),
+                )
+            )
+            await query.answer(f"{len(selected)} selected")
+            await show_current_page(message, user_id)
+
+        elif cmd[1] == "select_done":
+            await query.answer()
+            update_rclone_data("selected", None, user_id)
+            await show_current_page(message, user_id)
+
+        elif cmd[1] == "bulk":
+            await query.answer()
+            if cmd[2] == "delete":
+                await bulk_delete_selection(message, user_id)
+            else:
+                await bulk_transfer(client, message, user_id, rclone_remote, base_dir, cmd[2])
+
+        elif cmd[1] == "bulk_yes":
+            await query.answer()
+            await bulk_delete_selected(message, user_id, rclone_remote, base_dir)
+
+        elif cmd[1] == "bulk_no":
+            await query.answer()
+            await show_current_page(message, user_id)
+
+        elif cmd[1] == "bulk_done":
+            await query.answer()
+            await list_folder(
+                message, rclone_remote, base_dir, menu_type=Menus.MYFILES, edit=True
+            )
+
+        elif cmd[1] == "transfer":
+            await query.answer()
+            await rclone_transfer(
+                client, message, user_id, rclone_remote, base_dir, cmd[2], cmd[3] == "folder"
+            )
+
+        elif cmd[1] == "tcancel":
+            if TRANSFERS.cancel(cmd[2], user_id):
+                await query.answer("Cancelling...")
+            else:
+                await query.answer("This transfer is not running", show_alert=True)
+
+        elif cmd[1] == "cancel":
+            # background transfers have their own cancel buttons
+            cancelled = JOBS.cancel(user_id, keep=TRANSFERS.tasks())
+            await query.answer("Cancelled" if cancelled else "Nothing to cancel")
+            buttons = ButtonMaker()
+            buttons.data_button("⬅️ Back", f"myfilesmenu^back_remotes_menu^{user_id}", "footer")
+            buttons.data_button("✘ Close", f"myfilesmenu^close^{user_id}", "footer")
+            await edit_message(message, "❌ Operation cancelled", buttons.build_menu(1))
+
         elif cmd[1] == "pages":
             await query.answer()
 
         elif cmd[1] == "close":
             await query.answer()
+            JOBS.cancel(user_id, keep=TRANSFERS.tasks())
             await delete_message(message.reply_to_message)
             await delete_message(message)
 
@@ -1241,48 +1627,23 @@ async def next_page_myfiles(client, callback_query):
         message = query.message
         await query.answer()
         user_id = message.reply_to_message.from_user.id
-        _, next_offset, _, data_back_cb = data.split()
-
-        info = get_rclone_data("info", user_id)
-        total = len(info)
-        next_offset = int(next_offset)
-        prev_offset = max(next_offset - 10, 0)
-
-        buttons = ButtonMaker()
-        buttons.data_button(f"⚙️ Folder Options", f"myfilesmenu^folder_action^{user_id}")
-        buttons.data_button("🔍 Search", f"myfilesmenu^search^{user_id}")
-
-        next_info, _next_offset = await sync_to_async(
-            rcloneListNextPage, info, next_offset
-        )
-
-        await sync_to_async(
-            rcloneListButtonMaker,
-            info=next_info,
-            button=buttons,
-            menu_type=Menus.MYFILES,
-            dir_callback="remote_dir",
-            file_callback="file_action",
-            user_id=user_id,
-        )
-
-        await create_next_buttons(
-            next_offset,
-            prev_offset,
-            _next_offset,
-            data_back_cb,
-            total,
-            user_id,
-            buttons,
-            filter="next_myfiles",
-            menu_type=Menus.MYFILES,
-        )
+        _, next_offset, is_second_menu, _ = data.split()
 
+        listing = get_rclone_data("info", user_id, None)
+        if listing is None:
+            await edit_message(message, SESSION_EXPIRED)
+            return
         remote = get_rclone_data("MYFILES_REMOTE", user_id)
         base_dir = get_rclone_data("MYFILES_BASE_DIR", user_id)
-        msg = f"Your cloud files are listed below\n\n<b>Path:</b><code>{remote}:{base_dir}</code>"
-
-        await edit_message(message, msg, buttons.build_menu(1))
+        await send_listing_page(
+            message,
+            listing,
+            remote,
+            base_dir,
+            int(next_offset),
+            user_id,
+            is_second_menu=is_second_menu == "True",
+        )
 
     except Exception as e:
         LOGGER.error(f"Error in next_page_myfiles: {e}")
@@ -1298,6 +1659,275 @@ async def handle_storage(_, message):
         await send_message(message, "An error occurred. Please try again.")
 
 
+async def handle_rclone_stats(_, message):
+    """Handle /rcstats command"""
+    stats = LISTINGS.stats()
+    msg = "<b>rclone daemon:</b> "
+    msg += f"running on port {DAEMON.port}" if DAEMON.running else "not running"
+    msg += f", previews served on port {SERVER.port}" if SERVER.running else ""
+    msg += f"\n<b>rclone.conf:</b> {len(RCLONE_CONF.remotes())} remotes, parsed {RCLONE_CONF.loads} times"
+    msg += "\n\n<b>Listing cache</b>\n"
+    msg += f"<b>Entries:</b> {stats['entries']} | "
+    msg += f"<b>Memory:</b> {get_readable_file_size(stats['bytes'])} of {get_readable_file_size(stats['max_bytes'])}\n"
+    msg += f"<b>Hits:</b> {stats['hits']} | <b>Misses:</b> {stats['misses']} | "
+    msg += f"<b>Hit rate:</b> {stats['hit_rate']:.0%}\n"
+    msg += f"<b>Evictions:</b> {stats['evictions']} | <b>Expired:</b> {stats['expired']} | "
+    msg += f"<b>Invalidated:</b> {stats['invalidations']} | <b>Stale loads:</b> {stats['stale']}"
+    sessions = SESSIONS.stats()
+    msg += "\n\n<b>Browse sessions</b>\n"
+    msg += f"<b>Users:</b> {sessions['sessions']} | <b>Expired:</b> {sessions['expired']} | "
+    msg += f"<b>Evicted:</b> {sessions['evicted']} | <b>Refused:</b> {sessions['refused']}\n"
+    msg += f"<b>Listings held:</b> {sessions['listings']} | "
+    msg += f"<b>Memory:</b> {get_readable_file_size(sessions['bytes'])}"
+    jobs = JOBS.stats()
+    msg += "\n\n<b>rclone jobs</b>\n"
+    msg += f"<b>Limit:</b> {jobs['limit']} ({jobs['per_user']} per user) | "
+    msg += f"<b>Running:</b> {len(jobs['running'])} | <b>Waiting:</b> {len(jobs['waiting'])}\n"
+    for lane, user, seconds in jobs["running"]:
+        msg += f"• {lane} for {user or 'bot'}, {int(seconds)}s\n"
+    msg += f"<b>Started:</b> {jobs['started']} | <b>Queued:</b> {jobs['queued']} | "
+    msg += f"<b>Timeouts:</b> {jobs['timeouts']} | <b>Cancelled:</b> {jobs['cancelled']} | "
+    msg += f"<b>Busy:</b> {jobs['busy']}"
+    media = await sync_to_async(MEDIAINFO.stats)
+    msg += "\n\n<b>Mediainfo cache</b>\n"
+    msg += f"<b>Reports:</b> {media['entries']} | "
+    msg += f"<b>Size:</b> {get_readable_file_size(media['bytes'])}\n"
+    msg += f"<b>Hits:</b> {media['hits']} | <b>Misses:</b> {media['misses']}"
+    previews = await sync_to_async(PREVIEWS.stats)
+    msg += "\n\n<b>Preview cache</b>\n"
+    msg += f"<b>Sheets:</b> {previews['entries']} | "
+    msg += f"<b>Size:</b> {get_readable_file_size(previews['bytes'])}\n"
+    msg += f"<b>Hits:</b> {previews['hits']} | <b>Misses:</b> {previews['misses']}"
+    await send_message(message, msg)
+
+
+async def handle_rclone_transfers(_, message):
+    """Handle /rctransfers command"""
+    user_id = message.from_user.id
+    transfers = TRANSFERS.list(user_id)
+    if not transfers:
+        await send_message(message, "No copies or moves running or finished lately")
+        return
+    buttons = ButtonMaker()
+    msg = ""
+    for transfer in transfers:
+        msg += f"<b>#{transfer.id}</b> {transfer_msg(transfer)}\n\n"
+        if transfer.running:
+            buttons.data_button(
+                f"✘ Cancel #{transfer.id}", f"myfilesmenu^tcancel^{transfer.id}^{user_id}"
+            )
+    await send_message(message, msg.strip()[:4000], buttons.build_menu(2))
+
+
+async def send_dupes_page(message, user_id, page, note=""):
+    """Show one page of the duplicate groups the user found with /rcdupes"""
+    groups = get_rclone_data("dupes", user_id, None)
+    stats = get_rclone_data("dupes_stats", user_id, None)
+    selected = get_rclone_data("dupes_selected", user_id, None)
+    if groups is None or stats is None or selected is None:
+        await edit_message(message, "This list has expired, run /rcdupes again")
+        return
+    update_rclone_data("dupes_page", page, user_id)
+    msg = f"<b>Duplicates in:</b> {', '.join(stats['remotes']) or 'no indexed remote'}\n"
+    msg += f"<b>Groups:</b> {len(groups)} | <b>Files:</b> {sum(len(g) for g in groups)} | "
+    msg += f"<b>Reclaimable:</b> {get_readable_file_size(sum(g[0][2] * (len(g) - 1) for g in groups))}"
+    if stats["unhashed"]:
+        msg += f"\n<i>{stats['unhashed']} files without a hash were not compared</i>"
+    if stats["skipped"]:
+        msg += f"\n<i>Not indexed yet: {', '.join(stats['skipped'])}</i>"
+    if stats["shadowing"]:
+        msg += f"\n<i>Left out, they show another remote: {', '.join(stats['shadowing'])}</i>"
+    if stats["shared"]:
+        msg += f"\n<i>{stats['shared']} groups left out, their copies may be one stored file</i>"
+    if selected:
+        size = sum(groups[g][m][2] for g, m in selected)
+        msg += f"\n<b>Selected:</b> {len(selected)} files, {get_readable_file_size(size)}"
+    if note:
+        msg += f"\n\n{note}"
+
+    buttons = ButtonMaker()
+    first = page * DUPES_PAGE
+    for g in range(first, min(first + DUPES_PAGE, len(groups))):
+        group = groups[g]
+        msg += f"\n\n<b>{g + 1}.</b> {get_readable_file_size(group[0][2])} × {len(group)}"
+        for m, (remote, path, *_) in enumerate(group[:DUPES_SHOWN]):
+            mark = "☑" if (g, m) in selected else "☐"
+            msg += f"\n{mark} {m + 1}. <code>{remote}:{path}</code>"
+            buttons.data_button(f"{mark} {g + 1}.{m + 1}", f"rcdupes^pick^{g}^{m}^{user_id}")
+        if len(group) > DUPES_SHOWN:
+            msg += f"\n... and {len(group) - DUPES_SHOWN} more"
+
+    if groups:
+        buttons.data_button("Keep one of each", f"rcdupes^auto^{user_id}", "header")
+    if selected:
+        buttons.data_button("Clear", f"rcdupes^clear^{user_id}", "header")
+        buttons.data_button(f"🗑 Delete {len(selected)}", f"rcdupes^delete^{user_id}", "header")
+    pages = max(ceil(len(groups) / DUPES_PAGE), 1)
+    if page > 0:
+        buttons.data_button("⏪ BACK", f"rcdupes^page^{page - 1}^{user_id}", "footer")
+    buttons.data_button(f"📑 {page + 1} / {pages}", f"rcdupes^pages^{user_id}", "footer")
+    if page + 1 < pages:
+        buttons.data_button("NEXT ⏩", f"rcdupes^page^{page + 1}^{user_id}", "footer")
+    buttons.data_button("✘ Close", f"rcdupes^close^{user_id}", "footer")
+    await edit_message(message, msg[:4000], buttons.build_menu(5))
+
+
+async def delete_dupes(message, user_id):
+    """Delete the selected copies, one rclone job per remote"""
+    groups = get_rclone_data("dupes", user_id)
+    selected = get_rclone_data("dupes_selected", user_id)
+    await edit_message(message, f"⏳ Checking {len(selected)} duplicates against the remotes...")
+    try:
+        safe = await verify_selection(groups, selected)
+    except Exception as e:
+        LOGGER.error(f"Checking duplicates failed: {e}")
+        await send_dupes_page(message, user_id, 0, f"❌ Could not check the files: {str(e)[:200]}")
+        return
+    changed = len(selected) - len(safe)
+    selected = safe
+    by_remote = {}
+    for g, m in sorted(selected):
+        remote, path = groups[g][m][:2]
+        by_remote.setdefault(remote, []).append((path, False))
+    report = await progress_reporter(message, f"Deleting {len(selected)} duplicates...")
+    errors = []
+    for remote, entries in by_remote.items():
+        err = await bulk_op("delete", remote, "", entries, report)
+        if err is not None:
+            LOGGER.error(f"Deleting duplicates on {remote} failed: {err}")
+            errors.append(f"{remote}: {err[:100]}")
+            selected -= {(g, m) for g, m in selected if groups[g][m][0] == remote}
+    # what is left of each group once the deleted copies are gone
+    groups = [
+        [entry for m, entry in enumerate(group) if (g, m) not in selected]
+        for g, group in enumerate(groups)
+    ]
+    deleted = len(selected)
+    update_rclone_data("dupes", [group for group in groups if len(group) > 1], user_id)
+    update_rclone_data("dupes_selected", set(), user_id)
+    note = f"✅ Deleted {deleted} duplicates"
+    if changed:
+        note += f"\n⚠️ Kept {changed} that changed since the scan, run /rcdupes again"
+    if errors:
+        note += "\n❌ " + "\n❌ ".join(errors)
+    await send_dupes_page(message, user_id, 0, note)
+
+
+@new_task
+@rclone_jobs
+async def dupes_callback(client, callback_query):
+    """Handle /rcdupes menu callbacks"""
+    try:
+        query = callback_query
+        cmd = query.data.split("^")
+        message = query.message
+        user_id = query.from_user.id
+
+        if int(cmd[-1]) != user_id:
+            await query.answer("Not yours!", show_alert=True)
+            return
+
+        groups = get_rclone_data("dupes", user_id, None)
+        selected = get_rclone_data("dupes_selected", user_id, None)
+        page = get_rclone_data("dupes_page", user_id, 0)
+        if cmd[1] == "close":
+            await query.answer()
+            update_rclone_data("dupes", None, user_id)
+            await delete_message(message.reply_to_message)
+            await delete_message(message)
+            return
+        if groups is None or selected is None:
+            await query.answer("This list has expired, run /rcdupes again", show_alert=True)
+            return
+
+        if cmd[1] == "page":
+            await query.answer()
+            await send_dupes_page(message, user_id, int(cmd[2]))
+
+        elif cmd[1] == "pick":
+            g, m = int(cmd[2]), int(cmd[3])
+            if g >= len(groups) or m >= len(groups[g]):
+                await query.answer("This list has expired, run /rcdupes again", show_alert=True)
+                return
+            selected ^= {(g, m)}
+            await query.answer(f"{len(selected)} selected")
+            await send_dupes_page(message, user_id, page)
+
+        elif cmd[1] == "auto":
+            selected.clear()
+            selected.update((g, m) for g, group in enumerate(groups) for m in range(1, len(group)))
+            await query.answer(f"{len(selected)} selected, the first copy of each is kept")
+            await send_dupes_page(message, user_id, page)
+
+        elif cmd[1] == "clear":
+            selected.clear()
+            await query.answer()
+            await send_dupes_page(message, user_id, page)
+
+        elif cmd[1] == "delete":
+            # never every copy of a file
+            every = [
+                str(g + 1)
+                for g, group in enumerate(groups)
+                if all((g, m) in selected for m in range(len(group)))
+            ]
+            if every:
+                await query.answer(
+                    f"Keep at least one copy of group {', '.join(every[:5])}", show_alert=True
+                )
+                return
+            await query.answer()
+            size = sum(groups[g][m][2] for g, m in selected)
+            buttons = ButtonMaker()
+            buttons.data_button("Yes", f"rcdupes^yes^{user_id}")
+            buttons.data_button("No", f"rcdupes^page^{page}^{user_id}")
+            await edit_message(
+                message,
+                f"⚠️ Delete {len(selected)} duplicates ({get_readable_file_size(size)}) permanently?",
+                buttons.build_menu(2),
+            )
+
+        elif cmd[1] == "yes":
+            await query.answer()
+            await delete_dupes(message, user_id)
+
+        else:
+            await query.answer()
+
+    except Exception as e:
+        LOGGER.error(f"Error in dupes_callback: {e}")
+        await query.answer("An error occurred", show_alert=True)
+
+
+@new_task
+async def handle_rclone_dupes(_, message):
+    """Handle /rcdupes command, for the given remotes or every indexed one"""
+    user_id = message.from_user.id
+    remotes = message.text.split()[1:] or INDEX.remotes()
+    status = await send_message(message, "⏳ Looking for duplicates in the index...")
+
+    async def progress(remote, done, total):
+        await edit_message(status, f"⏳ Hashing files of {remote}: {done} / {total}")
+
+    try:
+        with job_context(user_id):
+            groups, stats = await find_duplicates(remotes, progress)
+    except Exception as e:
+        LOGGER.error(f"Error finding duplicates: {e}")
+        await edit_message(status, "An error occurred while looking for duplicates.")
+        return
+    if not update_rclone_data("dupes", groups, user_id):
+        await edit_message(
+            status,
+            f"Found {stats['groups']} duplicate groups, too many to browse here. "
+            "Run /rcdupes on fewer remotes at a time.",
+        )
+        return
+    update_rclone_data("dupes_stats", stats, user_id)
+    update_rclone_data("dupes_selected", set(), user_id)
+    await send_dupes_page(status, user_id, 0)
+
+
 async def handle_myfiles(client, message):
     """Handle /myfiles command"""
     try:
@@ -1320,6 +1950,27 @@ bot.add_handler(
         filters=command("myfiles") & CustomFilters.authorized,
     )
 )
+bot.add_handler(
+    MessageHandler(
+        handle_rclone_stats,
+        filters=command(BotCommands.RcloneStatsCommand) & CustomFilters.sudo,
+    )
+)
+bot.add_handler(
+    MessageHandler(
+        handle_rclone_transfers,
+        filters=command(BotCommands.RcloneTransfersCommand) & CustomFilters.authorized,
+    )
+)
+bot.add_handler(
+    MessageHandler(
+        handle_rclone_dupes,
+        filters=command(BotCommands.RcloneDupesCommand) & CustomFilters.authorized,
+    )
+)
 bot.add_handler(CallbackQueryHandler(storage_menu_cb, filters=regex("storagemenu")))
 bot.add_handler(CallbackQueryHandler(myfiles_callback, filters=regex("myfilesmenu")))
-bot.add_handler(CallbackQueryHandler(next_page_myfiles, filters=regex("next_myfiles")))
\ No newline at end of file
+bot.add_handler(CallbackQueryHandler(dupes_callback, filters=regex("^rcdupes")))
+bot.add_handler(CallbackQueryHandler(next_page_myfiles, filters=regex("next_myfiles")))
+INDEX.add_jobs()
+QUOTAS.add_job()
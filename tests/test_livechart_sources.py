@@ -0,0 +1,69 @@
+import asyncio
+import sys
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+
+def stub_module(name, **attrs):
+    module = ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules.setdefault(name, module)
+
+
+async def _noop(*args, **kwargs):
+    return None
+
+
+# sources.py only needs these names, the real modules start the bot
+stub_module("bot", __path__=[str(ROOT / "bot")], get_collection=lambda name: None)
+stub_module("bot.helper.anibot.helper", clog=_noop)
+stub_module("bot.helper.ext_utils.bot_utils", sync_to_process=_noop)
+stub_module("bot.helper.livechart.airing", AIRED=None)
+stub_module("workers.feeds", parse_feed=None)
+
+from bot.helper.livechart.sources import LiveChartAiring  # noqa: E402
+
+
+class FakeAired:
+    def __init__(self, seen):
+        self.keys = set(seen)
+        self.added = []
+
+    async def load(self):
+        pass
+
+    def seen(self, title, episode):
+        return (title, episode) in self.keys
+
+    async def add(self, _id, titles, episodes):
+        self.added.append(_id)
+
+
+def airing_item(title, episode):
+    return {
+        "title": f"<title>{title} #{episode}</title>",
+        "guid": f"<guid>https://www.livechart.me/anime/{title}</guid>",
+    }
+
+
+def test_airing_checkpoint_moves_when_timers_announced_everything():
+    items = [airing_item("Frieren", 12), airing_item("Dandadan", 3)]
+    source = LiveChartAiring(checkpoints=object())
+    source.aired = FakeAired({("Frieren", "12"), ("Dandadan", "3")})
+
+    notifications = asyncio.run(source.format(items))
+
+    assert notifications == []
+    assert source.aired.added == []
+    assert source.checkpoint_doc(items, notifications) == {
+        "_id": items[0]["title"],
+        "guid": items[0]["guid"],
+    }
+
+
+def test_airing_checkpoint_kept_for_empty_feed():
+    source = LiveChartAiring(checkpoints=object())
+    assert source.checkpoint_doc([], []) is None
@@ -0,0 +1,5 @@
+"""Work for the bot's process pool
+
+Pool workers are spawned fresh and import what they run by name, so nothing
+in here may import the ``bot`` package, which connects the clients on import.
+"""
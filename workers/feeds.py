@@ -0,0 +1,22 @@
+from bs4 import BeautifulSoup as bs
+
+
+def parse_feed(text, fields, attrs):
+    """Parse an RSS document into plain dicts
+
+    Runs in the process pool, so it only takes and returns picklable values.
+    Fields keep the raw tag string (``str(tag)``) since checkpoints are stored
+    in that form; use ``unwrap`` to get the text.
+    """
+    soup = bs(text, features="xml")
+    items = []
+    for item in soup.findAll("item"):
+        data = {"raw": str(item)}
+        for key, name in fields.items():
+            found = item.find(name)
+            data[key] = None if found is None else str(found)
+        for key, (name, attr) in attrs.items():
+            found = item.find(name)
+            data[key] = None if found is None else found.get(attr)
+        items.append(data)
+    return items